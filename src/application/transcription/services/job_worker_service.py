@@ -0,0 +1,255 @@
+import hashlib
+import os
+import socket
+import threading
+import time
+
+from application.transcription.services.llm_markdown_service import transcription_to_markdown
+from application.transcription.services.transcription_planner import (
+    plan_transcription,
+    record_measurement,
+    record_plan,
+    strategy_key,
+)
+from application.transcription.services.transcription_service import (
+    detect_platform,
+    get_audio_transcriber,
+    save_transcription,
+    transcribe_audio,
+)
+from application.transcription.services.video_downloader_service import get_video_info
+from infrastructure.outbound.archive.adapters.local_processed_archive import LocalProcessedArchive
+from infrastructure.outbound.archive.ports.processed_archive_port import ProcessedArchivePort
+from infrastructure.outbound.file_storage.adapters.local_file_storage import (
+    LocalFileStorage,
+    OUTPUT_PATH,
+)
+from infrastructure.outbound.file_storage.ports.file_storage_port import FileStoragePort
+from infrastructure.outbound.job_queue.adapters.sqlite_job_queue import SqliteJobQueue
+from infrastructure.outbound.job_queue.ports.job_queue_port import JobQueuePort
+from infrastructure.outbound.video_downloader.adapters.video_downloader import VideoDownloader
+from infrastructure.outbound.video_downloader.ports.video_downloader_port import (
+    VideoDownloaderPort,
+)
+
+STAGES = ['metadata', 'download', 'transcribe', 'summarize']
+# Stage of the processed-items archive updated by each job stage
+ARCHIVE_STAGES = {
+    'metadata': 'metadata',
+    'download': 'transcription',
+    'transcribe': 'transcription',
+    'summarize': 'summary',
+}
+
+
+def _video_key(payload: dict) -> str:
+    return payload.get('video_id') or hashlib.sha1(payload['url'].encode()).hexdigest()[:16]
+
+
+def _next(stage: str, payload: dict) -> tuple[str, dict, str]:
+    return stage, payload, f"{stage}:{_video_key(payload)}"
+
+
+def enqueue_video(url: str, options: dict, video_id: str | None = None) -> int | None:
+    """
+    Queue a video for processing by the workers, starting with its metadata stage.
+    :param url: The URL of the video.
+    :param options: Processing options (lang, transcript_model, llm_model, enrich_text, sectioned,
+        vad, deadline, date_after).
+    :param video_id: The platform video ID, if known.
+    :return: The job ID, or None if the video is already queued.
+    """
+    queue: JobQueuePort = SqliteJobQueue()
+    stage, payload, dedupe_key = _next('metadata', {'url': url, 'video_id': video_id, **options})
+    return queue.enqueue(stage, payload, dedupe_key=dedupe_key)
+
+
+def _handle_metadata(payload: dict, archive: ProcessedArchivePort) -> list:
+    video_info = get_video_info(payload['url'])
+    video_id = payload.get('video_id') or video_info.get('id')
+    payload = {**payload, 'video_id': video_id, 'video_info': video_info}
+    title = video_info.get('title')
+    archive.mark(_video_key(payload), 'metadata', 'done', title=title)
+
+    upload_date = video_info.get('upload_date')
+    if payload.get('date_after') and upload_date and upload_date < payload['date_after']:
+        print(f"⏭️  Skipping video uploaded on {upload_date} (before {payload['date_after']})")
+        archive.mark(_video_key(payload), 'metadata', 'skipped', title=title,
+                     upload_date=upload_date)
+        return []
+
+    file_storage: FileStoragePort = LocalFileStorage()
+    # Sectioned summaries are always rebuilt from the section cache so transcript edits reach them
+    if not payload.get('sectioned') and file_storage.exists(f"summaries/{title}.md"):
+        print(f"✅ Video already fully processed: {title}")
+        archive.mark(_video_key(payload), 'summary', 'done', title=title)
+        return []
+    if file_storage.exists(f"transcriptions/{title}.txt"):
+        return [_next('summarize', payload)]
+    return [_next('download', payload)]
+
+
+def _handle_download(payload: dict, archive: ProcessedArchivePort) -> list:
+    video_downloader: VideoDownloaderPort = VideoDownloader()
+    title = payload['video_info'].get('title')
+
+    if detect_platform(payload['url']) == 'youtube':
+        text = video_downloader.download_subtitles(payload['url'], payload['lang'])
+        if text:
+            save_transcription(text, title)
+            archive.mark(_video_key(payload), 'transcription', 'done', title=title)
+            return [_next('summarize', payload)]
+
+    # Audio goes to the (shared) outputs directory so a worker on another host can transcribe it
+    audio_path = video_downloader.download_audio(
+        payload['url'], output_name=os.path.join(OUTPUT_PATH, 'audio', _video_key(payload))
+    )
+    return [_next('transcribe', {**payload, 'audio_path': audio_path})]
+
+
+def _handle_transcribe(payload: dict, archive: ProcessedArchivePort) -> list:
+    title = payload['video_info'].get('title')
+    payload_without_audio = {k: v for k, v in payload.items() if k != 'audio_path'}
+    if not os.path.exists(payload['audio_path']):
+        # A retried job whose audio is gone (removed after a commit that was lost, or by hand)
+        # would fail on every attempt: download it again instead
+        print(f"⚠️  Audio {payload['audio_path']} is missing, downloading it again")
+        return [_next('download', payload_without_audio)]
+    engine = payload['transcript_model']
+    duration = payload['video_info'].get('duration')
+    plan = None
+    model_size, parallel_chunks = 'base', 1
+    if payload.get('deadline') and duration:
+        # Captions were already tried by the download stage: only plan the model and chunking
+        plan = plan_transcription(duration, payload['deadline'], detect_platform(payload['url']),
+                                  engine=engine, exclude_captions=True)
+        model_size, parallel_chunks = plan['model_size'], plan['parallel_chunks']
+    start = time.monotonic()
+    audio_transcriber = get_audio_transcriber(engine, model_size=model_size,
+                                              parallel_chunks=parallel_chunks)
+    transcription, transcribed_seconds = transcribe_audio(
+        audio_transcriber, payload['audio_path'], payload['lang'], vad=payload.get('vad', False)
+    )
+    if plan:
+        elapsed = time.monotonic() - start
+        record_measurement(strategy_key(plan), transcribed_seconds or duration, elapsed)
+        record_plan(plan, title, elapsed)
+    save_transcription(transcription, title)
+    archive.mark(_video_key(payload), 'transcription', 'done', title=title)
+    return [_next('summarize', payload_without_audio)]
+
+
+def _cleanup_transcribe(payload: dict):
+    try:
+        os.remove(payload['audio_path'])
+    except FileNotFoundError:
+        pass
+
+
+def _handle_summarize(payload: dict, archive: ProcessedArchivePort) -> list:
+    title = payload['video_info'].get('title')
+    transcription = LocalFileStorage().read(f"transcriptions/{title}.txt")
+    transcription_to_markdown(
+        transcription,
+        model=payload['llm_model'],
+        video_info=payload['video_info'],
+        lang=payload['lang'],
+        enrich_text=payload.get('enrich_text', False),
+        sectioned=payload.get('sectioned', False)
+    )
+    archive.mark(_video_key(payload), 'summary', 'done', title=title)
+    return []
+
+
+HANDLERS = {
+    'metadata': _handle_metadata,
+    'download': _handle_download,
+    'transcribe': _handle_transcribe,
+    'summarize': _handle_summarize,
+}
+# Run once the job's completion is committed: until then a retry of the job still needs its inputs
+CLEANUPS = {
+    'transcribe': _cleanup_transcribe,
+}
+
+
+def _run_job(queue: JobQueuePort, job: dict, worker_id: str, lease_seconds: float):
+    stop = threading.Event()
+
+    def _heartbeat():
+        while not stop.wait(lease_seconds / 3):
+            if not queue.heartbeat(job['id'], worker_id, lease_seconds):
+                print(f"⚠️  Lost the lease of job {job['id']}, its result will be discarded")
+                return
+
+    heartbeat = threading.Thread(target=_heartbeat, daemon=True)
+    heartbeat.start()
+    archive: ProcessedArchivePort = LocalProcessedArchive()
+    start = time.monotonic()
+    try:
+        next_jobs = HANDLERS[job['stage']](job['payload'], archive)
+    except KeyboardInterrupt:
+        stop.set()
+        queue.fail(job['id'], worker_id, "worker interrupted", duration=time.monotonic() - start)
+        raise
+    except Exception as e:
+        stop.set()
+        print(f"\n❌ Job {job['id']} ({job['stage']}) failed on attempt {job['attempts']}: "
+              f"{str(e)[:200]}")
+        archive.mark(_video_key(job['payload']), ARCHIVE_STAGES[job['stage']], 'failed')
+        queue.fail(job['id'], worker_id, str(e)[:1000], duration=time.monotonic() - start)
+        return
+    stop.set()
+    if queue.complete(job['id'], worker_id, next_jobs, duration=time.monotonic() - start):
+        print(f"✅ Job {job['id']} ({job['stage']}) done in {time.monotonic() - start:.1f}s")
+        if job['stage'] in CLEANUPS:
+            CLEANUPS[job['stage']](job['payload'])
+    else:
+        print(f"⚠️  Job {job['id']} ({job['stage']}) finished after its lease expired, "
+              f"result discarded")
+
+
+def run_worker(worker_id: str | None = None, stages: list[str] | None = None,
+               lease_seconds: float = 300.0, once: bool = False, poll_interval: float = 5.0):
+    """
+    Claim and run stage jobs from the queue until interrupted. Start one worker per process (on any
+    host sharing the queue and outputs directory) to scale horizontally.
+    :param worker_id: Unique worker ID (defaults to <hostname>-<pid>).
+    :param stages: Stages this worker handles (defaults to all), e.g. only 'transcribe' on CPU
+        boxes.
+    :param lease_seconds: Lease duration; the worker heartbeats every third of it while a job runs.
+    :param once: Exit when the queue has no job available instead of polling.
+    :param poll_interval: Seconds to wait before polling an empty queue again.
+    """
+    queue: JobQueuePort = SqliteJobQueue()
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    print(f"👷 Worker {worker_id} started (stages: {', '.join(stages or STAGES)})")
+    while True:
+        job = queue.claim(worker_id, stages, lease_seconds)
+        if job is None:
+            if once:
+                print("✅ No more jobs available")
+                return
+            time.sleep(poll_interval)
+            continue
+        print(f"\n=== Job {job['id']}: {job['stage']} {job['payload']['url']} "
+              f"(attempt {job['attempts']}) ===")
+        _run_job(queue, job, worker_id, lease_seconds)
+
+
+def print_queue_stats():
+    """Print queue depth per stage and worker throughput."""
+    queue: JobQueuePort = SqliteJobQueue()
+    stats = queue.stats()
+    print("\n--- QUEUE ---\n")
+    for stage in STAGES:
+        counts = stats['jobs'].get(stage, {})
+        statuses = ('pending', 'leased', 'expired', 'done', 'failed')
+        print(f"{stage}: " + ', '.join(f"{status}={counts.get(status, 0)}" for status in statuses))
+    print("\n--- WORKERS ---\n")
+    for worker_id, worker in stats['workers'].items():
+        print(f"{worker_id} ({worker['host']}): {worker['completed']} done, "
+              f"{worker['failed']} failed, {worker['jobs_per_hour']} jobs/h, "
+              f"avg {worker['avg_job_seconds']}s/job, "
+              f"last seen {worker['last_seen_seconds_ago']}s ago")
+    print("\n---------------\n")
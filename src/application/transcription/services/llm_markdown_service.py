@@ -1,10 +1,42 @@
-from infrastructure.outbound.agents.ports.summarizer_agent import SummarizerAgent
-from infrastructure.outbound.agents.adapters.summarizer_lmstudio_agent import SummarizerLMStudioAgent
+import os
+
+from application.transcription.services.section_summary_service import summarize_by_sections
+from infrastructure.outbound.agents.ports.summarizer_agent import (
+    ContextWindowExceededError,
+    SummarizerAgent,
+)
+from infrastructure.outbound.agents.adapters.summarizer_lmstudio_agent import (
+    SummarizerLMStudioAgent,
+)
+from infrastructure.outbound.agents.adapters.summarizer_pool_agent import (
+    SummarizerPoolAgent,
+    load_backends,
+)
 from infrastructure.outbound.file_storage.adapters.local_file_storage import LocalFileStorage
 from infrastructure.outbound.file_storage.ports.file_storage_port import FileStoragePort
 
+# Backend pools are shared by all summaries of the process so load and circuit state carry over
+_backend_pools: dict[str, SummarizerPoolAgent] = {}
+
+
+def _get_summarizer_agent(model: str) -> SummarizerAgent:
+    """
+    Use the LLM backend pool when LLM_BACKENDS_FILE is configured, otherwise the single LM Studio
+    server.
+    :param model: The LLM model to use.
+    """
+    backends_file = os.getenv('LLM_BACKENDS_FILE')
+    if not backends_file:
+        return SummarizerLMStudioAgent(model=model)
+    if model not in _backend_pools:
+        _backend_pools[model] = SummarizerPoolAgent(
+            model=model, backends=load_backends(backends_file)
+        )
+    return _backend_pools[model]
+
 
-def transcription_to_markdown(transcription: str, model: str, video_info: dict, lang: str = 'en', enrich_text: bool = False) -> str:
+def transcription_to_markdown(transcription: str, model: str, video_info: dict, lang: str = 'en',
+                              enrich_text: bool = False, sectioned: bool = False) -> str:
     """
     Organize the transcription by topics and return a markdown string using the LLM adapter.
     :param transcription: The transcription text to be organized.
@@ -12,20 +44,44 @@ def transcription_to_markdown(transcription: str, model: str, video_info: dict,
     :param video_info: Metadata about the video, such as title and description.
     :param lang: The language code for the transcription.
     :param enrich_text: Whether to enrich the text with additional information.
+    :param sectioned: Whether to summarize section by section, reusing cached sections whose text
+        did not change. The existing summary is always rebuilt so transcript and prompt changes
+        reach it.
     """
     fileStorage: FileStoragePort = LocalFileStorage()
     file_path = f"summaries/{video_info.get('title', 'transcription_summary')}.md"
     
     # Check if markdown summary already exists
-    if fileStorage.exists(file_path):
+    if sectioned:
+        # Unchanged sections come from the section cache, only the changed ones reach the LLM
+        print("\n🧩 Rebuilding summary from the section cache...")
+    elif fileStorage.exists(file_path):
         print(f"\n📄 Found existing summary: {file_path}")
         print("✅ Loading cached summary...")
         return file_path
+    else:
+        print("\n🤖 No cached summary found. Generating new summary...")
     
-    print("\n🤖 No cached summary found. Generating new summary...")
-    
-    summarizerAgent: SummarizerAgent = SummarizerLMStudioAgent(model=model)
+    summarizerAgent: SummarizerAgent = _get_summarizer_agent(model)
+
+    if sectioned:
+        markdown, _ = summarize_by_sections(
+            summarizerAgent, transcription, model=model, video_info=video_info, lang=lang,
+            enrich_text=enrich_text
+        )
+    else:
+        try:
+            markdown = summarizerAgent.organize_transcription(
+                transcription, video_info=video_info, lang=lang, enrich_text=enrich_text
+            )
+        except ContextWindowExceededError as e:
+            print(f"⚠️  {e}. Falling back to section-by-section summarization...")
+            markdown, _ = summarize_by_sections(
+                summarizerAgent, transcription, model=model, video_info=video_info, lang=lang,
+                enrich_text=enrich_text
+            )
 
-    markdown = summarizerAgent.organize_transcription(transcription, video_info=video_info, lang=lang, enrich_text=enrich_text)
+    if isinstance(summarizerAgent, SummarizerPoolAgent):
+        summarizerAgent.print_stats()
     
     return fileStorage.save(data=markdown, file_path=file_path) 
@@ -0,0 +1,205 @@
+import hashlib
+import re
+import zlib
+
+from infrastructure.outbound.agents.ports.summarizer_agent import SummarizerAgent
+from infrastructure.outbound.file_storage.adapters.local_file_storage import LocalFileStorage
+from infrastructure.outbound.file_storage.ports.file_storage_port import FileStoragePort
+from infrastructure.outbound.metrics.adapters.local_metrics_store import LocalMetricsStore
+from infrastructure.outbound.metrics.ports.metrics_store_port import MetricsStorePort
+
+# Section boundaries: a section closes after MIN_SECTION_CHARS on a line whose hash matches the
+# boundary mask, or at MAX_SECTION_CHARS. Boundaries depend on the lines themselves and not on
+# absolute offsets, so an edit in one part of the transcript only changes the sections around it.
+MIN_SECTION_CHARS = 6000
+MAX_SECTION_CHARS = 16000
+BOUNDARY_MASK = 0x1F
+
+SYSTEM_PROMPT = """You are a professional teacher and researcher creating COMPREHENSIVE, DETAILED
+courses and guidelines.
+You never skip details from the source material and you are an expert in Markdown formatting.
+Do not ask for further information or questions.
+Do not use an introduction like "Here is the organized transcription" or a conclusion like
+"I hope this helps".
+"""
+
+# Appended to the system prompt with enrich_text, as in the summarizer agents
+ENRICH_PROMPT = """You are also an expert in finding information on the internet, so you enrich the
+text with additional information, using well-known sources and providing references and links to
+those sources.
+"""
+
+# The part's position is not in the prompt: an insertion that adds a section would otherwise change
+# the prompt, and so the cache key, of every section
+SECTION_PROMPT = """
+Main objective: Turn this part of a transcription into the corresponding sections of a
+COMPREHENSIVE, DETAILED course document.
+
+Instructions:
+* Use ## headings for each topic covered in this part and ### headings for its subtopics.
+* For each topic include: explanation, examples, code snippets or commands (in code blocks), use
+  cases, tips and best practices.
+* Don't skip any information from the transcription - be exhaustive.
+* Do NOT write a document title, summary, index or conclusion: other parts of the document already
+  have them.
+* Do not mention that the content comes from a video.
+* The output MUST be in {lang} language, even if the transcription is in another language.
+
+Video title: {title}
+
+Transcription part:
+{section}
+"""
+
+SUMMARY_PROMPT = """
+Main objective: Write the Summary section of a course document from the outline of its sections
+below.
+
+Instructions:
+* Start with a ## heading meaning "Summary" in {lang} language.
+* Comprehensive overview covering all major themes (minimum 10 lines).
+* End with: Source: [Youtube Link]({webpage_url})
+* The output MUST be in {lang} language. Output only the section.
+
+Video title: {title}
+
+Document sections:
+{outline}
+"""
+
+CONCLUSION_PROMPT = """
+Main objective: Write the closing sections of a course document from the outline of its sections
+below.
+
+Instructions:
+* A ## heading meaning "Conclusion" in {lang} language with a thorough wrap-up of the key learnings.
+* A ## heading meaning "Additional Notes" in {lang} language with any extra relevant information.
+* The output MUST be in {lang} language. Output only these sections.
+
+Video title: {title}
+
+Document sections:
+{outline}
+"""
+
+# Shown in the logs; the cache key hashes the rendered prompts themselves
+PROMPT_VERSION = hashlib.sha256(
+    (SYSTEM_PROMPT + ENRICH_PROMPT + SECTION_PROMPT + SUMMARY_PROMPT + CONCLUSION_PROMPT).encode()
+).hexdigest()[:12]
+
+CACHE_DIR = "cache/sections"
+OUTLINE_CHARS_PER_SECTION = 1500
+
+
+def split_sections(transcription: str) -> list[str]:
+    """
+    Split a transcription into content-defined sections of whole lines.
+    :param transcription: The transcription text.
+    :return: The list of sections.
+    """
+    sections = []
+    current: list[str] = []
+    size = 0
+    lines = []
+    for line in transcription.splitlines():
+        # Some engines return the whole transcript as one line: fall back to sentences
+        if len(line) > MIN_SECTION_CHARS:
+            lines.extend(re.split(r'(?<=[.!?])\s+', line))
+        else:
+            lines.append(line)
+    for line in lines:
+        current.append(line)
+        size += len(line) + 1
+        at_boundary = (zlib.crc32(line.strip().encode()) & BOUNDARY_MASK) == 0
+        if size >= MAX_SECTION_CHARS or (size >= MIN_SECTION_CHARS and at_boundary):
+            sections.append('\n'.join(current))
+            current, size = [], 0
+    if current:
+        sections.append('\n'.join(current))
+    return sections
+
+
+def _cache_key(model: str, system_prompt: str, prompt: str) -> str:
+    return hashlib.sha256(f"{model}\n{system_prompt}\n{prompt}".encode()).hexdigest()
+
+
+def _cached_generate(agent: SummarizerAgent, system_prompt: str, prompt: str, model: str,
+                     report: dict) -> str:
+    """
+    Return the cached LLM output for this exact model and prompts; generate on a miss. Every input
+    of the prompts (text, title, language, enrichment, template) is part of the key.
+    """
+    file_storage: FileStoragePort = LocalFileStorage()
+    cache_path = f"{CACHE_DIR}/{_cache_key(model, system_prompt, prompt)}.md"
+    if file_storage.exists(cache_path):
+        report['reused'] += 1
+        return file_storage.read(cache_path)
+    report['regenerated'] += 1
+    text = agent.generate(system_prompt, prompt).strip()
+    file_storage.save(data=text, file_path=cache_path)
+    return text
+
+
+def _build_index(sections_markdown: list[str]) -> str:
+    entries = []
+    for markdown in sections_markdown:
+        for line in markdown.splitlines():
+            match = re.match(r'^(#{2,3})\s+(.*)', line)
+            if match:
+                indent = '  ' * (len(match.group(1)) - 2)
+                entries.append(f"{indent}- {match.group(2).strip()}")
+    return "## 📑 Index\n\n" + '\n'.join(entries)
+
+
+def summarize_by_sections(agent: SummarizerAgent, transcription: str, model: str, video_info: dict,
+                          lang: str, enrich_text: bool = False) -> tuple[str, dict]:
+    """
+    Summarize a transcription section by section, reusing the cached output of every section whose
+    prompt (text, title, language, enrichment) and model did not change, then reassemble the full
+    document.
+    :param agent: The summarizer agent.
+    :param transcription: The transcription text.
+    :param model: The LLM model (part of the cache key).
+    :param video_info: Metadata about the video, such as title and webpage_url.
+    :param lang: The language code of the summary.
+    :param enrich_text: Whether to enrich the text with additional information.
+    :return: The markdown document and a report with the number of 'reused' and 'regenerated'
+        sections.
+    """
+    title = video_info.get('title', 'Transcription') if video_info else 'Transcription'
+    webpage_url = video_info.get('webpage_url', '') if video_info else ''
+    system_prompt = SYSTEM_PROMPT + (ENRICH_PROMPT if enrich_text else '')
+    sections = split_sections(transcription)
+    report = {'sections': len(sections), 'reused': 0, 'regenerated': 0}
+    print(f"🧩 Summarizing {len(sections)} sections (prompt version {PROMPT_VERSION})...")
+
+    sections_markdown = []
+    for i, section in enumerate(sections, start=1):
+        prompt = SECTION_PROMPT.format(lang=lang, title=title, section=section)
+        sections_markdown.append(_cached_generate(agent, system_prompt, prompt, model, report))
+        print(f"   [{i}/{len(sections)}] done")
+
+    # Summary and conclusion are written from an outline of the sections, so they are reused as long
+    # as no section changed
+    outline = '\n\n'.join(markdown[:OUTLINE_CHARS_PER_SECTION] for markdown in sections_markdown)
+    summary = _cached_generate(
+        agent, system_prompt,
+        SUMMARY_PROMPT.format(lang=lang, title=title, webpage_url=webpage_url, outline=outline),
+        model, report
+    )
+    conclusion = _cached_generate(
+        agent, system_prompt, CONCLUSION_PROMPT.format(lang=lang, title=title, outline=outline),
+        model, report
+    )
+
+    markdown = '\n\n'.join([
+        f"# {title}", summary, _build_index(sections_markdown), *sections_markdown, conclusion
+    ]) + '\n'
+
+    metrics: MetricsStorePort = LocalMetricsStore()
+    metrics.increment('section_cache', {
+        'documents': 1, 'reused': report['reused'], 'regenerated': report['regenerated']
+    })
+    print(f"♻️  Sections reused: {report['reused']}, regenerated: {report['regenerated']} "
+          f"({report['sections']} transcript sections + summary and conclusion)")
+    return markdown, report
@@ -0,0 +1,27 @@
+from infrastructure.outbound.archive.adapters.local_processed_archive import LocalProcessedArchive
+from infrastructure.outbound.archive.ports.processed_archive_port import ProcessedArchivePort
+from infrastructure.outbound.video_downloader.adapters.video_downloader import VideoDownloader
+from infrastructure.outbound.video_downloader.ports.video_downloader_port import VideoDownloaderPort
+
+def get_pending_entries(url: str, limit: int | None = None,
+                        date_after: str | None = None) -> list[dict]:
+    """
+    List a playlist or channel and return only the entries that are new or failed in the
+    processed-items archive.
+    A sync where nothing changed costs a single listing request.
+    :param url: The URL of the playlist or channel.
+    :param limit: Maximum number of entries to list.
+    :param date_after: Only keep entries uploaded on or after this date (YYYYMMDD).
+    """
+    video_downloader: VideoDownloaderPort = VideoDownloader()
+    archive: ProcessedArchivePort = LocalProcessedArchive()
+
+    print("\n📋 Listing playlist/channel entries...")
+    entries = video_downloader.list_entries(url, limit=limit, date_after=date_after)
+    pending = [
+        entry for entry in entries if archive.needs_processing(entry['id'], date_after=date_after)
+    ]
+
+    print(f"   Found {len(entries)} entries: {len(pending)} new or failed, "
+          f"{len(entries) - len(pending)} already processed")
+    return pending
@@ -0,0 +1,156 @@
+import os
+from datetime import datetime, timezone
+
+from infrastructure.outbound.metrics.adapters.local_metrics_store import LocalMetricsStore
+from infrastructure.outbound.metrics.ports.metrics_store_port import MetricsStorePort
+
+# Real-time factors (processing seconds per audio second on one CPU, int8) used until runs are
+# measured
+DEFAULT_RTF = {
+    'faster-whisper:tiny': 0.04,
+    'faster-whisper:base': 0.08,
+    'faster-whisper:small': 0.25,
+    'faster-whisper:medium': 0.6,
+    'openai-whisper:tiny': 0.1,
+    'openai-whisper:base': 0.2,
+    'openai-whisper:small': 0.6,
+    'openai-whisper:medium': 1.5,
+    'download': 0.02,
+}
+# Fixed estimate for fetching captions, which does not depend on the video duration
+CAPTIONS_SECONDS = 10.0
+# Chunked decoding does not scale linearly: chunks compete for memory bandwidth and the model is
+# shared
+PARALLEL_EFFICIENCY = 0.7
+
+RTF_METRICS = 'transcription_rtf'
+PLAN_LOG = 'transcription_plans'
+
+
+def _rtf(key: str, metrics: dict) -> float:
+    """Measured real-time factor of past runs, or the default estimate."""
+    audio_seconds = metrics.get(f"{key}.audio_seconds", 0)
+    if audio_seconds:
+        return metrics.get(f"{key}.elapsed_seconds", 0) / audio_seconds
+    return DEFAULT_RTF.get(key, DEFAULT_RTF['faster-whisper:base'])
+
+
+def _strategy_key(engine: str, model_size: str, parallel_chunks: int = 1) -> str:
+    key = f"{engine}:{model_size}"
+    return f"{key}:x{parallel_chunks}" if parallel_chunks > 1 else key
+
+
+def plan_transcription(duration: float, deadline_seconds: float, platform: str,
+                       engine: str = 'faster-whisper', cores: int | None = None,
+                       exclude_captions: bool = False) -> dict:
+    """
+    Pick the cheapest transcription strategy predicted to finish within the deadline, in order:
+    captions, then single-process models from smallest to largest (PLANNER_MODELS), then chunked
+    parallel decoding. If none fits, the fastest strategy is chosen.
+    :param duration: Video duration in seconds.
+    :param deadline_seconds: Target time to have the transcription, in seconds.
+    :param platform: The video platform (captions are only available on YouTube).
+    :param engine: The transcription engine ('faster-whisper' or 'openai-whisper').
+    :param cores: Available CPU cores (defaults to os.cpu_count()).
+    :param exclude_captions: Skip the captions strategy (e.g. when the video has none).
+    :return: The plan: {'strategy', 'engine', 'model_size', 'parallel_chunks', 'predicted_seconds',
+        'candidates', ...}
+    """
+    cores = cores or os.cpu_count() or 1
+    metrics = LocalMetricsStore().read(RTF_METRICS)
+    planner_models = os.getenv('PLANNER_MODELS', 'tiny,base,small')
+    model_sizes = [size.strip() for size in planner_models.split(',') if size.strip()]
+    download_seconds = duration * _rtf('download', metrics)
+
+    candidates = []
+    if platform == 'youtube' and not exclude_captions:
+        candidates.append({'strategy': 'captions', 'engine': None, 'model_size': None,
+                           'parallel_chunks': 1, 'predicted_seconds': CAPTIONS_SECONDS})
+    for size in model_sizes:
+        rtf = _rtf(_strategy_key(engine, size), metrics)
+        candidates.append({'strategy': 'model', 'engine': engine, 'model_size': size,
+                           'parallel_chunks': 1,
+                           'predicted_seconds': download_seconds + duration * rtf})
+    # Only faster-whisper can decode chunks concurrently with a shared model
+    chunks = cores // 2
+    if engine == 'faster-whisper' and chunks >= 2:
+        for size in model_sizes:
+            key = _strategy_key(engine, size, chunks)
+            measured = metrics.get(f"{key}.audio_seconds")
+            if measured:
+                rtf = _rtf(key, metrics)
+            else:
+                rtf = _rtf(_strategy_key(engine, size), metrics) / (chunks * PARALLEL_EFFICIENCY)
+            candidates.append({'strategy': 'chunked', 'engine': engine, 'model_size': size,
+                               'parallel_chunks': chunks,
+                               'predicted_seconds': download_seconds + duration * rtf})
+
+    for candidate in candidates:
+        candidate['predicted_seconds'] = round(candidate['predicted_seconds'], 1)
+    chosen = next((c for c in candidates if c['predicted_seconds'] <= deadline_seconds), None)
+    meets_deadline = chosen is not None
+    if chosen is None:
+        chosen = min(candidates, key=lambda c: c['predicted_seconds'])
+
+    label = chosen['strategy'] if chosen['strategy'] == 'captions' else strategy_key(chosen)
+    if meets_deadline:
+        print(f"🗓️  Plan: {label} (predicted {chosen['predicted_seconds']}s, "
+              f"deadline {deadline_seconds:.0f}s, {cores} cores)")
+    else:
+        print(f"⚠️  No strategy meets the {deadline_seconds:.0f}s deadline, using the fastest: "
+              f"{label} (predicted {chosen['predicted_seconds']}s)")
+
+    return {
+        **chosen,
+        'meets_deadline': meets_deadline,
+        'deadline_seconds': deadline_seconds,
+        'duration': duration,
+        'cores': cores,
+        'candidates': [
+            {'strategy': c['strategy'], 'model_size': c['model_size'],
+             'parallel_chunks': c['parallel_chunks'], 'predicted_seconds': c['predicted_seconds']}
+            for c in candidates
+        ],
+    }
+
+
+def record_measurement(key: str, audio_seconds: float, elapsed_seconds: float):
+    """
+    Accumulate a measured run so future plans use the real-time factor of this machine.
+    :param key: 'download' or the strategy key (e.g. 'faster-whisper:base' or
+        'faster-whisper:base:x4').
+    :param audio_seconds: Duration of the processed audio.
+    :param elapsed_seconds: Time spent processing it.
+    """
+    if audio_seconds <= 0:
+        return
+    metrics: MetricsStorePort = LocalMetricsStore()
+    metrics.increment(RTF_METRICS, {
+        f"{key}.audio_seconds": audio_seconds,
+        f"{key}.elapsed_seconds": round(elapsed_seconds, 3),
+    })
+
+
+def record_plan(plan: dict, video_name: str | None, actual_seconds: float):
+    """
+    Log a plan with its predicted and actual time to outputs/metrics/transcription_plans.jsonl for
+    auditing.
+    :param plan: The executed plan.
+    :param video_name: The video title.
+    :param actual_seconds: Time actually spent.
+    """
+    metrics: MetricsStorePort = LocalMetricsStore()
+    metrics.append(PLAN_LOG, {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'video': video_name,
+        **plan,
+        'actual_seconds': round(actual_seconds, 1),
+        'met_deadline': actual_seconds <= plan['deadline_seconds'],
+    })
+    print(f"⏱️  Transcription took {actual_seconds:.1f}s "
+          f"(predicted {plan['predicted_seconds']}s, deadline {plan['deadline_seconds']:.0f}s)")
+
+
+def strategy_key(plan: dict) -> str:
+    """Key of the measured real-time factor for a plan."""
+    return _strategy_key(plan['engine'], plan['model_size'], plan['parallel_chunks'])
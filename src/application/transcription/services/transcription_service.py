@@ -1,40 +1,170 @@
+import time
+
+from application.transcription.services.transcription_planner import (
+    plan_transcription,
+    record_measurement,
+    record_plan,
+    strategy_key,
+)
+from infrastructure.outbound.audio_preprocessor.adapters.silero_vad_audio_preprocessor import (
+    SileroVadAudioPreprocessor,
+)
+from infrastructure.outbound.audio_preprocessor.ports.audio_preprocessor_port import (
+    AudioPreprocessorPort,
+)
 from infrastructure.outbound.file_storage.adapters.local_file_storage import LocalFileStorage
 from infrastructure.outbound.file_storage.ports.file_storage_port import FileStoragePort
+from infrastructure.outbound.metrics.adapters.local_metrics_store import LocalMetricsStore
+from infrastructure.outbound.metrics.ports.metrics_store_port import MetricsStorePort
 from infrastructure.outbound.transcriber.ports.audio_transcriber_port import AudioTranscriberPort
 from infrastructure.outbound.video_downloader.adapters.video_downloader import VideoDownloader
 from infrastructure.outbound.video_downloader.ports.video_downloader_port import VideoDownloaderPort
 
-def transcribe(url: str, video_name: str | None, audo_transcriber_model: str = 'faster-whisper', lang: str = 'en'):
+def detect_platform(url: str) -> str:
+    """
+    Detect the video platform of a URL.
+    :param url: The URL of the video.
+    """
+    if 'youtu.be' in url:
+        return 'youtube'
+    elif 'tiktok' in url:
+        return 'tiktok'
+    elif 'instagram' in url:
+        return 'instagram'
+    else:
+        # Get main domain from URL and use it as platform name
+        return url.split('//')[-1].split('/')[0].split('?')[0]
+
+def get_audio_transcriber(audo_transcriber_model: str, model_size: str = 'base',
+                          parallel_chunks: int = 1) -> AudioTranscriberPort:
+    """
+    Get the audio transcriber adapter for a transcription model.
+    :param audo_transcriber_model: The transcription model to use ('faster-whisper' or 'openai-whisper').
+    :param model_size: The Whisper model size ('tiny', 'base', 'small', ...).
+    :param parallel_chunks: Number of audio chunks decoded in parallel (faster-whisper only).
+    """
+    if audo_transcriber_model == 'openai-whisper':
+        from infrastructure.outbound.transcriber.adapters.openai_whisper_audio_transcriber import OpenAiWhisperAudioTranscriberAdapter
+        return OpenAiWhisperAudioTranscriberAdapter(model_size=model_size)
+    else:
+        from infrastructure.outbound.transcriber.adapters.faster_whisper_audio_transcriber import FasterWhisperAudioTranscriber
+        return FasterWhisperAudioTranscriber(model_size=model_size, parallel_chunks=parallel_chunks)
+
+def save_transcription(transcription: str, video_name: str | None) -> str:
+    """
+    Save a transcription to transcriptions/<video_name>.txt and return the file path.
+    :param transcription: The transcription text.
+    :param video_name: The video title used as file name.
+    """
+    file_storage: FileStoragePort = LocalFileStorage()
+    transcription_file_name: str = video_name if video_name else 'transcription_summary'
+    return file_storage.save(data=transcription,
+                             file_path=f"transcriptions/{transcription_file_name}.txt")
+
+def transcribe_audio(audio_transcriber: AudioTranscriberPort, audio_path: str, lang: str,
+                     vad: bool = False) -> tuple[str, float | None]:
+    """
+    Transcribe a downloaded audio file, optionally cutting silence, music and long pauses first
+    (VAD).
+    Segment timestamps of the speech-only audio are mapped back to the original timeline for the
+    console log only: the returned (and saved) transcription is plain text without timestamps.
+    :param audio_transcriber: The audio transcriber.
+    :param audio_path: The path to the audio file.
+    :param lang: The language code for the transcription.
+    :param vad: Whether to trim non-speech regions before transcribing.
+    :return: The transcription text and the seconds of audio transcribed (None when the whole
+        file was).
+    """
+    if not vad:
+        transcription = audio_transcriber.transcribe(audio_path, lang)
+        # Handle both string and list responses from transcriber
+        if isinstance(transcription, list):
+            return '\n'.join(str(segment) for segment in transcription), None
+        return transcription, None
+
+    print("🔇 Detecting speech...")
+    preprocessor: AudioPreprocessorPort = SileroVadAudioPreprocessor()
+    start = time.monotonic()
+    speech = preprocessor.trim_silence(audio_path)
+    vad_seconds = time.monotonic() - start
+    if not speech.chunks:
+        print("⚠️  No speech detected, transcribing the full audio...")
+        return transcribe_audio(audio_transcriber, audio_path, lang)
+
+    removed_percent = (
+        100 * speech.removed_seconds / speech.original_seconds if speech.original_seconds else 0
+    )
+    print(f"🔇 Removed {speech.removed_seconds:.0f}s of non-speech audio "
+          f"({removed_percent:.0f}% of {speech.original_seconds:.0f}s) in {vad_seconds:.1f}s")
+    metrics: MetricsStorePort = LocalMetricsStore()
+    metrics.increment('vad', {
+        'files': 1,
+        'original_seconds': round(speech.original_seconds, 1),
+        'removed_seconds': round(speech.removed_seconds, 1),
+        'vad_seconds': round(vad_seconds, 2),
+    })
+
+    segments = []
+    for segment in audio_transcriber.transcribe_samples(speech.samples, lang):
+        minutes, seconds = divmod(int(speech.to_original(segment['start'])), 60)
+        print(f"[{minutes:02d}:{seconds:02d}] {segment['text'].strip()}")
+        segments.append(segment['text'])
+    return '\n'.join(segments), speech.speech_seconds
+
+def _transcribe_with_plan(url: str, video_name: str | None, engine: str, lang: str, platform: str,
+                          duration: float, deadline: float, vad: bool = False) -> str:
+    """
+    Transcribe with the cheapest strategy predicted to meet the deadline and record predicted vs
+    actual time.
+    """
+    video_downloader: VideoDownloaderPort = VideoDownloader()
+    start = time.monotonic()
+    plan = plan_transcription(duration, deadline, platform, engine=engine)
+
+    if plan['strategy'] == 'captions':
+        text = video_downloader.download_subtitles(url, lang)
+        if text:
+            record_plan(plan, video_name, time.monotonic() - start)
+            save_transcription(text, video_name)
+            return text
+        # No captions: re-plan the remaining time without them
+        remaining = deadline - (time.monotonic() - start)
+        plan = plan_transcription(duration, remaining, platform, engine=engine,
+                                  exclude_captions=True)
+        plan['deadline_seconds'] = deadline
+
+    download_start = time.monotonic()
+    audio_path = video_downloader.download_audio(url)
+    record_measurement('download', duration, time.monotonic() - download_start)
+
+    transcribe_start = time.monotonic()
+    audio_transcriber = get_audio_transcriber(engine, model_size=plan['model_size'],
+                                              parallel_chunks=plan['parallel_chunks'])
+    transcription_text, transcribed_seconds = transcribe_audio(audio_transcriber, audio_path, lang,
+                                                               vad=vad)
+    # With VAD only the speech was transcribed: measure the real-time factor on it
+    record_measurement(strategy_key(plan), transcribed_seconds or duration,
+                       time.monotonic() - transcribe_start)
+    record_plan(plan, video_name, time.monotonic() - start)
+
+    save_transcription(transcription_text, video_name)
+    return transcription_text
+
+def transcribe(url: str, video_name: str | None, audo_transcriber_model: str = 'faster-whisper',
+               lang: str = 'en', stream: bool = False, deadline: float | None = None,
+               duration: float | None = None, vad: bool = False):
     """
     Get the transcript of a video from YouTube, TikTok, or Instagram.
     :param url: The URL of the video to transcribe.
     :param model_choice: The transcription model to use ('faster-whisper' or 'openai-whisper').
     :param lang: The language code for the transcription.
+    :param stream: Whether to transcribe the audio while it downloads instead of waiting for the
+        full file.
+    :param deadline: Target transcription time in seconds. When set, a planner picks captions, the
+        model size and chunked decoding instead of the fixed 'base' model.
+    :param duration: Video duration in seconds (required by the planner).
+    :param vad: Whether to cut non-speech regions of the downloaded audio before transcribing it.
     """
-    def _detect_platform(url: str):
-        if 'youtu.be' in url:
-            return 'youtube'
-        elif 'tiktok' in url:
-            return 'tiktok'
-        elif 'instagram' in url:
-            return 'instagram'
-        else:
-            # Get main domain from URL and use it as platform name
-            return url.split('//')[-1].split('/')[0].split('?')[0]
-    
-    def _getAudioTranscriber(audo_transcriber_model: str):
-        if audo_transcriber_model == 'openai-whisper':
-            from infrastructure.outbound.transcriber.adapters.openai_whisper_audio_transcriber import OpenAiWhisperAudioTranscriberAdapter
-            return OpenAiWhisperAudioTranscriberAdapter()
-        else:
-            from infrastructure.outbound.transcriber.adapters.faster_whisper_audio_transcriber import FasterWhisperAudioTranscriber
-            return FasterWhisperAudioTranscriber()
-    
-    def _saveTranscription(transcription: str) -> str:
-        file_storage: FileStoragePort = LocalFileStorage()
-        transcription_file_name: str = video_name if video_name else 'transcription_summary'
-        return file_storage.save(data=transcription, file_path=f"transcriptions/{transcription_file_name}.txt")
-    
     def _checkExistingTranscription(video_name: str | None) -> str | None:
         """Check if a transcription already exists for this video."""
         if not video_name:
@@ -55,25 +185,36 @@ def transcribe(url: str, video_name: str | None, audo_transcriber_model: str = '
     print("\n🎬 No cached transcription found. Processing video...")
     video_downloader: VideoDownloaderPort = VideoDownloader()
 
-    platform = _detect_platform(url)
+    platform = detect_platform(url)
     print(f"Detected platform: {platform}")
 
+    if deadline and not stream:
+        if duration:
+            return _transcribe_with_plan(url, video_name, audo_transcriber_model, lang, platform,
+                                         duration, deadline, vad=vad)
+        print("⚠️  Unknown video duration, cannot plan for the deadline. "
+              "Using the default strategy...")
+
     if platform == 'youtube':
         text = video_downloader.download_subtitles(url, lang)
         if text:
-            _saveTranscription(text)
+            save_transcription(text, video_name)
             return text
 
-    audio_path = video_downloader.download_audio(url)
+    audio_transcriber: AudioTranscriberPort = get_audio_transcriber(audo_transcriber_model)
 
-    audio_transcriber: AudioTranscriberPort = _getAudioTranscriber(audo_transcriber_model)
-    transcription = audio_transcriber.transcribe(audio_path, lang)
-    
-    # Handle both string and list responses from transcriber
-    if isinstance(transcription, list):
-        transcription_text = '\n'.join(str(segment) for segment in transcription)
-    else:
-        transcription_text = transcription
-    
-    _saveTranscription(transcription_text)
+    if stream:
+        windows = video_downloader.stream_audio(url)
+        segments = []
+        for segment in audio_transcriber.transcribe_stream(windows, lang):
+            minutes, seconds = divmod(int(segment['start']), 60)
+            print(f"[{minutes:02d}:{seconds:02d}] {segment['text'].strip()}")
+            segments.append(segment['text'])
+        transcription_text = '\n'.join(segments)
+        save_transcription(transcription_text, video_name)
+        return transcription_text
+
+    audio_path = video_downloader.download_audio(url)
+    transcription_text, _ = transcribe_audio(audio_transcriber, audio_path, lang, vad=vad)
+    save_transcription(transcription_text, video_name)
     return transcription_text
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Benchmark silence trimming (VAD): audio removed and transcription speed-up on local audio fixtures.
+"""
+
+import argparse
+import glob
+import os
+import time
+
+import numpy as np
+from dotenv import load_dotenv
+
+from application.transcription.services.transcription_service import get_audio_transcriber
+from infrastructure.outbound.audio_preprocessor.adapters.silero_vad_audio_preprocessor import (
+    SileroVadAudioPreprocessor,
+)
+from infrastructure.outbound.audio_preprocessor.ports.audio_preprocessor_port import (
+    AudioPreprocessorPort,
+)
+from infrastructure.outbound.transcriber.ports.audio_transcriber_port import SAMPLE_RATE
+
+load_dotenv()
+
+parser = argparse.ArgumentParser(
+    description="Compare full-audio and speech-only (VAD) transcription."
+)
+parser.add_argument("fixtures", nargs="*",
+                    help="Audio files (default: every file in fixtures/audio/)")
+parser.add_argument("-tm", "--transcript-model", choices=["faster-whisper", "openai-whisper"],
+                    default="faster-whisper")
+parser.add_argument("--model-size", default="base", help="Whisper model size (default: base)")
+args = parser.parse_args()
+
+fixtures = args.fixtures or sorted(glob.glob("fixtures/audio/*"))
+if not fixtures:
+    parser.error("no fixtures given and fixtures/audio/ is empty "
+                 "(use lectures or podcasts with pauses, intros and music)")
+
+transcriber = get_audio_transcriber(args.transcript_model, model_size=args.model_size)
+preprocessor: AudioPreprocessorPort = SileroVadAudioPreprocessor()
+
+
+def run_full(fixture: str) -> dict:
+    start = time.monotonic()
+    text = transcriber.transcribe(fixture, None)
+    return {'full': time.monotonic() - start, 'full_words': len(text.split())}
+
+
+def run_trimmed(fixture: str) -> dict:
+    start = time.monotonic()
+    speech = preprocessor.trim_silence(fixture)
+    vad_seconds = time.monotonic() - start
+    segments = transcriber.transcribe_samples(speech.samples, None) if speech.chunks else []
+    return {
+        'audio': speech.original_seconds,
+        'removed': speech.removed_seconds,
+        'vad': vad_seconds,
+        'trimmed': time.monotonic() - start,
+        'trimmed_words': sum(len(segment['text'].split()) for segment in segments),
+    }
+
+
+print(f"🧪 Benchmarking VAD with {args.transcript_model} ({args.model_size}) "
+      f"on {len(fixtures)} fixtures...\n")
+# Untimed warm-up: the first run pays the model download, library imports and cold disk caches,
+# which would otherwise be charged to whichever path runs first
+print("🔥 Warming up the VAD and Whisper models...")
+transcriber.transcribe_samples(np.zeros(SAMPLE_RATE, dtype=np.float32), None)
+preprocessor.trim_silence(fixtures[0])
+
+results = []
+for index, fixture in enumerate(fixtures):
+    # Alternate which path runs first so caches warmed by one run do not always favour the other
+    full_first = index % 2 == 0
+    print(f"📄 {fixture} ({'full' if full_first else 'trimmed'} audio first)")
+    if full_first:
+        result = run_full(fixture)
+        result.update(run_trimmed(fixture))
+    else:
+        result = run_trimmed(fixture)
+        result.update(run_full(fixture))
+    # Large word count differences mean speech was cut: lower VAD_THRESHOLD or raise
+    # VAD_SPEECH_PAD_MS
+    results.append({'fixture': os.path.basename(fixture), **result})
+
+print("\n--- RESULTS ---\n")
+print(f"{'fixture':<40} {'audio':>8} {'removed':>14} {'full':>8} {'vad+asr':>14} "
+      f"{'speed-up':>9} {'words':>13}")
+for r in results:
+    removed_percent = 100 * r['removed'] / r['audio'] if r['audio'] else 0
+    print(f"{r['fixture'][:40]:<40} {r['audio']:>7.0f}s {r['removed']:>6.0f}s "
+          f"({removed_percent:>3.0f}%) {r['full']:>7.1f}s {r['trimmed']:>6.1f}s "
+          f"({r['vad']:>4.1f}s) {r['full'] / r['trimmed']:>8.2f}x "
+          f"{r['full_words']:>6}/{r['trimmed_words']:<6}")
+
+total_audio = sum(r['audio'] for r in results)
+total_removed = sum(r['removed'] for r in results)
+total_full = sum(r['full'] for r in results)
+total_trimmed = sum(r['trimmed'] for r in results)
+removed_percent = 100 * total_removed / total_audio if total_audio else 0
+print(f"\n✅ Removed {total_removed:.0f}s of {total_audio:.0f}s ({removed_percent:.0f}%), "
+      f"transcription {total_full:.1f}s → {total_trimmed:.1f}s "
+      f"({total_full / total_trimmed:.2f}x speed-up)")
@@ -4,7 +4,7 @@ from infrastructure.inbound.console.ports.user_input_port import UserInputPort
 class ConsoleUserInputAdapter(UserInputPort):
     def get_user_input(self) -> argparse.Namespace:
         parser = argparse.ArgumentParser(description="Transcribe YouTube, TikTok or Instagram video using Whisper.")
-        parser.add_argument("url", help="Video URL")
+        parser.add_argument("url", help="Video URL (or playlist/channel URL with --sync)")
         parser.add_argument("-tm", "--transcript-model", choices=["faster-whisper", "openai-whisper"],
                             default="faster-whisper", help="Choose transcription model (default: faster-whisper)")
         parser.add_argument("-l", "--lang", default="en", help="Language code (default: en)")
@@ -13,4 +13,38 @@ class ConsoleUserInputAdapter(UserInputPort):
             "-e", "--enrich-text", action="store_true",
             help="Enrich the summary by searching for additional information on the internet (experimental)"
         )
-        return parser.parse_args()
+        parser.add_argument(
+            "--deadline", type=float, default=None,
+            help="Target transcription time in seconds: pick captions, model size and parallel "
+                 "decoding to meet it"
+        )
+        parser.add_argument(
+            "--vad", action="store_true",
+            help="Cut silence, music and long pauses from the downloaded audio before "
+                 "transcribing it (not with --stream)"
+        )
+        parser.add_argument(
+            "--sectioned", action="store_true",
+            help="Summarize section by section and reuse cached sections whose transcript text did not change"
+        )
+        parser.add_argument(
+            "--stream", action="store_true",
+            help="Transcribe the audio while it downloads (overlaps download and transcription; "
+                 "not with --deadline or --vad)"
+        )
+        parser.add_argument(
+            "-s", "--sync", action="store_true",
+            help="Treat the URL as a playlist or channel and process only new or failed videos"
+        )
+        parser.add_argument(
+            "--enqueue", action="store_true",
+            help="Queue the video(s) for the workers (python src/worker.py) instead of processing "
+                 "them here"
+        )
+        parser.add_argument("--limit", type=int, default=None, help="Maximum number of playlist/channel entries to sync")
+        parser.add_argument("--date-after", default=None, help="Only sync videos uploaded on or after this date (YYYYMMDD)")
+        args = parser.parse_args()
+        # Streamed transcription has no whole file to trim or to plan for: never ignore them silently
+        if args.stream and (args.deadline is not None or args.vad):
+            parser.error("--stream cannot be combined with --deadline or --vad")
+        return args
@@ -0,0 +1,24 @@
+import argparse
+import os
+from infrastructure.inbound.console.ports.user_input_port import UserInputPort
+
+class ConsoleWorkerInputAdapter(UserInputPort):
+    def get_user_input(self) -> argparse.Namespace:
+        parser = argparse.ArgumentParser(
+            description="Run a queue worker that processes video stage jobs "
+                        "(metadata, download, transcribe, summarize)."
+        )
+        parser.add_argument("--worker-id", default=None,
+                            help="Unique worker ID (default: <hostname>-<pid>)")
+        parser.add_argument("--stages", nargs="+",
+                            choices=["metadata", "download", "transcribe", "summarize"],
+                            default=None, help="Stages handled by this worker (default: all)")
+        parser.add_argument("--lease-seconds", type=float,
+                            default=float(os.getenv('JOB_LEASE_SECONDS', '300')),
+                            help="Job lease duration in seconds, renewed by heartbeats "
+                                 "(default: 300)")
+        parser.add_argument("--once", action="store_true",
+                            help="Exit when no job is available instead of polling")
+        parser.add_argument("--stats", action="store_true",
+                            help="Print queue depth and worker throughput, then exit")
+        return parser.parse_args()
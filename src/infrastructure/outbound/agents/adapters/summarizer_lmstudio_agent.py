@@ -1,6 +1,7 @@
 import os
 from openai import OpenAI, APITimeoutError, APIConnectionError
 from infrastructure.outbound.agents.ports.summarizer_agent import SummarizerAgent
+from infrastructure.outbound.agents.adapters.summary_validator import complete_summary
 
 
 def calculate_min_summary_lines(duration_seconds: int, 
@@ -39,20 +40,24 @@ def calculate_min_summary_lines(duration_seconds: int,
 
 
 class SummarizerLMStudioAgent(SummarizerAgent):
-    def __init__(self, model: str):
+    def __init__(self, model: str, base_url: str | None = None, api_key: str | None = None,
+                 timeout: float | None = None, max_retries: int = 2):
         """
         Initialize LM Studio agent using OpenAI-compatible API.
         :param model: The LLM model to use (defaults to LM Studio's loaded model)
-        :param api_key: API key (LM Studio doesn't require a real key, defaults to 'not-needed')
-        :param base_url: Base URL for LM Studio API (defaults to local LM Studio instance)
-        :param timeout: Request timeout in seconds (defaults to 300s/5min for long transcriptions)
+        :param api_key: API key (LM Studio doesn't require a real key, defaults to LM_STUDIO_API_KEY)
+        :param base_url: Base URL for LM Studio API (defaults to LM_STUDIO_BASE_URL)
+        :param timeout: Request timeout in seconds (defaults to LM_STUDIO_TIMEOUT or 30 min for long transcriptions)
+        :param max_retries: Retries of the openai client on timeouts and connection errors
+            (0 when a backend pool fails over instead)
         """
-        self.base_url= os.getenv('LM_STUDIO_BASE_URL', '')
+        self.base_url= base_url or os.getenv('LM_STUDIO_BASE_URL', '')
         self.model = model
         self.client = OpenAI(
             base_url= self.base_url,
-            api_key = os.getenv('LM_STUDIO_API_KEY', ''),
-            timeout = float(os.getenv('LM_STUDIO_TIMEOUT', '1800.0'))  # 30 minutes default for long summaries
+            api_key = api_key or os.getenv('LM_STUDIO_API_KEY', ''),
+            timeout = timeout or float(os.getenv('LM_STUDIO_TIMEOUT', '1800.0')),  # 30 minutes default for long summaries
+            max_retries = max_retries
         )
         
         # Perform health check with short timeout
@@ -119,6 +124,31 @@ Error: {str(e)}
             print("Continuing anyway, but API calls may fail...")
 
 
+    def _complete(self, messages: list[dict], max_tokens: int | None = None) -> tuple[str, int]:
+        """Send a chat completion request and return the generated text and the total tokens used."""
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=0.2,
+            max_tokens=max_tokens,
+            stream=False
+        )
+
+        if not response.choices or len(response.choices) == 0:
+            raise Exception("No response from LM Studio API")
+        if not response.choices[0].message or not response.choices[0].message.content:
+            raise Exception("Invalid response format from LM Studio API")
+
+        tokens = response.usage.total_tokens if response.usage else 0
+        return response.choices[0].message.content, tokens
+
+    def generate(self, system_prompt: str, prompt: str) -> str:
+        text, _ = self._complete([
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ])
+        return text
+
     def organize_transcription(self, transcription: str, video_info: dict, lang: str, enrich_text: bool = False) -> str:
         # Calculate minimum lines based on video duration
         video_duration = video_info.get('duration', 0) if video_info else 0
@@ -211,23 +241,12 @@ Do not include any disclaimer or notes that are not part of the main topic.
             print(f"\n🤖 Connecting to LM Studio at {self.base_url}...")
             print(f"📝 Processing transcription with model: {self.model}...")
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.2,
-                stream=False
-            )
-
-            if not response.choices or len(response.choices) == 0:
-                raise Exception("No response from LM Studio API")
-            if not response.choices[0].message or not response.choices[0].message.content:
-                raise Exception("Invalid response format from LM Studio API")
-            
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ]
+            markdown, tokens = self._complete(messages)
             print("✅ Transcription organized successfully!")
-            return response.choices[0].message.content
             
         except APITimeoutError as e:
             error_msg = f"""
@@ -261,3 +280,12 @@ Error: {str(e)}
 """
             print(error_msg)
             raise Exception(error_msg) from e
+
+        def _continue(existing: str, continuation_prompt: str, max_tokens: int) -> tuple[str, int]:
+            return self._complete(messages + [
+                {"role": "assistant", "content": existing},
+                {"role": "user", "content": continuation_prompt}
+            ], max_tokens=max_tokens)
+
+        # Outside the try: a failed continuation request must not discard the first draft
+        return complete_summary(markdown, min_lines, lang, video_info, _continue, tokens_used=tokens)
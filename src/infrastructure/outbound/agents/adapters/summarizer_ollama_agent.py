@@ -1,11 +1,222 @@
+import os
+import time
+
 import ollama
-from infrastructure.outbound.agents.ports.summarizer_agent import SummarizerAgent
-from infrastructure.outbound.agents.adapters.summarizer_lmstudio_agent import calculate_min_summary_lines
+from infrastructure.outbound.agents.ports.summarizer_agent import (
+    ContextWindowExceededError,
+    SummarizerAgent,
+)
+from infrastructure.outbound.agents.adapters.summarizer_lmstudio_agent import (
+    calculate_min_summary_lines,
+)
+from infrastructure.outbound.agents.adapters.summary_validator import complete_summary
+from infrastructure.outbound.metrics.adapters.local_metrics_store import LocalMetricsStore
+from infrastructure.outbound.metrics.ports.metrics_store_port import MetricsStorePort
+
+# Characters per token until the model's ratio is measured (conservative: non-English text uses more
+# tokens)
+DEFAULT_CHARS_PER_TOKEN = 3.5
+CONTEXT_METRICS = 'ollama_context'
+
+
+def _parse_keep_alive(value: str) -> float | str:
+    """
+    Ollama takes durations ('30m') or seconds (-1 keeps the model loaded until the server stops).
+    """
+    try:
+        return float(value)
+    except ValueError:
+        return value
 
 
 class SummarizerOllamaAgent(SummarizerAgent):
-    def __init__(self, model: str = 'gemma3'):
+    """
+    Ollama summarizer. Each request sizes num_ctx from an estimate of its prompt tokens (a
+    chars/token ratio calibrated with the prompt_eval_count of past responses), so long transcripts
+    are not silently truncated to the server's default context. Ollama reloads the model whenever
+    num_ctx changes, so the model is loaded up front at a modest context (OLLAMA_WARM_CTX), sizes
+    grow in powers of two only when a prompt needs it and never shrink within a process, and the
+    model is kept loaded between requests (keep_alive).
+    """
+    # Models already loaded by an agent of this process, per server
+    _warmed: set[tuple[str, str]] = set()
+
+    def __init__(self, model: str = 'gemma3', host: str | None = None, timeout: float | None = None,
+                 max_ctx: int | None = None, keep_alive: str | None = None):
+        """
+        Initialize Ollama agent.
+        :param model: The Ollama model to use
+        :param host: Base URL of the Ollama server (defaults to OLLAMA_HOST or http://localhost:11434)
+        :param timeout: Request timeout in seconds (no timeout by default)
+        :param max_ctx: Largest context window to request, in tokens (defaults to OLLAMA_MAX_CTX or
+            32768)
+        :param keep_alive: How long the server keeps the model loaded after a request (defaults to
+            OLLAMA_KEEP_ALIVE or 30m)
+        """
         self.model = model
+        self.host = host or os.getenv('OLLAMA_HOST', 'http://localhost:11434')
+        self.client = ollama.Client(host=self.host, timeout=timeout)
+        self.max_ctx = max_ctx or int(os.getenv('OLLAMA_MAX_CTX', '32768'))
+        self.keep_alive = _parse_keep_alive(keep_alive or os.getenv('OLLAMA_KEEP_ALIVE', '30m'))
+        # Tokens reserved for the generated document
+        self.output_tokens = int(os.getenv('OLLAMA_OUTPUT_TOKENS', '8192'))
+        # 'chunk' raises ContextWindowExceededError so the caller summarizes by sections, 'truncate'
+        # only warns
+        self.overflow_policy = os.getenv('OLLAMA_CONTEXT_OVERFLOW', 'chunk')
+        self._metrics: MetricsStorePort = LocalMetricsStore()
+        self._health_check()
+        self._read_model_context()
+        # Load the model at a modest context: short prompts never pay for the largest KV cache, and
+        # a longer prompt grows it (reloading the model once)
+        self.num_ctx = min(int(os.getenv('OLLAMA_WARM_CTX', '8192')), self.max_ctx)
+        self._warm_up()
+
+    def _health_check(self):
+        """Verify the Ollama server is responding and has the model available."""
+        print(f"🔍 Checking connection to Ollama at {self.host}...")
+        try:
+            models = [m.get('model') or m.get('name') for m in self.client.list().get('models', [])]
+        except Exception as e:
+            raise ConnectionError(f"❌ Health check failed: Cannot connect to Ollama at {self.host}: {str(e)}") from e
+        if not any(name and name.split(':')[0] == self.model.split(':')[0] for name in models):
+            print(f"⚠️  Ollama is responding but model '{self.model}' is not pulled. Run: ollama pull {self.model}")
+        else:
+            print(f"✅ Ollama is responding. Model '{self.model}' is available")
+
+    def _read_model_context(self):
+        """
+        Lower the context cap to the model's trained context length, when the server reports it.
+        """
+        try:
+            model_info = self.client.show(self.model).get('modelinfo') or {}
+        except Exception:
+            return
+        context_length = next(
+            (value for key, value in model_info.items() if key.endswith('.context_length')), None
+        )
+        if context_length and int(context_length) < self.max_ctx:
+            print(f"   Model '{self.model}' supports up to {context_length} tokens of context")
+            self.max_ctx = int(context_length)
+
+    def _warm_up(self):
+        """
+        Load the model once per process so the first summary does not pay for it (an empty prompt
+        only loads it).
+        """
+        if (self.host, self.model) in SummarizerOllamaAgent._warmed:
+            return
+        print(f"🔥 Loading model '{self.model}' (num_ctx {self.num_ctx}, "
+              f"keep_alive {self.keep_alive})...")
+        start = time.monotonic()
+        try:
+            self.client.generate(model=self.model, prompt='', keep_alive=self.keep_alive,
+                                 options={"num_ctx": self.num_ctx})
+        except Exception as e:
+            print(f"⚠️  Could not preload model '{self.model}': {str(e).strip()[:200]}")
+            return
+        SummarizerOllamaAgent._warmed.add((self.host, self.model))
+        print(f"✅ Model loaded in {time.monotonic() - start:.1f}s")
+
+    def _chars_per_token(self) -> float:
+        metrics = self._metrics.read(CONTEXT_METRICS)
+        tokens = metrics.get(f"{self.model}.prompt_tokens", 0)
+        if not tokens:
+            return DEFAULT_CHARS_PER_TOKEN
+        return metrics.get(f"{self.model}.prompt_chars", 0) / tokens
+
+    def estimate_tokens(self, text: str) -> int:
+        """
+        Estimate the number of tokens of a text for this model.
+        :param text: The text.
+        """
+        return int(len(text) / self._chars_per_token()) + 1
+
+    def _overflow(self, message: str, allow_overflow: bool):
+        """Raise ContextWindowExceededError for the 'chunk' policy, otherwise only warn."""
+        if not allow_overflow and self.overflow_policy == 'chunk':
+            raise ContextWindowExceededError(message)
+        print(f"⚠️  {message}: Ollama will truncate it")
+
+    def _size_context(self, prompt_tokens: int, allow_overflow: bool):
+        needed = prompt_tokens + self.output_tokens
+        if needed > self.max_ctx:
+            self._overflow(
+                f"Prompt of ~{prompt_tokens} tokens (+{self.output_tokens} for the output) does "
+                f"not fit the {self.max_ctx}-token context of '{self.model}'", allow_overflow
+            )
+            self.num_ctx = self.max_ctx
+            return
+        size = 2048
+        while size < needed:
+            size *= 2
+        # Never shrink: every num_ctx change makes Ollama reload the model
+        self.num_ctx = max(self.num_ctx, min(size, self.max_ctx))
+
+    def _stream(self, system_prompt: str, prompt: str, options: dict) -> tuple[str, int, int]:
+        """
+        Stream a completion at the current num_ctx.
+        :return: The generated text, the prompt tokens and the completion tokens.
+        """
+        start = time.monotonic()
+        parts = []
+        final = {}
+        for chunk in self.client.generate(
+            model=self.model,
+            prompt=prompt,
+            system=system_prompt,
+            options={**options, "num_ctx": self.num_ctx},
+            keep_alive=self.keep_alive,
+            stream=True
+        ):
+            parts.append(chunk['response'])
+            if chunk.get('done'):
+                final = chunk
+        prompt_tokens = final.get('prompt_eval_count') or 0
+        completion_tokens = final.get('eval_count') or 0
+        print(f"   {completion_tokens} tokens generated from {prompt_tokens} prompt tokens "
+              f"(num_ctx {self.num_ctx}) in {time.monotonic() - start:.1f}s")
+        return ''.join(parts), prompt_tokens, completion_tokens
+
+    def _generate(self, system_prompt: str, prompt: str, options: dict,
+                  allow_overflow: bool = False, calibrate: bool = True) -> tuple[str, int]:
+        """
+        Stream a completion with num_ctx sized for the prompt. Ollama truncates prompts longer than
+        num_ctx, so a response whose prompt filled the context is retried with a larger one.
+        :param allow_overflow: Warn instead of raising ContextWindowExceededError when the prompt
+            does not fit.
+        :param calibrate: Use the response's prompt_eval_count to calibrate the token estimate (not
+            for requests sharing a cached prefix with a previous one, which report fewer prompt
+            tokens).
+        :return: The generated text and the tokens used (prompt + completion).
+        """
+        prompt_chars = len(system_prompt) + len(prompt)
+        self._size_context(self.estimate_tokens(system_prompt + prompt), allow_overflow)
+
+        text, prompt_tokens, completion_tokens = self._stream(system_prompt, prompt, options)
+        # The estimate was too low: the prompt was truncated to num_ctx
+        while prompt_tokens >= self.num_ctx:
+            if self.num_ctx >= self.max_ctx:
+                self._overflow(
+                    f"Prompt filled the whole {self.num_ctx}-token context of '{self.model}'",
+                    allow_overflow
+                )
+                break
+            print(f"⚠️  Prompt filled the {self.num_ctx}-token context and was truncated, "
+                  f"retrying with a larger context...")
+            self.num_ctx = min(self.num_ctx * 2, self.max_ctx)
+            text, prompt_tokens, completion_tokens = self._stream(system_prompt, prompt, options)
+
+        # A prompt that filled the context was truncated and does not reflect the real ratio
+        if calibrate and prompt_chars >= 1000 and 0 < prompt_tokens < self.num_ctx:
+            self._metrics.increment(CONTEXT_METRICS, {
+                f"{self.model}.prompt_chars": prompt_chars,
+                f"{self.model}.prompt_tokens": prompt_tokens,
+            })
+        return text, prompt_tokens + completion_tokens
+
+    def generate(self, system_prompt: str, prompt: str) -> str:
+        # Callers of generate already split their input, so an oversized prompt is only reported
+        return self._generate(system_prompt, prompt, {"temperature": 0.2}, allow_overflow=True)[0]
 
     def organize_transcription(self, transcription: str, video_info: dict, lang: str, enrich_text: bool = False) -> str:
         # Calculate minimum lines based on video duration
@@ -70,10 +281,7 @@ class SummarizerOllamaAgent(SummarizerAgent):
             + "\nTranscription:\n" + transcription
         )
 
-        options = {
-            "temperature": 0.2,
-            #"max_tokens": 2048,
-            "system": """
+        system_prompt = ("""
                 You are a professional teacher and researcher with years of experience creating COMPREHENSIVE, DETAILED courses and guidelines.
                 Your style is THOROUGH and EXHAUSTIVE - you never skip details or condense information unnecessarily.
                 You always ensure that NO detail or information is lost from the source material.
@@ -97,13 +305,20 @@ class SummarizerOllamaAgent(SummarizerAgent):
                 Do not use a conclusion like "I hope this helps" or "Let me know if you have any questions".
                 Do not include any disclaimer or notes that are not part of the main topic.
             """
-        }
+        )
+        options = {"temperature": 0.2}
         if enrich_text:
             options["provider"] = "internet"
 
-        response = ollama.generate(
-            model=self.model,
-            prompt=prompt,
-            options=options
-        )
-        return response['response']
+        text, tokens = self._generate(system_prompt, prompt, options)
+
+        def _continue(existing: str, continuation_prompt: str, max_tokens: int) -> tuple[str, int]:
+            return self._generate(
+                system_prompt,
+                prompt + "\n\nCurrent document:\n" + existing + "\n" + continuation_prompt,
+                {**options, "num_predict": max_tokens},
+                allow_overflow=True,
+                calibrate=False
+            )
+
+        return complete_summary(text, min_lines, lang, video_info, _continue, tokens_used=tokens)
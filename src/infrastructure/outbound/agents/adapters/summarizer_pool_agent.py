@@ -0,0 +1,294 @@
+import json
+import os
+import re
+import threading
+import time
+from typing import Callable
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from infrastructure.outbound.agents.ports.summarizer_agent import (
+    ContextWindowExceededError,
+    SummarizerAgent,
+)
+from infrastructure.outbound.file_storage.adapters.local_file_storage import OUTPUT_PATH
+from infrastructure.outbound.metrics.adapters.local_metrics_store import LocalMetricsStore
+from infrastructure.outbound.metrics.ports.metrics_store_port import MetricsStorePort
+
+SLOTS_PATH = os.path.join(OUTPUT_PATH, 'locks')
+
+
+class LLMBackend:
+    """
+    One LLM server of the pool: an OpenAI-compatible endpoint (LM Studio, vLLM, llama.cpp...) or an
+    Ollama server. Tracks in-flight requests, circuit breaker state and latency/throughput stats.
+    """
+    def __init__(self, name: str, type: str, base_url: str, models: list | dict | None = None,
+                 max_concurrency: int = 1, api_key: str | None = None,
+                 timeout: float | None = None):
+        """
+        :param name: Backend name used in logs and stats.
+        :param type: 'openai' for OpenAI-compatible servers or 'ollama'.
+        :param base_url: Base URL of the server.
+        :param models: Models served by the backend. A list of names, or a mapping from the
+            requested model name to the backend's own name
+            (e.g. {"openai/gpt-oss-20b": "gpt-oss:20b"}). Empty serves any model.
+        :param max_concurrency: Maximum number of requests sent to the backend at the same time,
+            by all the processes of the host.
+        :param api_key: API key for OpenAI-compatible servers.
+        :param timeout: Request timeout in seconds.
+        """
+        if type not in ('openai', 'ollama'):
+            raise ValueError(f"Unknown LLM backend type '{type}' for backend '{name}' "
+                             f"(expected 'openai' or 'ollama')")
+        self.name = name
+        self.type = type
+        self.base_url = base_url
+        if isinstance(models, dict):
+            self.models = models
+        else:
+            self.models = {model: model for model in models or []}
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.api_key = api_key
+        self.timeout = timeout
+
+        self.in_flight = 0
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.stats = {'requests': 0, 'successes': 0, 'failures': 0, 'timeouts': 0,
+                      'busy_seconds': 0.0, 'output_chars': 0}
+        self._agents: dict[str, SummarizerAgent] = {}
+        self._slot_prefix = re.sub(r'[^\w.-]', '_', name)
+
+    def serves(self, model: str) -> bool:
+        return not self.models or model in self.models
+
+    def is_closed(self, now: float) -> bool:
+        """Circuit breaker: the backend receives requests unless it is open (cooling down)."""
+        return now >= self.open_until
+
+    def try_reserve_slot(self) -> tuple[int, object | None]:
+        """
+        Try to reserve one of the backend's `max_concurrency` slots without waiting. Slots are
+        flock'd files under outputs/locks/, so the limit holds across the processes of the host
+        (workers, main.py). Without fcntl, the slots only count the requests of this process.
+        :return: The number of busy slots, and the reserved slot (None when all slots are busy).
+        """
+        if fcntl is None:
+            return self.in_flight, True if self.in_flight < self.max_concurrency else None
+        os.makedirs(SLOTS_PATH, exist_ok=True)
+        busy, slot = 0, None
+        for index in range(self.max_concurrency):
+            lock_file = open(os.path.join(SLOTS_PATH, f"{self._slot_prefix}.{index}.lock"), "w")
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                lock_file.close()
+                busy += 1
+                continue
+            if slot is None:
+                slot = lock_file
+            else:
+                # Only probed to count the busy slots
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+                lock_file.close()
+        return busy, slot
+
+    def release_slot(self, slot: object):
+        if fcntl is not None and slot is not None:
+            fcntl.flock(slot, fcntl.LOCK_UN)
+            slot.close()
+
+    def get_agent(self, model: str) -> SummarizerAgent:
+        """Create (once) the summarizer agent for a model on this backend (health-checked)."""
+        if model not in self._agents:
+            backend_model = self.models.get(model, model)
+            if self.type == 'ollama':
+                from infrastructure.outbound.agents.adapters.summarizer_ollama_agent import (
+                    SummarizerOllamaAgent,
+                )
+                self._agents[model] = SummarizerOllamaAgent(
+                    model=backend_model, host=self.base_url, timeout=self.timeout
+                )
+            else:
+                from infrastructure.outbound.agents.adapters.summarizer_lmstudio_agent import (
+                    SummarizerLMStudioAgent,
+                )
+                # No client retries: the pool fails over to the next backend instead
+                self._agents[model] = SummarizerLMStudioAgent(
+                    model=backend_model, base_url=self.base_url, api_key=self.api_key,
+                    timeout=self.timeout, max_retries=0
+                )
+        return self._agents[model]
+
+    def get_stats(self) -> dict:
+        completed = self.stats['successes']
+        busy_seconds = self.stats['busy_seconds']
+        return {
+            **self.stats,
+            'type': self.type,
+            'base_url': self.base_url,
+            'in_flight': self.in_flight,
+            'max_concurrency': self.max_concurrency,
+            'circuit': 'closed' if self.is_closed(time.monotonic()) else 'open',
+            'avg_latency_seconds': round(busy_seconds / completed, 2) if completed else None,
+            'chars_per_second': (round(self.stats['output_chars'] / busy_seconds, 1)
+                                 if busy_seconds else None),
+        }
+
+
+def load_backends(file_path: str) -> list[LLMBackend]:
+    """
+    Load the backend pool configuration from a JSON file:
+    {"backends": [{"name": "lmstudio-main", "type": "openai",
+                   "base_url": "http://localhost:1234/v1", "models": ["openai/gpt-oss-20b"],
+                   "max_concurrency": 2}, ...]}
+    :param file_path: Path of the JSON configuration file.
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    backends = [LLMBackend(**backend) for backend in config.get('backends', [])]
+    if not backends:
+        raise ValueError(f"No LLM backends configured in {file_path}")
+    return backends
+
+
+class SummarizerPoolAgent(SummarizerAgent):
+    """
+    Summarizer agent that routes each request to the least-loaded healthy backend serving the model.
+    Load and concurrency limits are shared by the processes of the host through slot lock files.
+    Backends that fail `failure_threshold` times in a row are taken out of rotation for
+    `cooldown_seconds` (circuit breaker, per process), and failed or timed-out requests fail over to
+    the next backend.
+    """
+    def __init__(self, model: str, backends: list[LLMBackend], failure_threshold: int | None = None,
+                 cooldown_seconds: float | None = None):
+        self.model = model
+        self.backends = [backend for backend in backends if backend.serves(model)]
+        if not self.backends:
+            raise ValueError(f"No LLM backend serves model '{model}'")
+        self.failure_threshold = (failure_threshold
+                                  or int(os.getenv('LLM_CIRCUIT_FAILURE_THRESHOLD', '3')))
+        self.cooldown_seconds = cooldown_seconds or float(os.getenv('LLM_CIRCUIT_COOLDOWN', '60'))
+        self._condition = threading.Condition()
+        self._metrics: MetricsStorePort = LocalMetricsStore()
+
+    def _acquire(self, tried: set[str]) -> tuple[LLMBackend, object] | None:
+        """
+        Reserve a slot on the least-loaded healthy backend, waiting while all of them are busy.
+        :return: The backend and its reserved slot, or None when no untried healthy backend is left.
+        """
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                candidates = [b for b in self.backends if b.name not in tried and b.is_closed(now)]
+                if not candidates:
+                    return None
+                reservations = [(backend, *backend.try_reserve_slot()) for backend in candidates]
+                free = [reservation for reservation in reservations if reservation[2] is not None]
+                if free:
+                    backend, _, slot = min(free, key=lambda r: (
+                        r[1] / r[0].max_concurrency, r[0].get_stats()['avg_latency_seconds'] or 0
+                    ))
+                    for other, _, other_slot in free:
+                        if other is not backend:
+                            other.release_slot(other_slot)
+                    backend.in_flight += 1
+                    backend.stats['requests'] += 1
+                    return backend, slot
+                # Slots released by other processes are not notified: poll them
+                self._condition.wait(timeout=1.0)
+
+    def _release(self, backend: LLMBackend, slot: object, elapsed: float, output_chars: int = 0,
+                 error: Exception | None = None):
+        with self._condition:
+            backend.release_slot(slot)
+            backend.in_flight -= 1
+            backend.stats['busy_seconds'] += elapsed
+            counters = {'requests': 1, 'busy_seconds': round(elapsed, 3)}
+            if isinstance(error, ContextWindowExceededError):
+                # The backend is healthy, its model context is just too small for this prompt
+                counters['context_rejections'] = 1
+            elif error is None:
+                backend.consecutive_failures = 0
+                backend.stats['successes'] += 1
+                backend.stats['output_chars'] += output_chars
+                counters.update({'successes': 1, 'output_chars': output_chars})
+            else:
+                backend.consecutive_failures += 1
+                backend.stats['failures'] += 1
+                counters['failures'] = 1
+                if _is_timeout(error):
+                    backend.stats['timeouts'] += 1
+                    counters['timeouts'] = 1
+                if backend.consecutive_failures >= self.failure_threshold:
+                    backend.open_until = time.monotonic() + self.cooldown_seconds
+                    print(f"🔌 Circuit opened for backend '{backend.name}' for "
+                          f"{self.cooldown_seconds:.0f}s after {backend.consecutive_failures} "
+                          f"consecutive failures")
+            self._metrics.increment(f"llm_backend_{backend.name}", counters)
+            self._condition.notify_all()
+
+    def _dispatch(self, call: Callable[[SummarizerAgent], str]) -> str:
+        tried: set[str] = set()
+        last_error: Exception | None = None
+        context_error: ContextWindowExceededError | None = None
+        while (reservation := self._acquire(tried)) is not None:
+            backend, slot = reservation
+            tried.add(backend.name)
+            print(f"🧭 Routing request to backend '{backend.name}' ({backend.base_url})")
+            start = time.monotonic()
+            try:
+                result = call(backend.get_agent(self.model))
+            except ContextWindowExceededError as e:
+                self._release(backend, slot, time.monotonic() - start, error=e)
+                print(f"⚠️  Backend '{backend.name}': {e}")
+                context_error = e
+                continue
+            except Exception as e:
+                self._release(backend, slot, time.monotonic() - start, error=e)
+                print(f"⚠️  Backend '{backend.name}' failed: {str(e).strip()[:200]}")
+                last_error = e
+                continue
+            self._release(backend, slot, time.monotonic() - start, output_chars=len(result))
+            return result
+        if context_error is not None:
+            raise context_error
+        raise ConnectionError(
+            f"No healthy LLM backend could serve model '{self.model}'"
+        ) from last_error
+
+    def organize_transcription(self, transcription: str, video_info: dict, lang: str,
+                               enrich_text: bool = False) -> str:
+        return self._dispatch(lambda agent: agent.organize_transcription(
+            transcription, video_info=video_info, lang=lang, enrich_text=enrich_text
+        ))
+
+    def generate(self, system_prompt: str, prompt: str) -> str:
+        return self._dispatch(lambda agent: agent.generate(system_prompt, prompt))
+
+    def get_stats(self) -> dict:
+        """Per-backend latency and throughput stats of this process."""
+        with self._condition:
+            return {backend.name: backend.get_stats() for backend in self.backends}
+
+    def print_stats(self):
+        print("\n--- LLM BACKENDS ---\n")
+        for name, stats in self.get_stats().items():
+            latency = stats['avg_latency_seconds']
+            latency = f"{latency}s" if latency is not None else "-"
+            throughput = stats['chars_per_second']
+            throughput = f"{throughput} chars/s" if throughput is not None else "- chars/s"
+            print(f"{name} [{stats['circuit']}]: {stats['successes']}/{stats['requests']} ok, "
+                  f"{stats['timeouts']} timeouts, avg latency {latency}, {throughput}, "
+                  f"in flight {stats['in_flight']}/{stats['max_concurrency']}")
+        print("\n--------------------\n")
+
+
+def _is_timeout(error: Exception) -> bool:
+    # Agents wrap client errors (e.g. openai.APITimeoutError) in generic exceptions
+    errors = (error, error.__cause__)
+    return any('timeout' in type(e).__name__.lower() for e in errors if e is not None)
@@ -0,0 +1,195 @@
+import os
+import re
+from typing import Callable
+
+from infrastructure.outbound.metrics.adapters.local_metrics_store import LocalMetricsStore
+from infrastructure.outbound.metrics.ports.metrics_store_port import MetricsStorePort
+
+# Heading names accepted for each required section, in the languages we usually summarize in.
+# A heading matches when it starts with one of them as a whole word (after emoji and numbering), so
+# "Conclusion and next steps" counts while topic headings such as "Indexes in PostgreSQL" do not.
+SECTION_NAMES = {
+    'Summary': ['summary', 'executive summary', 'overview', 'resumen', 'résumé', 'resumé', 'resumo',
+                'zusammenfassung', 'riassunto', 'sintesi', 'síntesis'],
+    'Index': ['index', 'detailed index', 'table of contents', 'contents', 'índice', 'indice',
+              'índice detallado', 'sommaire', 'table des matières', 'inhalt', 'inhaltsverzeichnis'],
+    'Conclusion': ['conclusion', 'conclusions', 'conclusión', 'conclusiones', 'conclusão',
+                   'conclusões', 'conclusione', 'conclusioni', 'fazit', 'schlussfolgerung',
+                   'schlussfolgerungen'],
+}
+# Rough size of generated markdown, used to estimate the prompt of the next continuation round
+CHARS_PER_TOKEN = 4
+# Rounds with less output budget than this are not worth a request
+MIN_ROUND_TOKENS = 256
+# Sections that belong right after the title; the others are appended at the end of the document
+HEAD_SECTIONS = ['Summary', 'Index']
+
+
+def _heading_text(line: str) -> str:
+    """Lowercase heading text without the leading emoji, numbering ('1.', 'II)') or punctuation."""
+    text = line.lstrip('#').strip().lower()
+    text = re.sub(r'^[\W\d_]+', '', text)
+    return re.sub(r'^[ivxlc]+[.)]\s*', '', text).strip()
+
+
+def _matches_section(heading: str, names: list[str]) -> bool:
+    return any(re.match(rf'{re.escape(name)}\b', heading) for name in names)
+
+
+def validate_summary(markdown: str, min_lines: int) -> dict:
+    """
+    Check a generated summary against the length and sections required by the summarizer prompt.
+    :param markdown: The generated markdown summary.
+    :param min_lines: The minimum number of lines required (see calculate_min_summary_lines).
+    :return: A dictionary with 'line_count', 'min_lines', 'missing_sections' and 'is_valid'.
+    """
+    line_count = len(markdown.splitlines())
+    headings = [_heading_text(line) for line in markdown.splitlines() if line.startswith('#')]
+
+    missing_sections = []
+    if not any(re.match(r'^#\s', line) for line in markdown.splitlines()):
+        missing_sections.append('Title')
+    for section, names in SECTION_NAMES.items():
+        if not any(_matches_section(heading, names) for heading in headings):
+            missing_sections.append(section)
+
+    return {
+        'line_count': line_count,
+        'min_lines': min_lines,
+        'missing_sections': missing_sections,
+        'is_valid': line_count >= min_lines and not missing_sections,
+    }
+
+
+def _insert_after_title(markdown: str, text: str) -> str:
+    lines = markdown.splitlines()
+    for i, line in enumerate(lines):
+        if re.match(r'^#\s', line):
+            rest = '\n'.join(lines[i + 1:]).lstrip('\n')
+            return '\n'.join(lines[:i + 1] + ['', text.strip(), '', rest])
+    return text.strip() + '\n\n' + markdown
+
+
+def _build_head_prompt(missing: list[str], lang: str) -> str:
+    return f"""
+The document above is missing these required sections: {', '.join(missing)}.
+Write ONLY those sections (as ## headings) so they can be inserted right after the document title:
+* Summary: Comprehensive overview covering all major themes (minimum 10 lines)
+* Detailed Index: Multi-level structure showing all topics and subtopics of the document
+Do not repeat any other part of the document. The output MUST be in {lang} language.
+"""
+
+
+def _build_tail_prompt(validation: dict, lang: str) -> str:
+    missing_lines = max(0, validation['min_lines'] - validation['line_count'])
+    requirements = []
+    if missing_lines:
+        requirements.append(
+            f"* The document has {validation['line_count']} lines but needs at least "
+            f"{validation['min_lines']}: add at least {missing_lines} more lines, expanding topics "
+            "from the transcription that are not covered in enough detail."
+        )
+    if 'Conclusion' in validation['missing_sections']:
+        requirements.append(
+            "* End with a '## Conclusion' section (thorough wrap-up of key learnings) "
+            "followed by '## Additional Notes'."
+        )
+    return f"""
+The document above is incomplete. Continue it exactly where it stopped:
+{chr(10).join(requirements)}
+Output ONLY the new content that will be appended at the end of the document.
+Do not repeat existing content or the title.
+The output MUST be in {lang} language.
+"""
+
+
+def complete_summary(markdown: str,
+                     min_lines: int,
+                     lang: str,
+                     video_info: dict,
+                     continue_fn: Callable[[str, str, int], tuple[str, int]],
+                     tokens_used: int = 0) -> str:
+    """
+    Validate a generated summary and, when it falls short, extend it with continuation requests
+    that include the existing output instead of regenerating it from scratch.
+
+    Continuation is capped by SUMMARY_CONTINUATION_MAX_ROUNDS requests and
+    SUMMARY_CONTINUATION_MAX_TOKENS tokens (prompt + completion) spent in them. Each round asks for
+    at most SUMMARY_CONTINUATION_ROUND_TOKENS output tokens, as servers such as vLLM or llama.cpp
+    reject max_tokens larger than the context. A round is only sent when its estimated prompt and
+    output fit the remaining budget. A failed round keeps the document as it is. Outcomes are
+    counted in outputs/metrics/summary_continuation.json.
+
+    :param markdown: The generated markdown summary.
+    :param min_lines: The minimum number of lines required.
+    :param lang: The language code of the summary.
+    :param video_info: Metadata about the video (the title is used when the document has none).
+    :param continue_fn: Sends a continuation request:
+        (existing markdown, continuation prompt, max output tokens) -> (text, tokens used).
+    :param tokens_used: Tokens (prompt + completion) spent by the initial generation. A continuation
+        prompt repeats that prompt with the document, so this is also its estimated size.
+    :return: The validated (and possibly extended) markdown summary.
+    """
+    max_rounds = int(os.getenv('SUMMARY_CONTINUATION_MAX_ROUNDS', '2'))
+    max_tokens = int(os.getenv('SUMMARY_CONTINUATION_MAX_TOKENS', '100000'))
+    round_tokens = int(os.getenv('SUMMARY_CONTINUATION_ROUND_TOKENS', '4096'))
+    metrics: MetricsStorePort = LocalMetricsStore()
+
+    validation = validate_summary(markdown, min_lines)
+    if 'Title' in validation['missing_sections'] and video_info and video_info.get('title'):
+        # No need to ask the model for a title we already know
+        markdown = f"# {video_info['title']}\n\n{markdown}"
+        validation = validate_summary(markdown, min_lines)
+
+    counters = {'summaries': 1, 'generation_tokens': tokens_used}
+    if validation['is_valid']:
+        metrics.increment('summary_continuation', {**counters, 'valid_first_pass': 1})
+        print(f"✅ Summary validated: {validation['line_count']} lines (minimum {min_lines})")
+        return markdown
+
+    print(f"⚠️  Summary falls short: {validation['line_count']}/{min_lines} lines, "
+          f"missing sections: {', '.join(validation['missing_sections']) or 'none'}")
+    counters['continued'] = 1
+
+    rounds = 0
+    spent = 0
+    prompt_estimate = tokens_used or len(markdown) // CHARS_PER_TOKEN
+    while not validation['is_valid'] and rounds < max_rounds:
+        output_tokens = min(round_tokens, max_tokens - spent - prompt_estimate)
+        if output_tokens < MIN_ROUND_TOKENS:
+            print(f"⚠️  Continuation budget exhausted ({spent}/{max_tokens} tokens spent, "
+                  f"next prompt ~{prompt_estimate} tokens)")
+            counters['budget_exhausted'] = 1
+            break
+        rounds += 1
+        missing_head = [s for s in HEAD_SECTIONS if s in validation['missing_sections']]
+        print(f"🔁 Continuation round {rounds}/{max_rounds}...")
+        prompt = (_build_head_prompt(missing_head, lang) if missing_head
+                  else _build_tail_prompt(validation, lang))
+        try:
+            text, tokens = continue_fn(markdown, prompt, output_tokens)
+        except Exception as e:
+            # Keep the draft: a failed continuation must not cost the whole generation
+            print(f"⚠️  Continuation round {rounds} failed: {str(e).strip()[:200]}")
+            counters['continuation_errors'] = 1
+            break
+        if missing_head:
+            markdown = _insert_after_title(markdown, text)
+        else:
+            markdown = markdown.rstrip() + '\n\n' + text.strip() + '\n'
+        spent += tokens
+        prompt_estimate += len(text) // CHARS_PER_TOKEN
+        validation = validate_summary(markdown, min_lines)
+
+    counters.update({'continuation_rounds': rounds, 'continuation_tokens': spent})
+    if validation['is_valid']:
+        counters['fixed_by_continuation'] = 1
+        print(f"✅ Summary completed after {rounds} continuation round(s): "
+              f"{validation['line_count']} lines ({spent} tokens)")
+    else:
+        counters['still_invalid'] = 1
+        print(f"⚠️  Summary still incomplete after {rounds} continuation round(s) "
+              f"({spent} tokens): {validation['line_count']}/{min_lines} lines, "
+              f"missing: {', '.join(validation['missing_sections']) or 'none'}")
+    metrics.increment('summary_continuation', counters)
+    return markdown
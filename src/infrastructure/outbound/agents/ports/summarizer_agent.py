@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
 
+class ContextWindowExceededError(ValueError):
+    """The transcription does not fit the model's context window: it must be summarized in smaller parts."""
+
+
 class SummarizerAgent(ABC):
     @abstractmethod
     def organize_transcription(self, transcription: str, video_info: dict, lang: str, enrich_text: bool) -> str:
@@ -9,6 +13,15 @@ class SummarizerAgent(ABC):
         :param video_info: Metadata about the video, such as title and description.
         :param lang: The language code for the transcription.
         :param enrich_text: Whether to enrich the transcription with additional information.
+        :raises ContextWindowExceededError: If the transcription does not fit the model's context window.
         """
         pass
 
+    @abstractmethod
+    def generate(self, system_prompt: str, prompt: str) -> str:
+        """
+        Send a single free-form prompt to the LLM and return the generated text.
+        :param system_prompt: The system prompt.
+        :param prompt: The user prompt.
+        """
+        pass
@@ -0,0 +1,82 @@
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from infrastructure.outbound.archive.ports.processed_archive_port import ProcessedArchivePort
+from infrastructure.outbound.file_storage.adapters.local_file_storage import OUTPUT_PATH
+
+ARCHIVE_FILE = "archive/processed.json"
+
+class LocalProcessedArchive(ProcessedArchivePort):
+    """
+    Processed-items archive stored as a single JSON file under the outputs directory:
+    { "<video_id>": { "title": ..., "stages": { "<stage>": "<status>" }, "updated_at": ... } }
+    """
+    def __init__(self, file_path: str = ARCHIVE_FILE):
+        self.path = os.path.join(OUTPUT_PATH, file_path)
+        self._records = self._load()
+
+    def _load(self) -> dict:
+        if not os.path.isfile(self.path):
+            return {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _flush(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # Write to a temporary file first so an interrupted run never leaves a truncated archive
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._records, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def get(self, video_id: str) -> dict | None:
+        return self._records.get(video_id)
+
+    def mark(self, video_id: str, stage: str, status: str, title: str | None = None,
+             upload_date: str | None = None) -> None:
+        with self._lock():
+            # Reload first: queue workers in other processes update the same archive
+            self._records = self._load()
+            record = self._records.setdefault(video_id, {'title': title, 'stages': {}})
+            if title:
+                record['title'] = title
+            if upload_date:
+                record['upload_date'] = upload_date
+            record['stages'][stage] = status
+            record['updated_at'] = datetime.now(timezone.utc).isoformat(timespec='seconds')
+            self._flush()
+
+    @contextmanager
+    def _lock(self):
+        """Exclusive lock on the archive across processes (no-op where fcntl is not available)."""
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(f"{self.path}.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def needs_processing(self, video_id: str, date_after: str | None = None) -> bool:
+        record = self.get(video_id)
+        if not record:
+            return True
+        stages = record.get('stages', {})
+        if 'failed' in stages.values():
+            return True
+        # Videos skipped by the date filter stay settled only while the current filter still
+        # excludes them
+        if stages.get('metadata') == 'skipped':
+            upload_date = record.get('upload_date')
+            return not (date_after and upload_date and upload_date < date_after)
+        return stages.get('summary') != 'done'
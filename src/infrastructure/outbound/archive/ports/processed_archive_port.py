@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+
+class ProcessedArchivePort(ABC):
+    @abstractmethod
+    def get(self, video_id: str) -> dict | None:
+        """
+        Get the archive record of a video.
+        :param video_id: The platform video ID.
+        :return: The record ({'title', 'stages', 'updated_at'}) or None if the video was never seen.
+        """
+        pass
+
+    @abstractmethod
+    def mark(self, video_id: str, stage: str, status: str, title: str | None = None,
+             upload_date: str | None = None) -> None:
+        """
+        Record the status of a processing stage for a video.
+        :param video_id: The platform video ID.
+        :param stage: The processing stage ('metadata', 'transcription' or 'summary').
+        :param status: The stage status ('done', 'failed' or 'skipped').
+        :param title: The video title, if known.
+        :param upload_date: The upload date (YYYYMMDD), if known. Needed to re-check skipped videos.
+        """
+        pass
+
+    @abstractmethod
+    def needs_processing(self, video_id: str, date_after: str | None = None) -> bool:
+        """
+        Check if a video is new, failed or unfinished and must be (re)processed.
+        :param video_id: The platform video ID.
+        :param date_after: The current date filter (YYYYMMDD). Videos skipped by an earlier sync are
+            processed again unless they are still older than it.
+        :return: True if the video must be processed, False otherwise.
+        """
+        pass
@@ -0,0 +1,55 @@
+import os
+
+from infrastructure.outbound.audio_preprocessor.ports.audio_preprocessor_port import (
+    AudioPreprocessorPort,
+    SpeechAudio,
+)
+from infrastructure.outbound.transcriber.ports.audio_transcriber_port import SAMPLE_RATE
+
+class SileroVadAudioPreprocessor(AudioPreprocessorPort):
+    """
+    Voice activity detection with the Silero VAD model bundled with faster-whisper (runs on CPU, no
+    extra download).
+    """
+    def __init__(self, min_silence_ms: int | None = None, speech_pad_ms: int | None = None,
+                 threshold: float | None = None):
+        """
+        :param min_silence_ms: Shortest silence that is cut (defaults to VAD_MIN_SILENCE_MS or
+            2000).
+            Shorter pauses are kept so sentences are not split.
+        :param speech_pad_ms: Margin kept around each speech region (defaults to VAD_SPEECH_PAD_MS
+            or 400).
+        :param threshold: Speech probability above which a frame counts as speech (defaults to
+            VAD_THRESHOLD or 0.5).
+        """
+        self.min_silence_ms = min_silence_ms or int(os.getenv('VAD_MIN_SILENCE_MS', '2000'))
+        if speech_pad_ms is None:
+            speech_pad_ms = int(os.getenv('VAD_SPEECH_PAD_MS', '400'))
+        self.speech_pad_ms = speech_pad_ms
+        self.threshold = threshold or float(os.getenv('VAD_THRESHOLD', '0.5'))
+
+    def trim_silence(self, audio_path: str) -> SpeechAudio:
+        import numpy as np
+        from faster_whisper import decode_audio
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        audio = decode_audio(audio_path, sampling_rate=SAMPLE_RATE)
+        options = VadOptions(
+            threshold=self.threshold,
+            min_silence_duration_ms=self.min_silence_ms,
+            speech_pad_ms=self.speech_pad_ms,
+        )
+        timestamps = get_speech_timestamps(audio, vad_options=options)
+
+        chunks = []
+        compacted_samples = 0
+        for timestamp in timestamps:
+            length = timestamp['end'] - timestamp['start']
+            chunks.append((compacted_samples / SAMPLE_RATE, timestamp['start'] / SAMPLE_RATE,
+                           length / SAMPLE_RATE))
+            compacted_samples += length
+        if timestamps:
+            samples = np.concatenate([audio[t['start']:t['end']] for t in timestamps])
+        else:
+            samples = audio[:0]
+        return SpeechAudio(samples, SAMPLE_RATE, len(audio) / SAMPLE_RATE, chunks)
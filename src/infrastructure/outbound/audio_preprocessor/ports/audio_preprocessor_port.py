@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+
+class SpeechAudio:
+    """
+    Speech-only audio compacted from a longer recording, with the offset map back to the original
+    timeline.
+    """
+    def __init__(self, samples, sample_rate: int, original_seconds: float,
+                 chunks: list[tuple[float, float, float]]):
+        """
+        :param samples: The compacted speech samples (float32 mono).
+        :param sample_rate: The sample rate of the samples.
+        :param original_seconds: Duration of the original recording.
+        :param chunks: Offset map of the kept regions, as (start in the compacted audio, start in
+            the original, duration) in seconds.
+        """
+        self.samples = samples
+        self.sample_rate = sample_rate
+        self.original_seconds = original_seconds
+        self.chunks = chunks
+        self._starts = [chunk[0] for chunk in chunks]
+
+    @property
+    def speech_seconds(self) -> float:
+        return len(self.samples) / self.sample_rate
+
+    @property
+    def removed_seconds(self) -> float:
+        return max(0.0, self.original_seconds - self.speech_seconds)
+
+    def to_original(self, seconds: float) -> float:
+        """
+        Map a timestamp of the compacted audio back to the original recording.
+        :param seconds: Timestamp in the compacted audio.
+        :return: The timestamp in the original recording.
+        """
+        if not self.chunks:
+            return seconds
+        index = max(0, bisect_right(self._starts, seconds) - 1)
+        compacted_start, original_start, duration = self.chunks[index]
+        return original_start + min(max(seconds - compacted_start, 0.0), duration)
+
+
+class AudioPreprocessorPort(ABC):
+    @abstractmethod
+    def trim_silence(self, audio_path: str) -> SpeechAudio:
+        """
+        Remove the non-speech regions (silence, music, long pauses) of an audio file.
+        :param audio_path: The path to the audio file.
+        :return: The compacted speech-only audio and its offset map.
+        """
+        pass
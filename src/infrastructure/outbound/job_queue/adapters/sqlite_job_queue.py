@@ -0,0 +1,244 @@
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from infrastructure.outbound.file_storage.adapters.local_file_storage import OUTPUT_PATH
+from infrastructure.outbound.job_queue.ports.job_queue_port import JobQueuePort
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    stage TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    dedupe_key TEXT UNIQUE,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, stage, available_at);
+CREATE TABLE IF NOT EXISTS workers (
+    worker_id TEXT PRIMARY KEY,
+    host TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    busy_seconds REAL NOT NULL DEFAULT 0
+);
+"""
+
+
+class SqliteJobQueue(JobQueuePort):
+    """
+    Durable job queue in a single SQLite file. Claims run in an immediate (write-locked) transaction
+    and every state change is conditioned on the lease owner, so a job is never held by two workers
+    at once and a worker whose lease expired cannot complete a job someone else reclaimed.
+
+    WAL mode (default) is fast but needs all workers on the same host. For workers on several hosts
+    sharing the file over the network, set JOB_QUEUE_JOURNAL_MODE=DELETE so SQLite relies on file
+    locks only.
+    """
+    def __init__(self, db_path: str | None = None, max_attempts: int | None = None,
+                 retry_delay: float = 30.0):
+        """
+        :param db_path: Path of the SQLite file (defaults to JOB_QUEUE_PATH or
+            outputs/queue/jobs.sqlite3).
+        :param max_attempts: Attempts per job before it is marked as failed (defaults to
+            JOB_MAX_ATTEMPTS or 3).
+        :param retry_delay: Base delay in seconds before retrying a failed job (multiplied by the
+            attempt number).
+        """
+        default_path = os.path.join(OUTPUT_PATH, 'queue', 'jobs.sqlite3')
+        self.db_path = db_path or os.getenv('JOB_QUEUE_PATH', default_path)
+        self.max_attempts = max_attempts or int(os.getenv('JOB_MAX_ATTEMPTS', '3'))
+        self.retry_delay = retry_delay
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        # The connection is shared with the worker's heartbeat thread, guarded by a lock
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None,
+                                     check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute(f"PRAGMA journal_mode={os.getenv('JOB_QUEUE_JOURNAL_MODE', 'WAL')}")
+        self._conn.execute("PRAGMA busy_timeout=30000")
+        self._conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _transaction(self):
+        # BEGIN IMMEDIATE takes the write lock up front, so concurrent claims are serialized
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _insert(self, conn: sqlite3.Connection, stage: str, payload: dict,
+                dedupe_key: str | None) -> int | None:
+        now = time.time()
+        if dedupe_key:
+            existing = conn.execute(
+                "SELECT id, status FROM jobs WHERE dedupe_key = ?", (dedupe_key,)
+            ).fetchone()
+            if existing:
+                if existing['status'] in ('pending', 'leased'):
+                    return None
+                conn.execute(
+                    "UPDATE jobs SET status = 'pending', attempts = 0, payload = ?, "
+                    "available_at = ?, lease_owner = NULL, lease_expires_at = NULL, "
+                    "last_error = NULL, finished_at = NULL WHERE id = ?",
+                    (json.dumps(payload), now, existing['id'])
+                )
+                return existing['id']
+        cursor = conn.execute(
+            "INSERT INTO jobs (stage, payload, dedupe_key, max_attempts, available_at, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (stage, json.dumps(payload), dedupe_key, self.max_attempts, now, now)
+        )
+        return cursor.lastrowid
+
+    def enqueue(self, stage: str, payload: dict, dedupe_key: str | None = None) -> int | None:
+        with self._transaction() as conn:
+            return self._insert(conn, stage, payload, dedupe_key)
+
+    def _touch_worker(self, conn: sqlite3.Connection, worker_id: str, completed: int = 0,
+                      failed: int = 0, busy: float = 0.0):
+        now = time.time()
+        conn.execute(
+            "INSERT INTO workers (worker_id, host, first_seen, last_seen, completed, failed, "
+            "busy_seconds) VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(worker_id) DO UPDATE SET last_seen = excluded.last_seen, "
+            "completed = completed + excluded.completed, failed = failed + excluded.failed, "
+            "busy_seconds = busy_seconds + excluded.busy_seconds",
+            (worker_id, socket.gethostname(), now, now, completed, failed, busy)
+        )
+
+    def claim(self, worker_id: str, stages: list[str] | None, lease_seconds: float) -> dict | None:
+        stage_filter = ""
+        params: list = []
+        if stages:
+            stage_filter = f"AND stage IN ({', '.join('?' for _ in stages)})"
+            params = list(stages)
+        with self._transaction() as conn:
+            self._touch_worker(conn, worker_id)
+            while True:
+                now = time.time()
+                row = conn.execute(
+                    "SELECT id, stage, payload, attempts, max_attempts, status FROM jobs "
+                    "WHERE ((status = 'pending' AND available_at <= ?) "
+                    "OR (status = 'leased' AND lease_expires_at < ?)) "
+                    f"{stage_filter} ORDER BY id LIMIT 1",
+                    [now, now, *params]
+                ).fetchone()
+                if row is None:
+                    return None
+                if row['status'] == 'leased' and row['attempts'] >= row['max_attempts']:
+                    # The last attempt's worker died: give up on the job
+                    conn.execute(
+                        "UPDATE jobs SET status = 'failed', lease_owner = NULL, finished_at = ?, "
+                        "last_error = COALESCE(last_error, 'lease expired') WHERE id = ?",
+                        (now, row['id'])
+                    )
+                    continue
+                conn.execute(
+                    "UPDATE jobs SET status = 'leased', lease_owner = ?, lease_expires_at = ?, "
+                    "attempts = attempts + 1 WHERE id = ?",
+                    (worker_id, now + lease_seconds, row['id'])
+                )
+                return {
+                    'id': row['id'],
+                    'stage': row['stage'],
+                    'payload': json.loads(row['payload']),
+                    'attempts': row['attempts'] + 1,
+                }
+
+    def heartbeat(self, job_id: int, worker_id: str, lease_seconds: float) -> bool:
+        with self._transaction() as conn:
+            self._touch_worker(conn, worker_id)
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires_at = ? "
+                "WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+                (time.time() + lease_seconds, job_id, worker_id)
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker_id: str,
+                 next_jobs: list[tuple[str, dict, str | None]] | None = None,
+                 duration: float = 0.0) -> bool:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'done', finished_at = ?, lease_expires_at = NULL "
+                "WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+                (time.time(), job_id, worker_id)
+            )
+            if cursor.rowcount != 1:
+                return False
+            for stage, payload, dedupe_key in next_jobs or []:
+                self._insert(conn, stage, payload, dedupe_key)
+            self._touch_worker(conn, worker_id, completed=1, busy=duration)
+            return True
+
+    def fail(self, job_id: int, worker_id: str, error: str, duration: float = 0.0) -> bool:
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM jobs "
+                "WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+                (job_id, worker_id)
+            ).fetchone()
+            if row is None:
+                return False
+            now = time.time()
+            if row['attempts'] >= row['max_attempts']:
+                conn.execute(
+                    "UPDATE jobs SET status = 'failed', last_error = ?, finished_at = ?, "
+                    "lease_expires_at = NULL WHERE id = ?",
+                    (error, now, job_id)
+                )
+            else:
+                conn.execute(
+                    "UPDATE jobs SET status = 'pending', last_error = ?, available_at = ?, "
+                    "lease_owner = NULL, lease_expires_at = NULL WHERE id = ?",
+                    (error, now + self.retry_delay * row['attempts'], job_id)
+                )
+            self._touch_worker(conn, worker_id, failed=1, busy=duration)
+            return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return self._stats()
+
+    def _stats(self) -> dict:
+        now = time.time()
+        jobs: dict[str, dict[str, int]] = {}
+        for row in self._conn.execute(
+            "SELECT stage, "
+            "CASE WHEN status = 'leased' AND lease_expires_at < ? THEN 'expired' ELSE status END "
+            "AS state, COUNT(*) AS count FROM jobs GROUP BY stage, state",
+            (now,)
+        ):
+            jobs.setdefault(row['stage'], {})[row['state']] = row['count']
+
+        workers = {}
+        for row in self._conn.execute("SELECT * FROM workers ORDER BY worker_id"):
+            hours = max(now - row['first_seen'], 1.0) / 3600
+            completed = row['completed']
+            workers[row['worker_id']] = {
+                'host': row['host'],
+                'completed': row['completed'],
+                'failed': row['failed'],
+                'jobs_per_hour': round(row['completed'] / hours, 1),
+                'avg_job_seconds': round(row['busy_seconds'] / completed, 1) if completed else None,
+                'last_seen_seconds_ago': round(now - row['last_seen']),
+            }
+        return {'jobs': jobs, 'workers': workers}
@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+
+class JobQueuePort(ABC):
+    @abstractmethod
+    def enqueue(self, stage: str, payload: dict, dedupe_key: str | None = None) -> int | None:
+        """
+        Add a job to the queue.
+        :param stage: The processing stage of the job ('metadata', 'download', 'transcribe' or
+            'summarize').
+        :param payload: The job data (video URL, options and results of previous stages).
+        :param dedupe_key: Only one job with the same key can be pending or leased at a time
+            (a finished or failed job with the key is requeued).
+        :return: The job ID, or None if an equivalent job is already pending or leased.
+        """
+        pass
+
+    @abstractmethod
+    def claim(self, worker_id: str, stages: list[str] | None, lease_seconds: float) -> dict | None:
+        """
+        Atomically lease the next available job. Jobs whose lease expired are claimable again.
+        :param worker_id: The ID of the claiming worker.
+        :param stages: The stages the worker handles (None for all).
+        :param lease_seconds: How long the lease lasts without a heartbeat.
+        :return: The job ({'id', 'stage', 'payload', 'attempts'}) or None if there is no job
+            available.
+        """
+        pass
+
+    @abstractmethod
+    def heartbeat(self, job_id: int, worker_id: str, lease_seconds: float) -> bool:
+        """
+        Extend the lease of a job.
+        :return: False if the worker no longer owns the lease.
+        """
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: int, worker_id: str,
+                 next_jobs: list[tuple[str, dict, str | None]] | None = None,
+                 duration: float = 0.0) -> bool:
+        """
+        Mark a job as done and enqueue its follow-up jobs in the same transaction.
+        :param next_jobs: Follow-up jobs as (stage, payload, dedupe_key) tuples.
+        :param duration: Time spent on the job, in seconds (for throughput stats).
+        :return: False if the worker no longer owns the lease (the result must be discarded).
+        """
+        pass
+
+    @abstractmethod
+    def fail(self, job_id: int, worker_id: str, error: str, duration: float = 0.0) -> bool:
+        """
+        Record a failed attempt. The job is retried later until it runs out of attempts.
+        :return: False if the worker no longer owns the lease.
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """
+        Get queue depth and worker throughput.
+        :return: {'jobs': {stage: {status: count}}, 'workers': {worker_id: {...}}}
+        """
+        pass
@@ -0,0 +1,81 @@
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from infrastructure.outbound.file_storage.adapters.local_file_storage import OUTPUT_PATH
+from infrastructure.outbound.metrics.ports.metrics_store_port import MetricsStorePort
+
+METRICS_DIR = "metrics"
+
+class LocalMetricsStore(MetricsStorePort):
+    """
+    Metrics stored as JSON counter files and JSON Lines logs under outputs/metrics/.
+    Several processes (queue workers, main.py) update the same files, so writes are locked, and a
+    failed write is only reported: metrics must never fail the work they measure.
+    """
+    def _path(self, name: str, extension: str = "json") -> str:
+        return os.path.join(OUTPUT_PATH, METRICS_DIR, f"{name}.{extension}")
+
+    def read(self, name: str) -> dict:
+        path = self._path(name)
+        if not os.path.isfile(path):
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Could not read metrics {path}: {str(e)}")
+            return {}
+
+    @contextmanager
+    def _lock(self, path: str):
+        """Exclusive lock on a metrics file across processes (no-op without fcntl)."""
+        if fcntl is None:
+            yield
+            return
+        with open(f"{path}.lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def increment(self, name: str, counters: dict) -> dict:
+        path = self._path(name)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with self._lock(path):
+                # Read under the lock: other processes update the same counters
+                data = self.read(name)
+                for key, value in counters.items():
+                    data[key] = data.get(key, 0) + value
+                # Unique temporary file in the same directory so the replace stays atomic
+                fd, tmp_path = tempfile.mkstemp(prefix=f"{name}.", suffix=".tmp",
+                                                dir=os.path.dirname(path))
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(data, f, indent=2)
+                    os.replace(tmp_path, path)
+                except BaseException:
+                    os.remove(tmp_path)
+                    raise
+            return data
+        except Exception as e:
+            print(f"⚠️  Could not record metrics {path}: {str(e)}")
+            return {}
+
+    def append(self, name: str, record: dict) -> None:
+        path = self._path(name, "jsonl")
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            line = json.dumps(record, ensure_ascii=False) + "\n"
+            with self._lock(path), open(path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except Exception as e:
+            print(f"⚠️  Could not record metrics {path}: {str(e)}")
@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+
+class MetricsStorePort(ABC):
+    @abstractmethod
+    def increment(self, name: str, counters: dict) -> dict:
+        """
+        Add the given values to the counters of a metrics file.
+        :param name: The name of the metrics file (e.g. 'summary_continuation').
+        :param counters: The counters to add, e.g. {'summaries': 1, 'continuation_tokens': 1200}.
+        :return: The updated counters, or an empty dictionary if they could not be recorded.
+        """
+        pass
+
+    @abstractmethod
+    def read(self, name: str) -> dict:
+        """
+        Read the counters of a metrics file.
+        :param name: The name of the metrics file.
+        :return: The counters, or an empty dictionary if nothing was recorded yet.
+        """
+        pass
+
+    @abstractmethod
+    def append(self, name: str, record: dict) -> None:
+        """
+        Append a record to a metrics log.
+        :param name: The name of the metrics log (e.g. 'transcription_plans').
+        :param record: The record to append.
+        """
+        pass
@@ -1,9 +1,96 @@
-from infrastructure.outbound.transcriber.ports.audio_transcriber_port import AudioTranscriberPort
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator
+
+from infrastructure.outbound.transcriber.ports.audio_transcriber_port import (
+    AudioTranscriberPort,
+    SAMPLE_RATE,
+)
+
+# Parallel chunks overlap by this much, so a word cut at a chunk boundary is decoded whole by one of
+# them
+CHUNK_OVERLAP_SECONDS = 1.5
 
 class FasterWhisperAudioTranscriber(AudioTranscriberPort):
+    def __init__(self, model_size: str = "base", parallel_chunks: int = 1):
+        """
+        :param model_size: Whisper model size ('tiny', 'base', 'small', ...).
+        :param parallel_chunks: Split the audio into this many chunks decoded in parallel
+            (1 disables chunking).
+        """
+        self.model_size = model_size
+        self.parallel_chunks = max(1, parallel_chunks)
+
     def transcribe(self, audio_path: str, _) -> str:
-        print("Using faster-whisper for transcription...")
+        print(f"Using faster-whisper ({self.model_size}) for transcription...")
         from faster_whisper import WhisperModel
-        model = WhisperModel("base", compute_type="int8")
+        if self.parallel_chunks > 1:
+            from faster_whisper import decode_audio
+            audio = decode_audio(audio_path, sampling_rate=SAMPLE_RATE)
+            return "\n".join([seg['text'] for seg in self._transcribe_chunked(audio)])
+        model = WhisperModel(self.model_size, compute_type="int8")
         segments, _ = model.transcribe(audio_path)
         return "\n".join([seg.text for seg in segments])
+
+    def transcribe_samples(self, samples, _) -> list[dict]:
+        print(f"Using faster-whisper ({self.model_size}) for transcription...")
+        from faster_whisper import WhisperModel
+        if self.parallel_chunks > 1:
+            return self._transcribe_chunked(samples)
+        model = WhisperModel(self.model_size, compute_type="int8")
+        segments, _ = model.transcribe(samples)
+        return [{'start': seg.start, 'end': seg.end, 'text': seg.text} for seg in segments]
+
+    def _transcribe_chunked(self, audio) -> list[dict]:
+        """
+        Decode equal-length chunks of the audio in parallel, sharing the CPU cores. Each chunk is
+        decoded with CHUNK_OVERLAP_SECONDS of its neighbours and keeps only the segments centred in
+        its own part, so words at the cuts are neither lost nor duplicated.
+        """
+        from faster_whisper import WhisperModel
+        chunk_size = -(-len(audio) // self.parallel_chunks)
+        overlap = int(CHUNK_OVERLAP_SECONDS * SAMPLE_RATE)
+        chunks = [(start, min(start + chunk_size, len(audio)))
+                  for start in range(0, len(audio), chunk_size)]
+        print(f"   Decoding {len(chunks)} chunks in parallel...")
+        model = WhisperModel(
+            self.model_size,
+            compute_type="int8",
+            cpu_threads=max(1, (os.cpu_count() or 1) // len(chunks)),
+            num_workers=len(chunks),
+        )
+
+        def _transcribe_chunk(index: int) -> list[dict]:
+            start, end = chunks[index]
+            decode_start = max(0, start - overlap)
+            offset = decode_start / SAMPLE_RATE
+            segments, _ = model.transcribe(audio[decode_start:end + overlap])
+            last = index == len(chunks) - 1
+            kept = []
+            for seg in segments:
+                # Segments centred in a neighbour's part are kept by that neighbour
+                middle = offset + (seg.start + seg.end) / 2
+                if start / SAMPLE_RATE <= middle and (last or middle < end / SAMPLE_RATE):
+                    kept.append({'start': offset + seg.start, 'end': offset + seg.end,
+                                 'text': seg.text})
+            return kept
+
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            return [segment for segments in executor.map(_transcribe_chunk, range(len(chunks)))
+                    for segment in segments]
+
+    def transcribe_stream(self, windows: Iterable[tuple[float, bytes]], _) -> Iterator[dict]:
+        print(f"Using faster-whisper ({self.model_size}) for streamed transcription...")
+        import numpy as np
+        from faster_whisper import WhisperModel
+        model = WhisperModel(self.model_size, compute_type="int8")
+        previous_text = ""
+        for offset, pcm in windows:
+            samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+            # Prompt each window with the end of the previous one to keep context across window
+            # boundaries
+            segments, _ = model.transcribe(samples, initial_prompt=previous_text or None)
+            for seg in segments:
+                # Only the tail is used as prompt: do not keep hours of text
+                previous_text = (previous_text + seg.text)[-200:]
+                yield {'start': offset + seg.start, 'end': offset + seg.end, 'text': seg.text}
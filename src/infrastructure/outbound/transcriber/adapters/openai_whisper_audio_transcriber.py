@@ -1,9 +1,42 @@
+from typing import Iterable, Iterator
+
 from infrastructure.outbound.transcriber.ports.audio_transcriber_port import AudioTranscriberPort
 
 class OpenAiWhisperAudioTranscriberAdapter(AudioTranscriberPort):
+    def __init__(self, model_size: str = "base"):
+        """
+        :param model_size: Whisper model size ('tiny', 'base', 'small', ...).
+        """
+        self.model_size = model_size
+
     def transcribe(self, audio_path: str, _):
-        print("Using openai-whisper for transcription...")
+        print(f"Using openai-whisper ({self.model_size}) for transcription...")
         import whisper
-        model = whisper.load_model("base")
+        model = whisper.load_model(self.model_size)
         result = model.transcribe(audio_path)
-        return result['text']
\ No newline at end of file
+        return result['text']
+
+    def transcribe_samples(self, samples, _) -> list[dict]:
+        print(f"Using openai-whisper ({self.model_size}) for transcription...")
+        import whisper
+        model = whisper.load_model(self.model_size)
+        result = model.transcribe(samples)
+        return [{'start': seg['start'], 'end': seg['end'], 'text': seg['text']}
+                for seg in result['segments']]
+
+    def transcribe_stream(self, windows: Iterable[tuple[float, bytes]], _) -> Iterator[dict]:
+        print(f"Using openai-whisper ({self.model_size}) for streamed transcription...")
+        import numpy as np
+        import whisper
+        model = whisper.load_model(self.model_size)
+        previous_text = ""
+        for offset, pcm in windows:
+            samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+            # Prompt each window with the end of the previous one to keep context across window
+            # boundaries
+            result = model.transcribe(samples, initial_prompt=previous_text or None)
+            for seg in result['segments']:
+                # Only the tail is used as prompt: do not keep hours of text
+                previous_text = (previous_text + seg['text'])[-200:]
+                yield {'start': offset + seg['start'], 'end': offset + seg['end'],
+                       'text': seg['text']}
@@ -1,4 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
+
+# Streamed audio windows are raw 16-bit little-endian mono PCM at this sample rate (what Whisper
+# expects)
+SAMPLE_RATE = 16000
 
 class AudioTranscriberPort(ABC):
     @abstractmethod
@@ -10,3 +15,25 @@ class AudioTranscriberPort(ABC):
         :return: The transcribed text.
         """
         pass
+
+    @abstractmethod
+    def transcribe_samples(self, samples, lang: str | None) -> list[dict]:
+        """
+        Transcribe decoded audio samples (e.g. the speech-only audio left after silence trimming).
+        :param samples: 16 kHz mono float32 samples (numpy array).
+        :param lang: The language code for the transcription (default is 'en').
+        :return: The segments ({'start', 'end', 'text'}) with timestamps relative to the samples.
+        """
+        pass
+
+    @abstractmethod
+    def transcribe_stream(self, windows: Iterable[tuple[float, bytes]],
+                          lang: str | None) -> Iterator[dict]:
+        """
+        Transcribe streamed audio windows as soon as they are available.
+        :param windows: An iterable of (offset in seconds, 16 kHz mono s16le PCM bytes) windows.
+        :param lang: The language code for the transcription (default is 'en').
+        :return: An iterator of segments ({'start', 'end', 'text'}) with timestamps on the original
+            timeline.
+        """
+        pass
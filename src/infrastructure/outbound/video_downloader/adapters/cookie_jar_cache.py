@@ -0,0 +1,139 @@
+import atexit
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from infrastructure.outbound.file_storage.adapters.local_file_storage import OUTPUT_PATH
+
+DEFAULT_CACHE_FILE = os.path.join(OUTPUT_PATH, 'cache', 'cookies.txt')
+
+# Cookie file resolved by this process: {'path', 'source', 'expires_at'}
+_resolved: dict | None = None
+_resolve_lock = threading.Lock()
+
+
+def _read_stamp(cache_path: str) -> dict | None:
+    # yt-dlp rewrites the cookie file it is given, so the export time is kept in a sidecar file
+    # instead of the mtime
+    try:
+        with open(f"{cache_path}.json", "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+@contextmanager
+def _export_lock(cache_path: str):
+    """
+    Exclusive lock across processes so a single worker exports the browser cookies (no-op without
+    fcntl).
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(f"{cache_path}.lock", "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _export_browser_cookies(browser: str, cache_path: str):
+    from yt_dlp.cookies import extract_cookies_from_browser
+
+    print(f"🍪 Exporting cookies from {browser} browser...")
+    jar = extract_cookies_from_browser(browser)
+    # Write to a temporary file first so other processes never read a half-written jar
+    tmp_path = f"{cache_path}.tmp"
+    jar.save(tmp_path, ignore_discard=True, ignore_expires=True)
+    os.replace(tmp_path, cache_path)
+    with open(f"{cache_path}.json.tmp", "w", encoding="utf-8") as f:
+        json.dump({'browser': browser, 'exported_at': time.time()}, f)
+    os.replace(f"{cache_path}.json.tmp", f"{cache_path}.json")
+    print(f"🍪 Saved {len(jar)} cookies to {cache_path}")
+
+
+def _refresh_cache(browser: str, cache_path: str, ttl: float) -> tuple[str | None, float]:
+    """Return the shared cookie file and the time it was exported, exporting it again when stale."""
+    os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+    with _export_lock(cache_path):
+        # Checked under the lock: another process may have just refreshed it
+        stamp = _read_stamp(cache_path)
+        if (stamp and stamp.get('browser') == browser and os.path.isfile(cache_path)
+                and time.time() - stamp['exported_at'] < ttl):
+            return cache_path, stamp['exported_at']
+        try:
+            _export_browser_cookies(browser, cache_path)
+            return cache_path, time.time()
+        except Exception as e:
+            print(f"⚠️  Could not load cookies from {browser}: {str(e)}")
+            if stamp and os.path.isfile(cache_path):
+                print(f"   Using the previous export from {cache_path}")
+                return cache_path, stamp['exported_at']
+            print("   Continuing without cookies - may fail on some videos")
+            return None, time.time()
+
+
+def _private_copy(shared_path: str) -> str:
+    """
+    Copy the shared cookie file for this process. yt-dlp saves the jar back to its cookie file when
+    it closes, and concurrent workers writing the shared file would corrupt it for each other.
+    """
+    fd, path = tempfile.mkstemp(prefix='video_transcriber_cookies_', suffix='.txt')
+    os.close(fd)
+    shutil.copyfile(shared_path, path)
+    atexit.register(lambda: os.path.exists(path) and os.remove(path))
+    return path
+
+
+def resolve_cookie_file() -> str | None:
+    """
+    Resolve the Netscape cookie file for yt-dlp once per TTL instead of decrypting the browser's
+    cookie database for every download.
+    YT_DLP_COOKIES_FILE: explicit cookie file (for servers without a browser).
+    YT_DLP_COOKIES_BROWSER: browser to export cookies from (default 'chrome', 'none' disables
+    cookies).
+    YT_DLP_COOKIES_CACHE: shared export file (default outputs/cache/cookies.txt).
+    YT_DLP_COOKIES_TTL: seconds before the export is refreshed from the browser (default 3600).
+    :return: The path of this process's copy of the cookie file, or None to continue without
+        cookies.
+    """
+    global _resolved
+    with _resolve_lock:
+        if _resolved and time.time() < _resolved['expires_at']:
+            return _resolved['path']
+
+        ttl = float(os.getenv('YT_DLP_COOKIES_TTL', '3600'))
+        cookies_file = os.getenv('YT_DLP_COOKIES_FILE')
+        browser = os.getenv('YT_DLP_COOKIES_BROWSER', 'chrome')
+        if cookies_file:
+            if not os.path.isfile(cookies_file):
+                raise FileNotFoundError(
+                    f"Cookie file not found: {cookies_file} (YT_DLP_COOKIES_FILE)"
+                )
+            # The file may be replaced by an external job: check it again after the TTL
+            shared_path, source, expires_at = cookies_file, cookies_file, time.time() + ttl
+        elif browser.lower() == 'none':
+            shared_path, source, expires_at = None, None, float('inf')
+        else:
+            cache_path = os.getenv('YT_DLP_COOKIES_CACHE', DEFAULT_CACHE_FILE)
+            shared_path, exported_at = _refresh_cache(browser, cache_path, ttl)
+            source, expires_at = f"{browser} browser", exported_at + ttl
+
+        if _resolved and _resolved['path'] and os.path.exists(_resolved['path']):
+            os.remove(_resolved['path'])
+        path = _private_copy(shared_path) if shared_path else None
+        if path:
+            print(f"🍪 Using cookies from {source}")
+        _resolved = {'path': path, 'expires_at': expires_at}
+        return path
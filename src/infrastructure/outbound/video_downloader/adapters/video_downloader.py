@@ -1,17 +1,25 @@
 import os
+import queue
 import re
-from typing import LiteralString
+import subprocess
+import sys
+import threading
+from datetime import datetime, timezone
+from typing import Iterator, LiteralString
 import yt_dlp
+from infrastructure.outbound.video_downloader.adapters.cookie_jar_cache import resolve_cookie_file
+from infrastructure.outbound.transcriber.ports.audio_transcriber_port import SAMPLE_RATE
 from infrastructure.outbound.video_downloader.ports.video_downloader_port import VideoDownloaderPort
 
 class VideoDownloader(VideoDownloaderPort):
     def _get_base_opts(self) -> dict:
         """
         Get base yt-dlp options with cookie support to avoid bot detection.
-        Uses browser cookies (tries Chrome first, then Firefox, then others).
-        Set YT_DLP_COOKIES_BROWSER env var to specify browser (e.g., 'chrome', 'firefox', 'safari').
+        Browser cookies are exported once to a cached Netscape cookie file shared by all instances
+        and worker processes (see resolve_cookie_file). Set YT_DLP_COOKIES_BROWSER to specify the
+        browser (e.g., 'chrome', 'firefox', 'safari') or YT_DLP_COOKIES_FILE to use an existing
+        cookie file.
         """
-        browser = os.getenv('YT_DLP_COOKIES_BROWSER', 'chrome')
         opts = {
             # Use iOS and Android TV clients to avoid bot detection
             'extractor_args': {
@@ -29,14 +37,11 @@ class VideoDownloader(VideoDownloaderPort):
             },
         }
         
-        # Try to use cookies from browser to avoid bot detection
-        try:
-            opts['cookiesfrombrowser'] = (browser,)
-            print(f"🍪 Using cookies from {browser} browser")
-        except Exception as e:
-            print(f"⚠️  Could not load cookies from {browser}: {str(e)}")
-            print("   Continuing without cookies - may fail on some videos")
-        
+        # Use cookies to avoid bot detection
+        cookie_file = resolve_cookie_file()
+        if cookie_file:
+            opts['cookiefile'] = cookie_file
+
         return opts
     
     def _clean_vtt(self, file_path: str):
@@ -68,17 +73,18 @@ class VideoDownloader(VideoDownloaderPort):
             print("No subtitles found.")
             return None
 
-    def download_audio(self, url: str) -> str:
+    def download_audio(self, url: str, output_name: str = 'audio') -> str:
         """
         Download the video from the given URL and return the path to the downloaded video file.
         :param url: The URL of the video to download.
+        :param output_name: The path of the audio file without extension.
         :return: The path to the downloaded video file.
         """
         print("Downloading audio...")
         ydl_opts = self._get_base_opts()
         ydl_opts.update({
             'format': 'bestaudio/best',
-            'outtmpl': 'audio.%(ext)s',
+            'outtmpl': f'{output_name}.%(ext)s',
             'postprocessors': [{
                 'key': 'FFmpegExtractAudio',
                 'preferredcodec': 'mp3',
@@ -87,7 +93,103 @@ class VideoDownloader(VideoDownloaderPort):
         })
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             ydl.download([url])
-        return 'audio.mp3'
+        return f'{output_name}.mp3'
+
+    def _get_cli_args(self) -> list[str]:
+        """Translate the base yt-dlp options into command-line arguments for the yt-dlp CLI."""
+        opts = self._get_base_opts()
+        args = []
+        for key, value in opts.get('extractor_args', {}).get('youtube', {}).items():
+            args += ['--extractor-args', f"youtube:{key}={','.join(value)}"]
+        for header, value in opts.get('http_headers', {}).items():
+            args += ['--add-headers', f"{header}:{value}"]
+        if 'cookiefile' in opts:
+            args += ['--cookies', opts['cookiefile']]
+        return args
+
+    def stream_audio(self, url: str, window_seconds: float = 30.0,
+                     max_buffered_windows: int = 4) -> Iterator[tuple[float, bytes]]:
+        """
+        Stream the audio of a video as fixed-size PCM windows while it is still downloading.
+        yt-dlp writes the raw stream to stdout, ffmpeg decodes it to 16 kHz mono s16le, and a reader
+        thread cuts it into windows. At most `max_buffered_windows` windows are held in memory: when
+        the consumer is slower, the reader blocks, the pipes fill up and ffmpeg and yt-dlp stall
+        (backpressure).
+        :param url: The URL of the video.
+        :param window_seconds: The length of each window in seconds.
+        :param max_buffered_windows: The maximum number of decoded windows waiting to be consumed.
+        :return: An iterator of (offset in seconds, PCM bytes) windows.
+        """
+        print("Streaming audio...")
+        ydl_proc = subprocess.Popen(
+            [sys.executable, '-m', 'yt_dlp', '--quiet', '--no-warnings', '-f', 'bestaudio/best',
+             '-o', '-', *self._get_cli_args(), url],
+            stdout=subprocess.PIPE,
+        )
+        try:
+            ffmpeg_proc = subprocess.Popen(
+                ['ffmpeg', '-loglevel', 'error', '-i', 'pipe:0',
+                 '-f', 's16le', '-ac', '1', '-ar', str(SAMPLE_RATE), 'pipe:1'],
+                stdin=ydl_proc.stdout,
+                stdout=subprocess.PIPE,
+            )
+        except Exception:
+            ydl_proc.kill()
+            raise
+        ydl_proc.stdout.close()  # ffmpeg owns the pipe now, so yt-dlp gets SIGPIPE if ffmpeg exits
+
+        window_bytes = int(window_seconds * SAMPLE_RATE) * 2  # 2 bytes per s16le sample
+        windows: queue.Queue = queue.Queue(maxsize=max_buffered_windows)
+        stop = threading.Event()
+
+        def _put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    windows.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _read_windows():
+            buffer = bytearray()
+            offset = 0.0
+            try:
+                while chunk := ffmpeg_proc.stdout.read(65536):
+                    buffer.extend(chunk)
+                    while len(buffer) >= window_bytes:
+                        if not _put((offset, bytes(buffer[:window_bytes]))):
+                            return
+                        del buffer[:window_bytes]
+                        offset += window_seconds
+                if buffer:
+                    _put((offset, bytes(buffer)))
+            finally:
+                _put(None)
+
+        reader = threading.Thread(target=_read_windows, daemon=True)
+        reader.start()
+        completed = False
+        try:
+            while (window := windows.get()) is not None:
+                yield window
+            completed = True
+        finally:
+            stop.set()
+            for proc in (ffmpeg_proc, ydl_proc):
+                # Only killed when the consumer stopped early, otherwise their exit code matters
+                if not completed and proc.poll() is None:
+                    proc.kill()
+                proc.wait()
+            reader.join(timeout=1)
+
+        # yt-dlp dying mid-download (network drop, 403, timeout) ends ffmpeg's input like a
+        # normal EOF: fail instead of returning a truncated stream
+        if ydl_proc.returncode != 0 or ffmpeg_proc.returncode != 0:
+            raise Exception(
+                f"Could not stream audio (yt-dlp exit code {ydl_proc.returncode}, "
+                f"ffmpeg exit code {ffmpeg_proc.returncode})"
+            )
 
     def get_video_info(self, url: str) -> dict:
         """
@@ -99,6 +201,7 @@ class VideoDownloader(VideoDownloaderPort):
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             info = ydl.extract_info(url, download=False)
         video_info = {
+            'id': info.get('id'),
             'title': info.get('title'),
             'duration': info.get('duration'),
             'uploader': info.get('uploader'),
@@ -106,6 +209,7 @@ class VideoDownloader(VideoDownloaderPort):
             'like_count': info.get('like_count'),
             'description': info.get('description'),
             'webpage_url': info.get('webpage_url'),
+            'upload_date': info.get('upload_date'),
         }
 
         print("\n--- VIDEO INFO ---\n")
@@ -114,3 +218,47 @@ class VideoDownloader(VideoDownloaderPort):
         print("\n------------------\n")
 
         return video_info
+
+    def list_entries(self, url: str, limit: int | None = None,
+                     date_after: str | None = None) -> list[dict]:
+        """
+        List the videos of a playlist or channel with a single flat extraction
+        (entries are not resolved).
+        :param url: The URL of the playlist or channel.
+        :param limit: Maximum number of entries to list (newest first for channels).
+        :param date_after: Only keep entries uploaded on or after this date (YYYYMMDD).
+            Flat entries without a known date are kept and filtered once their metadata is fetched.
+        :return: A list of dictionaries with 'id', 'title', 'url' and 'upload_date'.
+        """
+        ydl_opts = self._get_base_opts()
+        ydl_opts.update({
+            'extract_flat': 'in_playlist',
+            'skip_download': True,
+        })
+        if limit:
+            ydl_opts['playlistend'] = limit
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=False)
+
+        entries = []
+        for entry in info.get('entries') or []:
+            if not entry or not entry.get('id'):
+                continue
+            if entry.get('ie_key') == 'YoutubeTab':
+                # Channel root URLs list their tabs instead of videos
+                print(f"⚠️  Skipping channel tab {entry.get('url')} - "
+                      "use the channel's /videos URL instead")
+                continue
+            upload_date = entry.get('upload_date')
+            if not upload_date and entry.get('timestamp'):
+                uploaded_at = datetime.fromtimestamp(entry['timestamp'], timezone.utc)
+                upload_date = uploaded_at.strftime('%Y%m%d')
+            if date_after and upload_date and upload_date < date_after:
+                continue
+            entries.append({
+                'id': entry['id'],
+                'title': entry.get('title'),
+                'url': entry.get('webpage_url') or entry.get('url'),
+                'upload_date': upload_date,
+            })
+        return entries
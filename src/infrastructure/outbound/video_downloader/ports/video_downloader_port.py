@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import LiteralString
+from typing import Iterator, LiteralString
 
 class VideoDownloaderPort(ABC):
     @abstractmethod
@@ -11,5 +11,15 @@ class VideoDownloaderPort(ABC):
         pass
 
     @abstractmethod
-    def download_audio(self, url: str) -> str:
-        pass
\ No newline at end of file
+    def download_audio(self, url: str, output_name: str = 'audio') -> str:
+        pass
+
+    @abstractmethod
+    def stream_audio(self, url: str, window_seconds: float = 30.0,
+                     max_buffered_windows: int = 4) -> Iterator[tuple[float, bytes]]:
+        pass
+
+    @abstractmethod
+    def list_entries(self, url: str, limit: int | None = None,
+                     date_after: str | None = None) -> list[dict]:
+        pass
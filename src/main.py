@@ -6,6 +6,10 @@ from infrastructure.inbound.console.ports.user_input_port import UserInputPort
 from application.transcription.services.transcription_service import transcribe
 from application.transcription.services.video_downloader_service import get_video_info
 from application.transcription.services.llm_markdown_service import transcription_to_markdown
+from application.transcription.services.sync_service import get_pending_entries
+from application.transcription.services.job_worker_service import enqueue_video
+from infrastructure.outbound.archive.adapters.local_processed_archive import LocalProcessedArchive
+from infrastructure.outbound.archive.ports.processed_archive_port import ProcessedArchivePort
 from infrastructure.outbound.file_storage.adapters.local_file_storage import LocalFileStorage
 from infrastructure.outbound.file_storage.ports.file_storage_port import FileStoragePort
 
@@ -22,28 +26,43 @@ def extract_video_id(url: str) -> str:
             return match.group(1)
     return "video"
 
-# === Main ===
-def main():
-    # Dependencies
-    user_input: UserInputPort = ConsoleUserInputAdapter()
-    args = user_input.get_user_input()
-
+def process_video(url: str, args, archive: ProcessedArchivePort, video_id: str | None = None):
+    """
+    Fetch, transcribe and summarize a single video, recording each stage in the processed-items archive.
+    :param url: The URL of the video.
+    :param args: The parsed command-line arguments.
+    :param archive: The processed-items archive.
+    :param video_id: The platform video ID, if already known (e.g. from a playlist listing).
+    """
     # Get video metadata (lightweight operation, just fetches info)
     print("\n📹 Fetching video information...")
     try:
-        video_info = get_video_info(args.url)
+        video_info = get_video_info(url)
         video_title = video_info.get('title')
+        video_id = video_id or video_info.get('id')
+        if video_id:
+            archive.mark(video_id, 'metadata', 'done', title=video_title)
     except Exception as e:
         print(f"\n⚠️  Could not fetch video info: {str(e)[:100]}...")
         print("   This may be due to YouTube bot detection.")
         print("   Continuing with fallback video ID...\n")
-        video_id = extract_video_id(args.url)
+        video_id = video_id or extract_video_id(url)
         video_title = f"video_{video_id}"
+        # The generic fallback ID is shared by every unrecognised URL: do not archive under it
+        if video_id == "video":
+            video_id = None
         video_info = {
             'title': video_title,
             'duration': 0,
-            'webpage_url': args.url,
+            'webpage_url': url,
         }
+
+    upload_date = video_info.get('upload_date')
+    if args.date_after and upload_date and upload_date < args.date_after:
+        print(f"\n⏭️  Skipping video uploaded on {upload_date} (before {args.date_after})")
+        if video_id:
+            archive.mark(video_id, 'metadata', 'skipped', title=video_title, upload_date=upload_date)
+        return
     
     # Check if this video has already been processed
     file_storage: FileStoragePort = LocalFileStorage()
@@ -53,33 +72,105 @@ def main():
     transcription_exists = file_storage.exists(transcription_path)
     summary_exists = file_storage.exists(summary_path)
     
-    if transcription_exists and summary_exists:
+    # Sectioned summaries are always rebuilt from the section cache so transcript edits reach them
+    if transcription_exists and summary_exists and not args.sectioned:
         print(f"\n✅ Video already fully processed!")
         print(f"   📄 Transcription: {transcription_path}")
         print(f"   📝 Summary: {summary_path}")
         print(f"\n💡 Tip: Delete these files if you want to reprocess the video.")
+        if video_id:
+            archive.mark(video_id, 'transcription', 'done', title=video_title)
+            archive.mark(video_id, 'summary', 'done', title=video_title)
         return
     
     if transcription_exists:
         print(f"\n📄 Found existing transcription, skipping video download...")
     
-    if summary_exists:
+    if summary_exists and not args.sectioned:
         print(f"\n📝 Found existing summary, will skip LLM processing...")
 
-    transcription = transcribe(
-        url=args.url,
-        video_name=video_title,
-        audo_transcriber_model=args.transcript_model,    
-        lang=args.lang
-    )
+    stage = 'transcription'
+    try:
+        transcription = transcribe(
+            url=url,
+            video_name=video_title,
+            audo_transcriber_model=args.transcript_model,    
+            lang=args.lang,
+            stream=args.stream,
+            deadline=args.deadline,
+            duration=video_info.get('duration'),
+            vad=args.vad
+        )
+        if video_id:
+            archive.mark(video_id, stage, 'done', title=video_title)
+
+        stage = 'summary'
+        transcription_to_markdown(
+            transcription,
+            model=args.llm_model,
+            video_info=video_info,
+            lang=args.lang,
+            enrich_text=args.enrich_text,
+            sectioned=args.sectioned
+        )
+        if video_id:
+            archive.mark(video_id, stage, 'done', title=video_title)
+    except Exception:
+        if video_id:
+            archive.mark(video_id, stage, 'failed', title=video_title)
+        raise
+
+# === Main ===
+def main():
+    # Dependencies
+    user_input: UserInputPort = ConsoleUserInputAdapter()
+    args = user_input.get_user_input()
+    archive: ProcessedArchivePort = LocalProcessedArchive()
+
+    job_options = {
+        'lang': args.lang,
+        'transcript_model': args.transcript_model,
+        'llm_model': args.llm_model,
+        'enrich_text': args.enrich_text,
+        'sectioned': args.sectioned,
+        'vad': args.vad,
+        'deadline': args.deadline,
+        'date_after': args.date_after,
+    }
+
+    if not args.sync:
+        if args.enqueue:
+            video_id = extract_video_id(args.url)
+            video_id = video_id if video_id != "video" else None
+            queued = enqueue_video(args.url, job_options, video_id=video_id)
+            print(f"\n📥 {'Queued' if queued else 'Already queued'}: {args.url}")
+            return
+        process_video(args.url, args, archive)
+        return
+
+    pending = get_pending_entries(args.url, limit=args.limit, date_after=args.date_after)
+    if not pending:
+        print("\n✅ Nothing to sync, all videos already processed!")
+        return
+
+    if args.enqueue:
+        queued = sum(1 for entry in pending
+                     if enqueue_video(entry['url'], job_options, video_id=entry['id']))
+        print(f"\n📥 Queued {queued} videos for the workers "
+              f"({len(pending) - queued} already queued)")
+        return
+
+    failed = 0
+    for i, entry in enumerate(pending, start=1):
+        print(f"\n=== [{i}/{len(pending)}] {entry.get('title') or entry['id']} ===")
+        try:
+            process_video(entry['url'], args, archive, video_id=entry['id'])
+        except Exception as e:
+            failed += 1
+            print(f"\n❌ Failed to process {entry['url']}: {str(e)[:200]}")
+            print("   It will be retried on the next sync.")
 
-    transcription_to_markdown(
-        transcription,
-        model=args.llm_model,
-        video_info=video_info,
-        lang=args.lang,
-        enrich_text=args.enrich_text
-    )
+    print(f"\n✅ Sync complete: {len(pending) - failed} processed, {failed} failed")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,27 @@
+from dotenv import load_dotenv
+
+from infrastructure.inbound.console.adapters.console_worker_input_adapter import (
+    ConsoleWorkerInputAdapter,
+)
+from infrastructure.inbound.console.ports.user_input_port import UserInputPort
+from application.transcription.services.job_worker_service import print_queue_stats, run_worker
+
+load_dotenv()
+
+# === Worker ===
+def main():
+    user_input: UserInputPort = ConsoleWorkerInputAdapter()
+    args = user_input.get_user_input()
+
+    if args.stats:
+        print_queue_stats()
+        return
+
+    try:
+        run_worker(worker_id=args.worker_id, stages=args.stages, lease_seconds=args.lease_seconds,
+                   once=args.once)
+    except KeyboardInterrupt:
+        print("\n👋 Worker stopped")
+
+if __name__ == "__main__":
+    main()
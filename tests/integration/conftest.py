@@ -0,0 +1,134 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+SUMMARY = "\n".join(
+    ["# Title", "", "## Summary", "Overview.", "", "## Index", "- Topic", "", "## Topic"]
+    + [f"Detail {i}." for i in range(60)]
+    + ["", "## Conclusion", "Wrap-up."]
+)
+
+
+class StubServer:
+    """Local HTTP server answering LLM API requests; records every request it receives."""
+    def __init__(self, handler_class):
+        self.requests: list[tuple[str, dict]] = []
+        self.fail = False
+        self.context_length = 16384
+        server = self
+
+        class Handler(handler_class):
+            stub = server
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+
+    def paths(self, path: str) -> list[dict]:
+        return [body for request_path, body in self.requests if request_path == path]
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class _JsonHandler(BaseHTTPRequestHandler):
+    stub: StubServer
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, obj: dict, status: int = 200):
+        body = json.dumps(obj).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> dict:
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        self.stub.requests.append((self.path, body))
+        return body
+
+
+class OpenAIHandler(_JsonHandler):
+    """OpenAI-compatible server (LM Studio, vLLM, llama.cpp): model list and chat completions."""
+    def do_GET(self):
+        if self.path == '/v1/models':
+            self._send_json({'object': 'list', 'data': [
+                {'id': 'test-model', 'object': 'model', 'created': 0, 'owned_by': 'stub'}
+            ]})
+
+    def do_POST(self):
+        body = self._read_body()
+        if self.stub.fail:
+            return self._send_json({'error': {'message': 'backend failure'}}, status=500)
+        self._send_json({
+            'id': 'chatcmpl-1', 'object': 'chat.completion', 'created': 0, 'model': body['model'],
+            'choices': [{'index': 0, 'finish_reason': 'stop',
+                         'message': {'role': 'assistant', 'content': SUMMARY}}],
+            'usage': {'prompt_tokens': 100, 'completion_tokens': 100, 'total_tokens': 200},
+        })
+
+
+class OllamaHandler(_JsonHandler):
+    """Ollama server: model list, model info and streamed generation (4 characters per token)."""
+    def do_GET(self):
+        if self.path == '/api/tags':
+            self._send_json({'models': [{'name': 'gemma3:latest', 'model': 'gemma3:latest'}]})
+
+    def do_POST(self):
+        body = self._read_body()
+        if self.path == '/api/show':
+            model_info = {'gemma3.context_length': self.stub.context_length}
+            return self._send_json({'model_info': model_info})
+        if not body.get('prompt'):
+            # An empty prompt only loads the model
+            return self._send_json({'model': body['model'], 'response': '', 'done': True})
+        num_ctx = body.get('options', {}).get('num_ctx', 2048)
+        prompt_tokens = (len(body.get('system', '')) + len(body['prompt'])) // 4
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.end_headers()
+        for line in SUMMARY.splitlines(keepends=True):
+            chunk = {'model': body['model'], 'response': line, 'done': False}
+            self.wfile.write((json.dumps(chunk) + '\n').encode())
+        # Like Ollama, prompts longer than num_ctx are truncated to it
+        final = {'model': body['model'], 'response': '', 'done': True,
+                 'prompt_eval_count': min(prompt_tokens, num_ctx), 'eval_count': 100}
+        self.wfile.write((json.dumps(final) + '\n').encode())
+
+
+@pytest.fixture(autouse=True)
+def outputs_dir(tmp_path, monkeypatch):
+    """Metrics and lock files are written under outputs/ in the working directory."""
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def openai_stub_factory():
+    servers = []
+
+    def create() -> StubServer:
+        servers.append(StubServer(OpenAIHandler))
+        return servers[-1]
+
+    yield create
+    for server in servers:
+        server.close()
+
+
+@pytest.fixture
+def ollama_stub(monkeypatch):
+    ollama_agent = pytest.importorskip(
+        'infrastructure.outbound.agents.adapters.summarizer_ollama_agent',
+        exc_type=ImportError
+    )
+    # Every test starts with the model unloaded
+    monkeypatch.setattr(ollama_agent.SummarizerOllamaAgent, '_warmed', set())
+    server = StubServer(OllamaHandler)
+    yield server
+    server.close()
@@ -0,0 +1,113 @@
+import pytest
+
+from infrastructure.outbound.agents.ports.summarizer_agent import ContextWindowExceededError
+from infrastructure.outbound.metrics.adapters.local_metrics_store import LocalMetricsStore
+
+
+@pytest.fixture(autouse=True)
+def ollama_env(monkeypatch):
+    """Start from the default Ollama settings whatever the local environment sets."""
+    for name in ('OLLAMA_MAX_CTX', 'OLLAMA_WARM_CTX', 'OLLAMA_KEEP_ALIVE', 'OLLAMA_OUTPUT_TOKENS',
+                 'OLLAMA_CONTEXT_OVERFLOW'):
+        monkeypatch.delenv(name, raising=False)
+
+
+def _agent(stub):
+    from infrastructure.outbound.agents.adapters.summarizer_ollama_agent import (
+        SummarizerOllamaAgent,
+    )
+    return SummarizerOllamaAgent('gemma3', host=stub.url)
+
+
+def _generate_requests(stub) -> list[dict]:
+    return [body for body in stub.paths('/api/generate') if body.get('prompt')]
+
+
+def _overestimate_chars_per_token(ratio: float):
+    """Record a calibration that makes the agent underestimate the prompt tokens."""
+    LocalMetricsStore().increment('ollama_context', {
+        'gemma3.prompt_chars': int(1000 * ratio), 'gemma3.prompt_tokens': 1000,
+    })
+
+
+def test_model_is_loaded_at_a_modest_context_with_keep_alive(ollama_stub, monkeypatch):
+    """The warm-up loads the model at the default warm context, not the model's full context."""
+    monkeypatch.setenv('OLLAMA_KEEP_ALIVE', '-1')
+    agent = _agent(ollama_stub)
+
+    warm_up = ollama_stub.paths('/api/generate')
+    assert len(warm_up) == 1
+    assert warm_up[0]['prompt'] == ''
+    assert warm_up[0]['options']['num_ctx'] == 8192 < agent.max_ctx
+    assert warm_up[0]['keep_alive'] == -1
+
+
+def test_short_prompt_is_sent_with_a_small_context(ollama_stub, monkeypatch):
+    """Under the default settings a short prompt stays at the warm context; a long one grows it."""
+    monkeypatch.setenv('OLLAMA_OUTPUT_TOKENS', '1024')
+    agent = _agent(ollama_stub)
+
+    agent.generate("system", "short prompt")
+    agent.generate("system", "word " * 8000)
+
+    requests = _generate_requests(ollama_stub)
+    assert [body['options']['num_ctx'] for body in requests] == [8192, agent.max_ctx]
+
+
+def test_model_is_loaded_once_per_process(ollama_stub):
+    """A second agent for the same server and model does not load it again."""
+    _agent(ollama_stub)
+    _agent(ollama_stub)
+    assert len(ollama_stub.paths('/api/generate')) == 1
+
+
+def test_context_is_sized_for_the_prompt_and_never_shrinks(ollama_stub, monkeypatch):
+    """num_ctx grows in powers of two to fit prompt and output, and keep_alive is sent each time."""
+    monkeypatch.setenv('OLLAMA_WARM_CTX', '2048')
+    monkeypatch.setenv('OLLAMA_OUTPUT_TOKENS', '1024')
+    agent = _agent(ollama_stub)
+    assert ollama_stub.paths('/api/generate')[0]['options']['num_ctx'] == 2048
+
+    agent.generate("system", "x" * 7000)
+    agent.generate("system", "short prompt")
+
+    requests = _generate_requests(ollama_stub)
+    # ~2000 prompt tokens at 3.5 characters per token + 1024 for the output
+    assert [body['options']['num_ctx'] for body in requests] == [4096, 4096]
+    assert [body['keep_alive'] for body in requests] == ['30m', '30m']
+
+
+def test_truncated_prompt_is_retried_with_a_larger_context(ollama_stub, monkeypatch):
+    """A prompt filling num_ctx was truncated by Ollama: it is sent again with a larger context."""
+    monkeypatch.setenv('OLLAMA_MAX_CTX', '32768')
+    ollama_stub.context_length = 32768
+    _overestimate_chars_per_token(20)
+    agent = _agent(ollama_stub)
+
+    # ~25000 real tokens (4 characters per token), estimated at ~5000
+    summary = agent.organize_transcription("word " * 20000, video_info={}, lang='en')
+
+    assert summary.startswith("# Title")
+    num_ctx = [body['options']['num_ctx'] for body in _generate_requests(ollama_stub)]
+    assert num_ctx[:2] == [16384, 32768]
+
+
+def test_truncated_prompt_at_the_largest_context_raises(ollama_stub):
+    """With the 'chunk' policy a prompt truncated at the largest context falls back to chunking."""
+    _overestimate_chars_per_token(20)
+    agent = _agent(ollama_stub)
+
+    with pytest.raises(ContextWindowExceededError):
+        agent.organize_transcription("word " * 20000, video_info={}, lang='en')
+
+
+def test_truncated_prompt_with_truncate_policy_only_warns(ollama_stub, monkeypatch):
+    """The 'truncate' policy keeps the response of a prompt truncated at the largest context."""
+    monkeypatch.setenv('OLLAMA_CONTEXT_OVERFLOW', 'truncate')
+    _overestimate_chars_per_token(20)
+    agent = _agent(ollama_stub)
+
+    summary = agent.organize_transcription("word " * 20000, video_info={}, lang='en')
+
+    assert summary.startswith("# Title")
+    assert agent.num_ctx == ollama_stub.context_length
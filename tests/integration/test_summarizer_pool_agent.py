@@ -0,0 +1,95 @@
+import pytest
+
+pytest.importorskip('openai')
+
+from infrastructure.outbound.agents.adapters.summarizer_pool_agent import (  # noqa: E402
+    LLMBackend,
+    SummarizerPoolAgent,
+)
+
+
+def _openai_backend(name: str, stub, **kwargs) -> LLMBackend:
+    return LLMBackend(name=name, type='openai', base_url=f"{stub.url}/v1", api_key='not-needed',
+                      timeout=5, **kwargs)
+
+
+def test_failed_backend_fails_over_without_client_retries(openai_stub_factory):
+    """A failing backend gets a single request (no openai retries) and the next backend answers."""
+    failing, healthy = openai_stub_factory(), openai_stub_factory()
+    failing.fail = True
+    pool = SummarizerPoolAgent('test-model', [_openai_backend('failing', failing),
+                                              _openai_backend('healthy', healthy)])
+
+    assert pool.generate("system", "prompt").startswith("# Title")
+
+    assert len(failing.paths('/v1/chat/completions')) == 1
+    assert len(healthy.paths('/v1/chat/completions')) == 1
+    stats = pool.get_stats()
+    assert stats['failing']['failures'] == 1
+    assert stats['healthy']['successes'] == 1
+    assert stats['failing']['in_flight'] == stats['healthy']['in_flight'] == 0
+
+
+def test_circuit_opens_after_consecutive_failures(openai_stub_factory):
+    """A backend failing `failure_threshold` times in a row stops receiving requests."""
+    failing, healthy = openai_stub_factory(), openai_stub_factory()
+    failing.fail = True
+    pool = SummarizerPoolAgent('test-model', [_openai_backend('failing', failing),
+                                              _openai_backend('healthy', healthy)],
+                               failure_threshold=2, cooldown_seconds=60)
+
+    for _ in range(3):
+        pool.generate("system", "prompt")
+
+    assert len(failing.paths('/v1/chat/completions')) == 2
+    assert len(healthy.paths('/v1/chat/completions')) == 3
+    assert pool.get_stats()['failing']['circuit'] == 'open'
+
+
+def test_all_backends_failing_raises_connection_error(openai_stub_factory):
+    """The pool raises once every backend serving the model has failed the request."""
+    failing = openai_stub_factory()
+    failing.fail = True
+    pool = SummarizerPoolAgent('test-model', [_openai_backend('failing', failing)])
+
+    with pytest.raises(ConnectionError):
+        pool.generate("system", "prompt")
+
+
+def test_context_rejection_is_not_a_backend_failure(openai_stub_factory, ollama_stub):
+    """A prompt too long for a backend's context moves on without counting against its circuit."""
+    ollama_stub.context_length = 4096
+    healthy = openai_stub_factory()
+    pool = SummarizerPoolAgent('gemma3', [
+        LLMBackend(name='small-context', type='ollama', base_url=ollama_stub.url),
+        _openai_backend('healthy', healthy),
+    ], failure_threshold=1)
+
+    summary = pool.organize_transcription("word " * 20000, video_info={}, lang='en')
+
+    assert summary.startswith("# Title")
+    assert [body for body in ollama_stub.paths('/api/generate') if body.get('prompt')] == []
+    stats = pool.get_stats()
+    assert stats['small-context']['failures'] == 0
+    assert stats['small-context']['circuit'] == 'closed'
+    assert stats['healthy']['successes'] == 1
+
+
+def test_max_concurrency_is_shared_between_processes(openai_stub_factory):
+    """Slots reserved by another process's pool count against the backend's max_concurrency."""
+    stub = openai_stub_factory()
+    # Same backend configured in two processes: slot files are locked on separate file descriptions
+    this_process = _openai_backend('shared', stub, max_concurrency=2)
+    other_process = _openai_backend('shared', stub, max_concurrency=2)
+
+    busy, other_slot = other_process.try_reserve_slot()
+    assert busy == 0 and other_slot is not None
+    busy, slot = this_process.try_reserve_slot()
+    assert busy == 1 and slot is not None
+    assert other_process.try_reserve_slot() == (2, None)
+
+    other_process.release_slot(other_slot)
+    this_process.release_slot(slot)
+    busy, slot = this_process.try_reserve_slot()
+    assert busy == 0
+    this_process.release_slot(slot)
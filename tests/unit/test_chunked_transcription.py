@@ -0,0 +1,49 @@
+import sys
+import types
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from infrastructure.outbound.transcriber.adapters.faster_whisper_audio_transcriber import (  # noqa: E402
+    FasterWhisperAudioTranscriber,
+)
+from infrastructure.outbound.transcriber.ports.audio_transcriber_port import SAMPLE_RATE  # noqa: E402
+
+
+class WordPerSecondModel:
+    """Fake model hearing one word per second of audio, and only words it receives whole."""
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def transcribe(self, samples):
+        segments = []
+        for word in np.unique(samples):
+            positions = np.flatnonzero(samples == word)
+            if len(positions) == SAMPLE_RATE:
+                segments.append(types.SimpleNamespace(start=positions[0] / SAMPLE_RATE,
+                                                      end=(positions[-1] + 1) / SAMPLE_RATE,
+                                                      text=f" w{int(word)}"))
+        return segments, None
+
+
+@pytest.fixture(autouse=True)
+def model(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'faster_whisper',
+                        types.SimpleNamespace(WhisperModel=WordPerSecondModel))
+
+
+def _audio(seconds: int):
+    """Audio whose samples hold the index of the second (the 'word') they belong to."""
+    return np.repeat(np.arange(seconds, dtype=np.float32), SAMPLE_RATE)
+
+
+@pytest.mark.parametrize('parallel_chunks', [2, 3, 7])
+def test_words_at_chunk_boundaries_are_kept_once(parallel_chunks):
+    """Cuts in the middle of a word neither lose nor duplicate it, and timestamps stay absolute."""
+    transcriber = FasterWhisperAudioTranscriber(parallel_chunks=parallel_chunks)
+
+    segments = transcriber.transcribe_samples(_audio(20), 'en')
+
+    assert [seg['text'] for seg in segments] == [f" w{i}" for i in range(20)]
+    assert [seg['start'] for seg in segments] == pytest.approx(list(range(20)))
@@ -0,0 +1,143 @@
+import os
+import sys
+import tempfile
+import types
+from http.cookiejar import MozillaCookieJar
+
+import pytest
+
+from infrastructure.outbound.video_downloader.adapters import cookie_jar_cache
+from infrastructure.outbound.video_downloader.adapters.cookie_jar_cache import resolve_cookie_file
+
+TTL = 3600
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cookie_jar_cache, 'time', types.SimpleNamespace(time=clock.time))
+    return clock
+
+
+@pytest.fixture
+def exports(monkeypatch):
+    """Browsers whose cookies were exported; set `fail` to make the browser unreadable."""
+    exported = []
+
+    def extract_cookies_from_browser(browser):
+        if exports_state.fail:
+            raise RuntimeError("cookie database is locked")
+        exported.append(browser)
+        return MozillaCookieJar()
+
+    exports_state = types.SimpleNamespace(fail=False)
+
+    cookies_module = types.SimpleNamespace(
+        extract_cookies_from_browser=extract_cookies_from_browser
+    )
+    monkeypatch.setitem(sys.modules, 'yt_dlp', types.SimpleNamespace(cookies=cookies_module))
+    monkeypatch.setitem(sys.modules, 'yt_dlp.cookies', cookies_module)
+    exports_state.browsers = exported
+    return exports_state
+
+
+@pytest.fixture(autouse=True)
+def cookie_env(tmp_path, monkeypatch):
+    """A fresh process: nothing resolved yet, cache and private copies under tmp_path."""
+    monkeypatch.setattr(cookie_jar_cache, '_resolved', None)
+    (tmp_path / 'private').mkdir()
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path / 'private'))
+    monkeypatch.setenv('YT_DLP_COOKIES_CACHE', str(tmp_path / 'cache' / 'cookies.txt'))
+    monkeypatch.setenv('YT_DLP_COOKIES_TTL', str(TTL))
+    monkeypatch.setenv('YT_DLP_COOKIES_BROWSER', 'firefox')
+    monkeypatch.delenv('YT_DLP_COOKIES_FILE', raising=False)
+
+
+def test_export_is_reused_within_the_ttl(clock, exports):
+    """The browser is exported once, and later calls in the TTL return the same private copy."""
+    path = resolve_cookie_file()
+    clock.now += TTL - 1
+
+    assert resolve_cookie_file() == path
+    assert exports.browsers == ['firefox']
+
+
+def test_other_processes_reuse_the_shared_export(clock, exports, monkeypatch):
+    """A process starting within the TTL copies the shared export instead of exporting again."""
+    first = resolve_cookie_file()
+    monkeypatch.setattr(cookie_jar_cache, '_resolved', None)
+    clock.now += 60
+
+    second = resolve_cookie_file()
+
+    assert second != first
+    assert exports.browsers == ['firefox']
+
+
+def test_expired_export_is_refreshed_and_the_old_copy_removed(clock, exports, tmp_path):
+    """After the TTL the browser is exported again and the previous private copy is deleted."""
+    first = resolve_cookie_file()
+    clock.now += TTL + 1
+
+    second = resolve_cookie_file()
+
+    assert exports.browsers == ['firefox', 'firefox']
+    assert second != first
+    assert not (tmp_path / 'private' / os.path.basename(first)).exists()
+    assert [p.name for p in (tmp_path / 'private').iterdir()] == [os.path.basename(second)]
+
+
+def test_cookie_file_takes_precedence_over_the_browser(clock, exports, tmp_path, monkeypatch):
+    """YT_DLP_COOKIES_FILE is copied as is and the browser is never read."""
+    cookie_file = tmp_path / 'exported.txt'
+    cookie_file.write_text("# Netscape HTTP Cookie File\n")
+    monkeypatch.setenv('YT_DLP_COOKIES_FILE', str(cookie_file))
+
+    path = resolve_cookie_file()
+
+    assert exports.browsers == []
+    with open(path) as f:
+        assert f.read() == "# Netscape HTTP Cookie File\n"
+
+
+def test_missing_cookie_file_raises(clock, exports, tmp_path, monkeypatch):
+    """A YT_DLP_COOKIES_FILE that does not exist is a configuration error."""
+    monkeypatch.setenv('YT_DLP_COOKIES_FILE', str(tmp_path / 'missing.txt'))
+
+    with pytest.raises(FileNotFoundError):
+        resolve_cookie_file()
+
+
+def test_failed_refresh_keeps_the_previous_export(clock, exports):
+    """When the browser cannot be read, an expired export is still better than no cookies."""
+    resolve_cookie_file()
+    clock.now += TTL + 1
+    exports.fail = True
+
+    path = resolve_cookie_file()
+
+    assert path is not None
+    with open(path) as f:
+        assert f.read().startswith("# Netscape HTTP Cookie File")
+
+
+def test_failed_first_export_continues_without_cookies(clock, exports):
+    """Without any previous export, an unreadable browser means no cookies rather than an error."""
+    exports.fail = True
+    assert resolve_cookie_file() is None
+
+
+def test_cookies_can_be_disabled(clock, exports, monkeypatch):
+    """YT_DLP_COOKIES_BROWSER=none continues without cookies."""
+    monkeypatch.setenv('YT_DLP_COOKIES_BROWSER', 'none')
+
+    assert resolve_cookie_file() is None
+    assert exports.browsers == []
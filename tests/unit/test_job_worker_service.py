@@ -0,0 +1,82 @@
+import pytest
+
+pytest.importorskip('openai')
+pytest.importorskip('yt_dlp')
+
+from application.transcription.services import job_worker_service  # noqa: E402
+from infrastructure.outbound.job_queue.adapters.sqlite_job_queue import SqliteJobQueue  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def outputs_dir(tmp_path, monkeypatch):
+    """Outputs go under the working directory and transcription returns a fixed text."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(job_worker_service, 'get_audio_transcriber', lambda *args, **kwargs: None)
+    monkeypatch.setattr(job_worker_service, 'transcribe_audio',
+                        lambda *args, **kwargs: ("transcribed text", None))
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return SqliteJobQueue(db_path=str(tmp_path / 'jobs.sqlite3'), retry_delay=0)
+
+
+def _claim_transcribe_job(queue, audio_path, **options) -> dict:
+    payload = {'url': 'https://example.com/v', 'video_id': 'v1', 'lang': 'en',
+               'transcript_model': 'faster-whisper',
+               'video_info': {'title': 'Video', 'duration': 60},
+               'audio_path': str(audio_path), **options}
+    queue.enqueue('transcribe', payload)
+    return queue.claim('worker-1', None, lease_seconds=60)
+
+
+def test_audio_is_removed_once_the_transcribe_job_is_committed(queue, tmp_path):
+    """The downloaded audio is deleted after the queue records the job as done."""
+    audio = tmp_path / 'audio.mp3'
+    audio.write_bytes(b'mp3')
+    job = _claim_transcribe_job(queue, audio)
+
+    job_worker_service._run_job(queue, job, 'worker-1', lease_seconds=60)
+
+    assert not audio.exists()
+    assert queue.claim('worker-1', None, lease_seconds=60)['stage'] == 'summarize'
+
+
+def test_audio_is_kept_when_the_lease_was_lost(queue, tmp_path, monkeypatch):
+    """A discarded result leaves the audio for the worker that reclaimed the job."""
+    audio = tmp_path / 'audio.mp3'
+    audio.write_bytes(b'mp3')
+    job = _claim_transcribe_job(queue, audio)
+    monkeypatch.setattr(queue, 'complete', lambda *args, **kwargs: False)
+
+    job_worker_service._run_job(queue, job, 'worker-1', lease_seconds=60)
+
+    assert audio.exists()
+
+
+def test_missing_audio_is_downloaded_again(queue, tmp_path):
+    """A transcribe job whose audio is gone queues a new download instead of failing."""
+    job = _claim_transcribe_job(queue, tmp_path / 'missing.mp3')
+
+    job_worker_service._run_job(queue, job, 'worker-1', lease_seconds=60)
+
+    download = queue.claim('worker-1', None, lease_seconds=60)
+    assert download['stage'] == 'download'
+    assert 'audio_path' not in download['payload']
+    assert queue.stats()['jobs']['transcribe'] == {'done': 1}
+
+
+def test_deadline_picks_the_transcription_model(queue, tmp_path, monkeypatch):
+    """A queued deadline is planned in the transcribe stage, like in the direct path."""
+    monkeypatch.delenv('PLANNER_MODELS', raising=False)
+    transcribers = []
+    monkeypatch.setattr(job_worker_service, 'get_audio_transcriber',
+                        lambda engine, **kwargs: transcribers.append(kwargs))
+    audio = tmp_path / 'audio.mp3'
+    audio.write_bytes(b'mp3')
+
+    job_worker_service._run_job(queue, _claim_transcribe_job(queue, audio, deadline=600),
+                                'worker-1', lease_seconds=60)
+
+    assert transcribers == [{'model_size': 'tiny', 'parallel_chunks': 1}]
+    assert (tmp_path / 'outputs' / 'metrics' / 'transcription_plans.jsonl').exists()
@@ -0,0 +1,67 @@
+import multiprocessing
+import os
+
+import pytest
+
+from infrastructure.outbound.metrics.adapters import local_metrics_store
+from infrastructure.outbound.metrics.adapters.local_metrics_store import LocalMetricsStore
+
+
+@pytest.fixture(autouse=True)
+def outputs_dir(tmp_path, monkeypatch):
+    """Metrics are written under outputs/ in the working directory."""
+    monkeypatch.chdir(tmp_path)
+
+
+def _increment_many(count: int, errors):
+    store = LocalMetricsStore()
+    for _ in range(count):
+        if not store.increment('shared', {'requests': 1}):
+            errors.put(1)
+
+
+def test_increment_adds_to_existing_counters():
+    """Counters accumulate across calls and new keys start at zero."""
+    store = LocalMetricsStore()
+    store.increment('test', {'a': 1})
+    assert store.increment('test', {'a': 2, 'b': 0.5}) == {'a': 3, 'b': 0.5}
+    assert store.read('test') == {'a': 3, 'b': 0.5}
+
+
+@pytest.mark.skipif(local_metrics_store.fcntl is None, reason="cross-process lock needs fcntl")
+def test_concurrent_increments_from_several_processes_are_not_lost():
+    """Processes incrementing the same counters never fail and never lose an update."""
+    context = multiprocessing.get_context('fork')
+    errors = context.Queue()
+    processes = [context.Process(target=_increment_many, args=(100, errors)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert all(process.exitcode == 0 for process in processes)
+    assert errors.empty()
+    assert LocalMetricsStore().read('shared') == {'requests': 400}
+    assert not [name for name in os.listdir('outputs/metrics') if name.endswith('.tmp')]
+
+
+def test_failed_write_does_not_raise(monkeypatch):
+    """A metrics write that fails is reported and ignored instead of failing the caller."""
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(local_metrics_store.os, 'replace', fail)
+    store = LocalMetricsStore()
+
+    assert store.increment('test', {'a': 1}) == {}
+    assert store.read('test') == {}
+    assert not [name for name in os.listdir('outputs/metrics') if name.endswith('.tmp')]
+
+
+def test_append_writes_json_lines():
+    """Records are appended to a JSON Lines log."""
+    store = LocalMetricsStore()
+    store.append('log', {'a': 1})
+    store.append('log', {'b': 'ü'})
+    with open('outputs/metrics/log.jsonl', encoding='utf-8') as f:
+        assert f.read().splitlines() == ['{"a": 1}', '{"b": "ü"}']
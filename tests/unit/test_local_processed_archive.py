@@ -0,0 +1,43 @@
+import pytest
+
+from infrastructure.outbound.archive.adapters.local_processed_archive import LocalProcessedArchive
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return LocalProcessedArchive()
+
+
+def test_unknown_video_needs_processing(archive):
+    """A video never seen before must be processed."""
+    assert archive.needs_processing('abc')
+
+
+def test_summarized_video_is_settled(archive):
+    """A summarized video is skipped by later syncs, also from a new archive instance."""
+    archive.mark('abc', 'summary', 'done', title='Video')
+    assert not archive.needs_processing('abc')
+    assert LocalProcessedArchive().get('abc')['title'] == 'Video'
+
+
+def test_failed_stage_needs_processing(archive):
+    """Any failed stage makes the video pending again."""
+    archive.mark('abc', 'summary', 'done')
+    archive.mark('abc', 'transcription', 'failed')
+    assert archive.needs_processing('abc')
+
+
+def test_skipped_video_is_rechecked_against_current_date_filter(archive):
+    """A video skipped as too old stays settled only while the current date filter excludes it."""
+    archive.mark('abc', 'metadata', 'skipped', upload_date='20240101')
+
+    assert not archive.needs_processing('abc', date_after='20240601')
+    assert archive.needs_processing('abc', date_after='20231201')
+    assert archive.needs_processing('abc')
+
+
+def test_skipped_video_without_upload_date_is_processed_again(archive):
+    """Skips recorded without an upload date cannot be re-checked, so they are processed again."""
+    archive.mark('abc', 'metadata', 'skipped')
+    assert archive.needs_processing('abc', date_after='20240601')
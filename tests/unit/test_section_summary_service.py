@@ -0,0 +1,136 @@
+import pytest
+
+from application.transcription.services.section_summary_service import (
+    ENRICH_PROMPT,
+    MAX_SECTION_CHARS,
+    split_sections,
+    summarize_by_sections,
+)
+from infrastructure.outbound.agents.ports.summarizer_agent import SummarizerAgent
+from infrastructure.outbound.file_storage.adapters.local_file_storage import LocalFileStorage
+
+TRANSCRIPT = '\n'.join(
+    f"Sentence {i} explains step {i % 13} of the deployment pipeline." for i in range(3000)
+)
+
+
+class RecordingAgent(SummarizerAgent):
+    """Summarizer returning one heading per prompt and counting the prompts it received."""
+    def __init__(self):
+        self.prompts: list[str] = []
+        self.system_prompts: list[str] = []
+
+    def organize_transcription(self, transcription: str, video_info: dict, lang: str,
+                               enrich_text: bool = False) -> str:
+        raise AssertionError("sectioned summaries only use generate")
+
+    def generate(self, system_prompt: str, prompt: str) -> str:
+        self.prompts.append(prompt)
+        self.system_prompts.append(system_prompt)
+        return f"## Part {len(self.prompts)}\ntext"
+
+
+@pytest.fixture(autouse=True)
+def outputs_dir(tmp_path, monkeypatch):
+    """The section cache and metrics are written under outputs/ in the working directory."""
+    monkeypatch.chdir(tmp_path)
+
+
+def _edit_line(transcript: str, index: int, text: str) -> str:
+    lines = transcript.splitlines()
+    lines[index] = text
+    return '\n'.join(lines)
+
+
+def test_sections_cover_the_whole_transcript():
+    """Sections are whole lines that join back into the transcript, within the size limit."""
+    sections = split_sections(TRANSCRIPT)
+
+    assert len(sections) > 5
+    assert '\n'.join(sections) == TRANSCRIPT
+    assert all(len(section) <= MAX_SECTION_CHARS + 100 for section in sections)
+
+
+def test_edit_only_changes_the_surrounding_sections():
+    """Editing one line in the middle leaves every other section byte-identical."""
+    original = split_sections(TRANSCRIPT)
+    edited = split_sections(_edit_line(TRANSCRIPT, 1500, "A corrected sentence."))
+
+    assert len(set(edited) - set(original)) <= 2
+
+
+def test_insertion_at_the_start_does_not_shift_later_sections():
+    """Boundaries depend on line content, not offsets: an insertion only changes nearby sections."""
+    original = split_sections(TRANSCRIPT)
+    edited = split_sections("An added introduction line.\n" + TRANSCRIPT)
+
+    assert len(set(edited) - set(original)) <= 2
+    assert len(set(original) & set(edited)) >= len(original) - 2
+
+
+def test_single_line_transcript_is_split_by_sentences():
+    """Engines returning the whole transcript as one line are split on sentence ends."""
+    sections = split_sections(TRANSCRIPT.replace('\n', ' '))
+
+    assert len(sections) > 5
+    assert all(len(section) <= MAX_SECTION_CHARS + 100 for section in sections)
+
+
+def test_resummarizing_an_edited_transcript_reuses_unchanged_sections():
+    """Only the edited sections, the summary and the conclusion are sent to the LLM again."""
+    video_info = {'title': 'Pipeline', 'webpage_url': 'https://example.com'}
+    _, first = summarize_by_sections(RecordingAgent(), TRANSCRIPT, 'model', video_info, 'en')
+    assert first['reused'] == 0
+
+    agent = RecordingAgent()
+    edited = _edit_line(TRANSCRIPT, 1500, "A corrected sentence.")
+    markdown, second = summarize_by_sections(agent, edited, 'model', video_info, 'en')
+
+    assert markdown.startswith("# Pipeline")
+    assert second['regenerated'] == len(agent.prompts) <= 4
+    assert second['reused'] == second['sections'] + 2 - second['regenerated']
+
+
+def test_sections_are_not_reused_for_another_title():
+    """The title is part of every prompt, so identical text under another title is regenerated."""
+    summarize_by_sections(RecordingAgent(), TRANSCRIPT, 'model', {'title': 'Pipeline'}, 'en')
+
+    agent = RecordingAgent()
+    _, report = summarize_by_sections(agent, TRANSCRIPT, 'model', {'title': 'Other course'}, 'en')
+
+    assert report['reused'] == 0
+    assert report['regenerated'] == report['sections'] + 2
+
+
+def test_enrich_text_is_sent_and_cached_separately():
+    """enrich_text extends the system prompt and does not reuse sections generated without it."""
+    video_info = {'title': 'Pipeline'}
+    summarize_by_sections(RecordingAgent(), TRANSCRIPT, 'model', video_info, 'en')
+
+    agent = RecordingAgent()
+    _, report = summarize_by_sections(agent, TRANSCRIPT, 'model', video_info, 'en',
+                                      enrich_text=True)
+
+    assert report['reused'] == 0
+    assert all(prompt.endswith(ENRICH_PROMPT) for prompt in agent.system_prompts)
+
+
+def test_sectioned_summary_is_rebuilt_even_when_a_summary_exists(monkeypatch):
+    """With sectioned=True an existing summary file does not short-circuit the section cache."""
+    pytest.importorskip('openai')
+    from application.transcription.services import llm_markdown_service
+
+    agent = RecordingAgent()
+    monkeypatch.setattr(llm_markdown_service, '_get_summarizer_agent', lambda model: agent)
+    path = LocalFileStorage().save(data="# Stale summary\n", file_path="summaries/Pipeline.md")
+
+    llm_markdown_service.transcription_to_markdown(TRANSCRIPT, 'model', {'title': 'Pipeline'})
+    assert agent.prompts == []
+
+    llm_markdown_service.transcription_to_markdown(
+        TRANSCRIPT, 'model', {'title': 'Pipeline'}, sectioned=True
+    )
+
+    assert len(agent.prompts) > 0
+    with open(path, encoding='utf-8') as f:
+        assert f.read().startswith("# Pipeline")
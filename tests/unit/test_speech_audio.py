@@ -0,0 +1,51 @@
+import pytest
+
+from infrastructure.outbound.audio_preprocessor.ports.audio_preprocessor_port import SpeechAudio
+
+SAMPLE_RATE = 10
+
+# Speech at 5-15s and 40-50s of a 60s recording, compacted to 0-10s and 10-20s
+CHUNKS = [(0.0, 5.0, 10.0), (10.0, 40.0, 10.0)]
+
+
+def _speech(chunks=CHUNKS, speech_seconds: float = 20, original_seconds: float = 60) -> SpeechAudio:
+    # Only the number of samples matters for the offset map
+    samples = [0.0] * int(speech_seconds * SAMPLE_RATE)
+    return SpeechAudio(samples, SAMPLE_RATE, original_seconds, chunks)
+
+
+@pytest.mark.parametrize('seconds, original', [
+    (0.0, 5.0),
+    (3.5, 8.5),
+    (9.9, 14.9),
+    (10.0, 40.0),
+    (12.5, 42.5),
+    (20.0, 50.0),
+])
+def test_timestamps_map_to_the_original_recording(seconds, original):
+    """Timestamps inside a kept chunk are shifted by that chunk's offset in the original."""
+    assert _speech().to_original(seconds) == pytest.approx(original)
+
+
+def test_timestamps_past_the_last_chunk_are_clamped_to_its_end():
+    """A segment ending after the compacted audio never maps past the last kept region."""
+    assert _speech().to_original(25.0) == pytest.approx(50.0)
+
+
+def test_timestamps_before_the_first_chunk_are_clamped_to_its_start():
+    """Compacted audio starting after 0 maps earlier timestamps to the first kept region."""
+    speech = _speech(chunks=[(1.0, 30.0, 5.0)], speech_seconds=6)
+    assert speech.to_original(0.5) == pytest.approx(30.0)
+
+
+def test_without_chunks_timestamps_are_unchanged():
+    """Audio that was not trimmed keeps its own timeline."""
+    assert _speech(chunks=[], speech_seconds=60).to_original(42.0) == 42.0
+
+
+def test_removed_seconds():
+    """The removed duration is the original minus the speech kept, never negative."""
+    speech = _speech()
+    assert speech.speech_seconds == pytest.approx(20.0)
+    assert speech.removed_seconds == pytest.approx(40.0)
+    assert _speech(speech_seconds=60, original_seconds=59).removed_seconds == 0.0
@@ -0,0 +1,82 @@
+import time
+
+import pytest
+
+from infrastructure.outbound.job_queue.adapters.sqlite_job_queue import SqliteJobQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return SqliteJobQueue(db_path=str(tmp_path / 'jobs.sqlite3'), max_attempts=2, retry_delay=0)
+
+
+def test_claim_leases_each_job_to_one_worker(queue):
+    """A leased job is not claimable by another worker until its lease expires."""
+    job_id = queue.enqueue('metadata', {'url': 'u'})
+
+    job = queue.claim('worker-1', None, lease_seconds=60)
+    assert job == {'id': job_id, 'stage': 'metadata', 'payload': {'url': 'u'}, 'attempts': 1}
+    assert queue.claim('worker-2', None, lease_seconds=60) is None
+
+
+def test_claim_filters_by_stage(queue):
+    """Workers only claim jobs of the stages they handle."""
+    queue.enqueue('transcribe', {})
+    assert queue.claim('worker-1', ['summarize'], lease_seconds=60) is None
+    job = queue.claim('worker-1', ['transcribe', 'summarize'], lease_seconds=60)
+    assert job['stage'] == 'transcribe'
+
+
+def test_dedupe_key_skips_pending_jobs(queue):
+    """A job with the same dedupe key is not enqueued twice while pending."""
+    assert queue.enqueue('metadata', {}, dedupe_key='video') is not None
+    assert queue.enqueue('metadata', {}, dedupe_key='video') is None
+
+
+def test_expired_lease_is_reclaimed_and_old_owner_cannot_complete(queue):
+    """After a lease expires another worker takes the job; the first one's result is discarded."""
+    job_id = queue.enqueue('transcribe', {})
+    queue.claim('worker-1', None, lease_seconds=0.01)
+    time.sleep(0.05)
+
+    job = queue.claim('worker-2', None, lease_seconds=60)
+    assert job['id'] == job_id and job['attempts'] == 2
+    assert not queue.complete(job_id, 'worker-1')
+    assert not queue.heartbeat(job_id, 'worker-1', lease_seconds=60)
+    assert queue.complete(job_id, 'worker-2')
+
+
+def test_expired_lease_on_last_attempt_fails_the_job(queue):
+    """A job whose last attempt's worker died is marked failed instead of retried forever."""
+    queue.enqueue('transcribe', {})
+    for worker_id in ('worker-1', 'worker-2'):
+        assert queue.claim(worker_id, None, lease_seconds=0.01)
+        time.sleep(0.05)
+
+    assert queue.claim('worker-3', None, lease_seconds=60) is None
+    assert queue.stats()['jobs']['transcribe'] == {'failed': 1}
+
+
+def test_complete_enqueues_next_jobs(queue):
+    """Completing a job enqueues its follow-ups in the same transaction."""
+    job_id = queue.enqueue('metadata', {'url': 'u'})
+    queue.claim('worker-1', None, lease_seconds=60)
+
+    next_jobs = [('download', {'url': 'u'}, 'download:u')]
+    assert queue.complete(job_id, 'worker-1', next_jobs, duration=2)
+
+    assert queue.claim('worker-1', None, lease_seconds=60)['stage'] == 'download'
+    stats = queue.stats()
+    assert stats['jobs']['metadata'] == {'done': 1}
+    assert stats['workers']['worker-1']['completed'] == 1
+
+
+def test_failed_job_is_retried_until_out_of_attempts(queue):
+    """Failures put the job back in the queue until max_attempts, then mark it failed."""
+    job_id = queue.enqueue('summarize', {})
+    for _ in range(2):
+        assert queue.claim('worker-1', None, lease_seconds=60)['id'] == job_id
+        assert queue.fail(job_id, 'worker-1', 'boom')
+
+    assert queue.claim('worker-1', None, lease_seconds=60) is None
+    assert queue.stats()['jobs']['summarize'] == {'failed': 1}
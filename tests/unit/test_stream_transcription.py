@@ -0,0 +1,80 @@
+import sys
+import types
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from infrastructure.outbound.transcriber.adapters.faster_whisper_audio_transcriber import (  # noqa: E402
+    FasterWhisperAudioTranscriber,
+)
+from infrastructure.outbound.transcriber.adapters.openai_whisper_audio_transcriber import (  # noqa: E402
+    OpenAiWhisperAudioTranscriberAdapter,
+)
+from infrastructure.outbound.transcriber.ports.audio_transcriber_port import SAMPLE_RATE  # noqa: E402
+
+
+class FakeModel:
+    """Whisper model answering every window with two segments of 150 characters."""
+    def __init__(self):
+        self.prompts: list[str | None] = []
+        self.windows = 0
+
+    def segments(self, samples, initial_prompt=None) -> list[dict]:
+        assert samples.dtype == np.float32
+        self.prompts.append(initial_prompt)
+        self.windows += 1
+        letter = chr(ord('a') + self.windows - 1)
+        duration = len(samples) / SAMPLE_RATE
+        return [{'start': 0.0, 'end': duration / 2, 'text': letter * 150},
+                {'start': duration / 2, 'end': duration, 'text': letter.upper() * 150}]
+
+
+@pytest.fixture
+def model(monkeypatch):
+    fake = FakeModel()
+
+    class WhisperModel:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def transcribe(self, samples, initial_prompt=None):
+            segments = [types.SimpleNamespace(**seg)
+                        for seg in fake.segments(samples, initial_prompt)]
+            return segments, None
+
+    def load_model(*args, **kwargs):
+        return types.SimpleNamespace(transcribe=lambda samples, initial_prompt=None: {
+            'segments': fake.segments(samples, initial_prompt)
+        })
+
+    monkeypatch.setitem(sys.modules, 'faster_whisper',
+                        types.SimpleNamespace(WhisperModel=WhisperModel))
+    monkeypatch.setitem(sys.modules, 'whisper',
+                        types.SimpleNamespace(load_model=load_model))
+    return fake
+
+
+def _windows(count: int, seconds: float = 30.0):
+    pcm = np.zeros(int(seconds * SAMPLE_RATE), dtype=np.int16).tobytes()
+    return [(index * seconds, pcm) for index in range(count)]
+
+
+@pytest.mark.parametrize('transcriber', [FasterWhisperAudioTranscriber(),
+                                         OpenAiWhisperAudioTranscriberAdapter()])
+def test_stream_segments_are_placed_on_the_original_timeline(model, transcriber):
+    """Segment timestamps are shifted by the offset of the window they were decoded from."""
+    segments = list(transcriber.transcribe_stream(_windows(3), 'en'))
+
+    assert [(seg['start'], seg['end']) for seg in segments] == [
+        (0.0, 15.0), (15.0, 30.0), (30.0, 45.0), (45.0, 60.0), (60.0, 75.0), (75.0, 90.0),
+    ]
+
+
+@pytest.mark.parametrize('transcriber', [FasterWhisperAudioTranscriber(),
+                                         OpenAiWhisperAudioTranscriberAdapter()])
+def test_each_window_is_prompted_with_the_tail_of_the_previous_text(model, transcriber):
+    """The prompt is the last 200 characters of the text so far, however long the stream."""
+    list(transcriber.transcribe_stream(_windows(3), 'en'))
+
+    assert model.prompts == [None, 'a' * 50 + 'A' * 150, 'b' * 50 + 'B' * 150]
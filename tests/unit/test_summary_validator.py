@@ -0,0 +1,152 @@
+import pytest
+
+from infrastructure.outbound.agents.adapters.summary_validator import (
+    complete_summary,
+    validate_summary,
+)
+
+VALID_SUMMARY = """# Course title
+
+## 📝 Summary
+Overview of the course.
+
+## 📑 Index
+- Topic
+
+## 1. Topic
+Details.
+
+## Conclusion
+Wrap-up.
+"""
+
+
+@pytest.fixture(autouse=True)
+def outputs_dir(tmp_path, monkeypatch):
+    """Metrics are written under outputs/ in the working directory."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv('SUMMARY_CONTINUATION_MAX_ROUNDS', raising=False)
+    monkeypatch.delenv('SUMMARY_CONTINUATION_MAX_TOKENS', raising=False)
+    monkeypatch.delenv('SUMMARY_CONTINUATION_ROUND_TOKENS', raising=False)
+
+
+def test_valid_summary():
+    """A summary with title, required sections and enough lines is valid."""
+    validation = validate_summary(VALID_SUMMARY, min_lines=10)
+    assert validation['missing_sections'] == []
+    assert validation['is_valid']
+
+
+def test_short_summary_is_invalid():
+    """A summary below the minimum line count is invalid even with every section."""
+    validation = validate_summary(VALID_SUMMARY, min_lines=100)
+    assert validation['line_count'] < 100
+    assert not validation['is_valid']
+
+
+@pytest.mark.parametrize('heading, section', [
+    ('## Database indexes', 'Index'),
+    ('## Indexes in PostgreSQL', 'Index'),
+    ('## Summarizing data', 'Summary'),
+    ('## Inconclusive results', 'Conclusion'),
+])
+def test_topic_headings_do_not_count_as_sections(heading, section):
+    """Headings that only contain a section keyword or a longer word are topics, not sections."""
+    original = {'Index': '## 📑 Index', 'Summary': '## 📝 Summary', 'Conclusion': '## Conclusion'}
+    markdown = VALID_SUMMARY.replace(original[section], heading)
+    assert section in validate_summary(markdown, min_lines=1)['missing_sections']
+
+
+@pytest.mark.parametrize('heading, section', [
+    ('## II. Conclusión', 'Conclusion'),
+    ('## Conclusions', 'Conclusion'),
+    ('### Resumen:', 'Summary'),
+    ('## Índice Detallado', 'Index'),
+    ('## 3) Table of Contents', 'Index'),
+    ('## Conclusion and next steps', 'Conclusion'),
+    ('## Conclusions & Key Takeaways', 'Conclusion'),
+    ('## 📝 Summary of the course', 'Summary'),
+])
+def test_localized_and_numbered_headings_count_as_sections(heading, section):
+    """Section names are matched as leading words after emoji and numbering, in many languages."""
+    markdown = f"# Title\n\n{heading}\ntext\n"
+    assert section not in validate_summary(markdown, min_lines=1)['missing_sections']
+
+
+def test_missing_title():
+    """A document without a level-1 heading misses its title."""
+    markdown = VALID_SUMMARY.replace('# Course title', '')
+    assert 'Title' in validate_summary(markdown, min_lines=1)['missing_sections']
+
+
+def test_complete_summary_inserts_missing_head_sections_after_title():
+    """Missing Summary/Index sections are requested and inserted right after the title."""
+    draft = "# Title\n\n## Topic\ntext\n\n## Conclusion\nend\n"
+    requests = []
+
+    def continue_fn(existing, prompt, max_tokens):
+        requests.append(max_tokens)
+        return "## Summary\nsummary\n\n## Index\n- Topic", 100
+
+    markdown = complete_summary(draft, min_lines=1, lang='en', video_info={},
+                                continue_fn=continue_fn)
+
+    assert markdown.index('## Summary') < markdown.index('## Topic')
+    assert validate_summary(markdown, 1)['is_valid']
+    assert len(requests) == 1
+
+
+def test_complete_summary_does_not_request_sections_with_longer_headings():
+    """A conclusion titled 'Conclusion and next steps' sends no round and is not duplicated."""
+    draft = VALID_SUMMARY.replace('## Conclusion', '## Conclusion and next steps')
+
+    requests = []
+
+    def continue_fn(existing, prompt, max_tokens):
+        requests.append(prompt)
+        return "## Conclusion\nagain", 10
+
+    markdown = complete_summary(draft, min_lines=1, lang='en', video_info={},
+                                continue_fn=continue_fn)
+    assert requests == []
+    assert markdown == draft
+
+
+def test_complete_summary_keeps_draft_when_continuation_fails():
+    """A failed continuation request returns the draft instead of raising."""
+    draft = "# Title\n\n## Summary\ns\n\n## Index\n- a\n"
+
+    def continue_fn(existing, prompt, max_tokens):
+        raise TimeoutError("request timed out")
+
+    markdown = complete_summary(draft, min_lines=1, lang='en', video_info={},
+                                continue_fn=continue_fn)
+    assert markdown == draft
+
+
+def test_complete_summary_caps_each_round_output(monkeypatch):
+    """Each round asks for at most SUMMARY_CONTINUATION_ROUND_TOKENS, not the whole budget."""
+    monkeypatch.setenv('SUMMARY_CONTINUATION_ROUND_TOKENS', '2000')
+    requests = []
+
+    def continue_fn(existing, prompt, max_tokens):
+        requests.append(max_tokens)
+        return "more\n" * 5, 3000
+
+    complete_summary(VALID_SUMMARY, min_lines=100, lang='en', video_info={},
+                     continue_fn=continue_fn, tokens_used=1000)
+    assert requests == [2000, 2000]
+
+
+def test_complete_summary_stops_when_prompt_exceeds_budget(monkeypatch):
+    """No round is sent when its estimated prompt alone would exceed the remaining budget."""
+    monkeypatch.setenv('SUMMARY_CONTINUATION_MAX_TOKENS', '50000')
+    requests = []
+
+    def continue_fn(existing, prompt, max_tokens):
+        requests.append(max_tokens)
+        return "more\n", 10
+
+    complete_summary(VALID_SUMMARY, min_lines=100, lang='en', video_info={},
+                     continue_fn=continue_fn, tokens_used=60000)
+    assert requests == []
@@ -0,0 +1,124 @@
+import json
+
+import pytest
+
+from application.transcription.services.transcription_planner import (
+    CAPTIONS_SECONDS,
+    DEFAULT_RTF,
+    plan_transcription,
+    record_measurement,
+    strategy_key,
+)
+
+
+@pytest.fixture(autouse=True)
+def outputs_dir(tmp_path, monkeypatch):
+    """Measured real-time factors are read from outputs/ in the working directory."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv('PLANNER_MODELS', raising=False)
+
+
+def _candidate(plan: dict, model_size: str, parallel_chunks: int = 1) -> dict:
+    return next(c for c in plan['candidates']
+                if c['model_size'] == model_size and c['parallel_chunks'] == parallel_chunks)
+
+
+def test_default_real_time_factors_are_used_without_metrics():
+    """Without measured runs, predictions are download plus decoding at the default RTFs."""
+    plan = plan_transcription(600, 10000, 'tiktok', cores=1)
+
+    for size in ('tiny', 'base', 'small'):
+        expected = 600 * (DEFAULT_RTF['download'] + DEFAULT_RTF[f"faster-whisper:{size}"])
+        assert _candidate(plan, size)['predicted_seconds'] == pytest.approx(expected, abs=0.1)
+
+
+def test_measured_real_time_factor_replaces_the_default():
+    """A measured run of a strategy on this machine drives its next predictions."""
+    record_measurement('faster-whisper:tiny', audio_seconds=100, elapsed_seconds=50)
+
+    plan = plan_transcription(600, 10000, 'tiktok', cores=1)
+
+    expected = 600 * (DEFAULT_RTF['download'] + 0.5)
+    assert _candidate(plan, 'tiny')['predicted_seconds'] == pytest.approx(expected, abs=0.1)
+
+
+def test_captions_are_chosen_first_on_youtube():
+    """Captions are the cheapest strategy whenever the deadline leaves time to fetch them."""
+    plan = plan_transcription(3600, 60, 'youtube', cores=1)
+
+    assert plan['strategy'] == 'captions'
+    assert plan['predicted_seconds'] == CAPTIONS_SECONDS
+    assert plan['meets_deadline']
+
+
+def test_exclude_captions_plans_a_model():
+    """Without captions (or on other platforms) the plan transcribes the audio."""
+    assert plan_transcription(600, 100, 'youtube', cores=1,
+                              exclude_captions=True)['strategy'] == 'model'
+    assert all(c['strategy'] != 'captions'
+               for c in plan_transcription(600, 100, 'tiktok', cores=1)['candidates'])
+
+
+def test_smallest_model_meeting_the_deadline_is_chosen():
+    """Candidates are tried from the cheapest: the first one predicted within the deadline wins."""
+    plan = plan_transcription(600, 100, 'tiktok', cores=1)
+
+    assert (plan['strategy'], plan['model_size']) == ('model', 'tiny')
+    assert plan['meets_deadline']
+
+
+def test_chunked_decoding_is_chosen_when_single_models_are_too_slow():
+    """With spare cores, chunked decoding meets deadlines that no single-process model meets."""
+    # tiny: 3600 * (0.02 + 0.04) = 216s; chunked tiny on 4 chunks: 3600 * (0.02 + 0.04 / 2.8)
+    plan = plan_transcription(3600, 200, 'tiktok', cores=8)
+
+    assert (plan['strategy'], plan['model_size'], plan['parallel_chunks']) == ('chunked', 'tiny', 4)
+    assert strategy_key(plan) == 'faster-whisper:tiny:x4'
+    assert plan['meets_deadline']
+
+
+def test_fastest_strategy_is_used_when_nothing_meets_the_deadline():
+    """An impossible deadline falls back to the fastest prediction and reports the miss."""
+    plan = plan_transcription(3600, 10, 'tiktok', cores=8)
+
+    assert not plan['meets_deadline']
+    assert plan['predicted_seconds'] == min(c['predicted_seconds'] for c in plan['candidates'])
+
+
+def test_openai_whisper_is_never_chunked():
+    """Only faster-whisper shares a model between concurrent chunks."""
+    plan = plan_transcription(3600, 10, 'tiktok', engine='openai-whisper', cores=8)
+
+    assert {c['parallel_chunks'] for c in plan['candidates']} == {1}
+    assert strategy_key(plan) == 'openai-whisper:tiny'
+
+
+def test_missing_captions_are_replanned_without_them(monkeypatch):
+    """When the planned captions do not exist, the remaining time is planned for a model."""
+    pytest.importorskip('yt_dlp')
+    from application.transcription.services import transcription_service
+
+    class Downloader:
+        def download_subtitles(self, url, lang):
+            return None
+
+        def download_audio(self, url):
+            return 'audio.mp3'
+
+    transcribers = []
+    monkeypatch.setattr(transcription_service, 'VideoDownloader', Downloader)
+    monkeypatch.setattr(transcription_service, 'get_audio_transcriber',
+                        lambda engine, **kwargs: transcribers.append(kwargs))
+    monkeypatch.setattr(transcription_service, 'transcribe_audio',
+                        lambda *args, **kwargs: ("text", None))
+
+    text = transcription_service._transcribe_with_plan(
+        'https://youtu.be/v', 'Video', 'faster-whisper', 'en', 'youtube', 600, 100
+    )
+
+    assert text == "text"
+    assert transcribers == [{'model_size': 'tiny', 'parallel_chunks': 1}]
+    with open('outputs/metrics/transcription_plans.jsonl', encoding='utf-8') as f:
+        plan = json.loads(f.read().splitlines()[-1])
+    assert plan['strategy'] == 'model'
+    assert plan['deadline_seconds'] == 100
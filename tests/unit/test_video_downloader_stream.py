@@ -0,0 +1,104 @@
+import subprocess
+import sys
+import time
+
+import pytest
+
+pytest.importorskip('yt_dlp')
+
+from infrastructure.outbound.video_downloader.adapters import video_downloader  # noqa: E402
+from infrastructure.outbound.video_downloader.adapters.video_downloader import (  # noqa: E402
+    VideoDownloader,
+)
+
+# 10 ms windows: 160 samples of 2 bytes
+WINDOW_SECONDS = 0.01
+WINDOW_BYTES = 320
+
+# Writes the requested bytes (0..250 repeated) to stdout in ~64 KiB chunks, recording progress,
+# then exits
+PRODUCER = """
+import sys
+total, exit_code, progress = int(sys.argv[1]), int(sys.argv[2]), sys.argv[3]
+pattern = bytes(range(251)) * 261
+written = 0
+while written < total:
+    chunk = pattern[:total - written]
+    sys.stdout.buffer.write(chunk)
+    sys.stdout.buffer.flush()
+    written += len(chunk)
+    with open(progress, 'w') as f:
+        f.write(str(written))
+sys.exit(exit_code)
+"""
+
+# Copies stdin to stdout, then exits
+DECODER = """
+import sys
+exit_code = int(sys.argv[1])
+while chunk := sys.stdin.buffer.read(65536):
+    sys.stdout.buffer.write(chunk)
+sys.exit(exit_code)
+"""
+
+
+def _expected_pcm(total: int) -> bytes:
+    return bytes(i % 251 for i in range(total))
+
+
+@pytest.fixture
+def fake_pipeline(tmp_path, monkeypatch):
+    """Replace yt-dlp and ffmpeg with small scripts writing a known PCM stream."""
+    settings = {'bytes': 0, 'ytdlp_exit': 0, 'ffmpeg_exit': 0,
+                'progress': str(tmp_path / 'progress')}
+    real_popen = subprocess.Popen
+
+    def popen(args, **kwargs):
+        if args[0] == 'ffmpeg':
+            args = [sys.executable, '-c', DECODER, str(settings['ffmpeg_exit'])]
+        else:
+            args = [sys.executable, '-c', PRODUCER, str(settings['bytes']),
+                    str(settings['ytdlp_exit']), settings['progress']]
+        return real_popen(args, **kwargs)
+
+    monkeypatch.setattr(video_downloader.subprocess, 'Popen', popen)
+    monkeypatch.setattr(VideoDownloader, '_get_cli_args', lambda self: [])
+    return settings
+
+
+def test_stream_is_cut_into_windows_with_offsets(fake_pipeline):
+    """Full windows carry consecutive offsets and the remainder is sent as a last short window."""
+    fake_pipeline['bytes'] = WINDOW_BYTES * 2 + 100
+
+    windows = list(VideoDownloader().stream_audio('url', window_seconds=WINDOW_SECONDS))
+
+    assert [offset for offset, _ in windows] == pytest.approx([0.0, 0.01, 0.02])
+    assert [len(pcm) for _, pcm in windows] == [WINDOW_BYTES, WINDOW_BYTES, 100]
+    assert b''.join(pcm for _, pcm in windows) == _expected_pcm(fake_pipeline['bytes'])
+
+
+@pytest.mark.parametrize('failing', ['ytdlp_exit', 'ffmpeg_exit'])
+def test_failed_download_or_decoding_raises(fake_pipeline, failing):
+    """A non-zero yt-dlp or ffmpeg exit fails the stream instead of ending it early."""
+    fake_pipeline['bytes'] = WINDOW_BYTES * 3
+    fake_pipeline[failing] = 1
+
+    with pytest.raises(Exception, match="exit code 1"):
+        list(VideoDownloader().stream_audio('url', window_seconds=WINDOW_SECONDS))
+
+
+def test_slow_consumer_stalls_the_download(fake_pipeline):
+    """Only a bounded number of windows is buffered: the download waits for the consumer."""
+    fake_pipeline['bytes'] = 20 * 1024 * 1024
+    stream = VideoDownloader().stream_audio('url', window_seconds=1.0, max_buffered_windows=2)
+
+    offset, _ = next(stream)
+    time.sleep(1)
+    with open(fake_pipeline['progress']) as f:
+        written = int(f.read())
+    # Buffered windows, the reader's chunk and the pipe buffers, far from the whole stream
+    assert offset == 0.0
+    assert written < 2 * 1024 * 1024
+
+    # Stopping early kills the pipeline without reporting its exit codes as a failure
+    stream.close()